@@ -0,0 +1,66 @@
+"""
+Parsing messy names carrying titles and suffixes: `Parser.build()` detecting
+them from its lookup tables, against guessing an explicit `NameIndex` per name
+and re-parsing with it, as needed before.
+
+Usage:
+    python benchmarks/bench_affixes.py [count]
+"""
+
+import random
+import sys
+import time
+
+from bench_parse_many import FIRST_NAMES, LAST_NAMES, MIDDLE_NAMES
+
+from namefully import Namefully, NameIndex, Parser
+
+PREFIXES = ['Dr.', 'Mr', 'Mrs.', 'Prof.', 'Ms']
+SUFFIXES = ['Jr.', 'Sr', 'III', 'PhD', 'MD']
+
+
+def corpus(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        parts = [rng.choice(PREFIXES)] if rng.random() < 0.4 else []
+        parts.append(rng.choice(FIRST_NAMES))
+        parts.extend(rng.sample(MIDDLE_NAMES, rng.choice((0, 0, 1, 2))))
+        parts.append(rng.choice(LAST_NAMES))
+        if rng.random() < 0.3:
+            parts.append(rng.choice(SUFFIXES))
+        names.append(' '.join(parts))
+    return names
+
+
+def with_index(text: str) -> Namefully:
+    # The fallback: tell the roles apart by hand, then parse again with an index.
+    parts = text.split()
+    prefix = 1 if parts[0] in PREFIXES else 0
+    suffix = 1 if parts[-1] in SUFFIXES else 0
+    last = len(parts) - 1 - suffix
+    middle = prefix + 1 if last - prefix > 1 else -1
+    index = NameIndex.only(
+        first_name=prefix, last_name=last, middle_name=middle, prefix=prefix - 1, suffix=last + 1 if suffix else -1
+    )
+    return Namefully(Parser.build(text, index))
+
+
+def run(label, fn, count):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<32} {count / elapsed:>12,.0f} names/s  ({elapsed:.3f}s)')
+    return result
+
+
+def main(count: int = 100_000) -> None:
+    names = corpus(count)
+    guessed = run('NameIndex per name', lambda: [with_index(name) for name in names], count)
+    built = run('Parser.build + parse_many', lambda: list(Namefully.parse_many(map(Parser.build, names))), count)
+    agree = sum(a.prefix == b.prefix and a.suffix == b.suffix and a.last == b.last for a, b in zip(guessed, built))
+    print(f'same roles: {agree / count:.1%}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,63 @@
+"""
+Event loop latency while a large batch of names is parsed.
+
+A probe task sleeps for 1ms in a loop and records how late it wakes up, as a
+co-located request would experience it, while the batch is being processed.
+
+Usage:
+    python benchmarks/bench_aio.py [count]
+"""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_parse_many import corpus
+
+from namefully import Namefully, aparse_many
+
+
+async def blocking(raw):
+    return len(list(Namefully.parse_many(raw)))
+
+
+async def cooperative(raw, **kwargs):
+    count = 0
+    async for _ in aparse_many(raw, **kwargs):
+        count += 1
+    return count
+
+
+async def measure(label, batch):
+    delays, done = [], False
+
+    async def probe():
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            delays.append(time.perf_counter() - start - 0.001)
+
+    task = asyncio.ensure_future(probe())
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await batch
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+
+    delays.sort()
+    p99 = delays[int(len(delays) * 0.99) - 1] if len(delays) > 1 else delays[-1]
+    print(f'{label:<32} batch {elapsed:.3f}s  probe p99 {p99 * 1000:8.2f}ms  max {delays[-1] * 1000:8.2f}ms')
+
+
+async def main(count: int) -> None:
+    raw = corpus(count)
+    await measure('parse_many (blocking)', blocking(raw))
+    await measure('aparse_many (inline)', cooperative(raw))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        await measure('aparse_many (thread pool)', cooperative(raw, chunksize=1024, executor=executor))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
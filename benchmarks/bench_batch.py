@@ -0,0 +1,59 @@
+"""
+Batch (column-wise) formatting against per-name calls.
+
+Every repeat starts from freshly parsed names, so the per-name memos do not
+carry over from one run to the next.
+
+Usage:
+    python benchmarks/bench_batch.py [count] [--numpy]
+"""
+
+import sys
+import time
+
+from bench_parse_many import corpus
+
+from namefully import Namefully, NameTable, format_many, initials_many, upper_many
+
+PATTERNS = ['L, f m', 'f $l.', 'b', 'o']
+
+
+def run(label, setup, fn, repeat: int = 3):
+    elapsed, count = float('inf'), 0
+    for _ in range(repeat):
+        data = setup()
+        start = time.perf_counter()
+        count = len(fn(data))
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f'{label:<32} {count / elapsed:>12,.0f} names/s  ({elapsed:.3f}s)')
+
+
+def main(count: int = 100_000, backend: str = 'python') -> None:
+    raw = corpus(count)
+
+    def names():
+        return list(Namefully.parse_many(raw))
+
+    table = NameTable.from_names(raw)
+
+    for pattern in PATTERNS:
+        print(f'pattern {pattern!r}')
+        run('  Namefully.format', names, lambda data, pattern=pattern: [name.format(pattern) for name in data])
+        run('  format_many (objects)', names, lambda data, pattern=pattern: format_many(data, pattern))
+        run(
+            '  format_many (NameTable)',
+            lambda: table,
+            lambda data, pattern=pattern: format_many(data, pattern, backend=backend),
+        )
+
+    print('upper()')
+    run('  Namefully.upper', names, lambda data: [name.upper() for name in data])
+    run('  upper_many (NameTable)', lambda: table, lambda data: upper_many(data, backend=backend))
+    print('initials()')
+    run('  Namefully.initials', names, lambda data: [name.initials() for name in data])
+    run('  initials_many (NameTable)', lambda: table, lambda data: initials_many(data, backend=backend))
+
+
+if __name__ == '__main__':
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    main(int(args[0]) if args else 100_000, 'numpy' if '--numpy' in sys.argv else 'python')
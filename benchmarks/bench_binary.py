@@ -0,0 +1,57 @@
+"""
+Caching parsed names between stages: `to_dict()` + JSON against `to_bytes()`
+and the `NameWriter`/`NameReader` archive.
+
+Usage:
+    python benchmarks/bench_binary.py [count]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from bench_parse_many import corpus
+
+from namefully import Namefully, NameReader, NameWriter
+
+
+def run(label, fn, count):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<32} {count / elapsed:>12,.0f} names/s  ({elapsed:.3f}s)')
+    return result
+
+
+def main(count: int = 100_000) -> None:
+    names = list(Namefully.parse_many(corpus(count), bypass=False))
+
+    print('encode')
+    text = run('  to_dict + json.dumps', lambda: [json.dumps(name.to_dict()) for name in names], count)
+    blobs = run('  to_bytes', lambda: [name.to_bytes() for name in names], count)
+    print(f'  size: json {sum(map(len, text)) / count:.1f} bytes/name, binary {sum(map(len, blobs)) / count:.1f}')
+
+    print('decode')
+    decoded = lambda: [Namefully({k: v for k, v in json.loads(t).items() if v}, bypass=False) for t in text]
+    run('  json.loads + Namefully', decoded, count)
+    run('  from_bytes', lambda: [Namefully.from_bytes(b) for b in blobs], count)
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'names.nmfy')
+        print('archive')
+
+        def write():
+            with NameWriter(path) as writer:
+                writer.extend(names)
+
+        run('  NameWriter (stream)', write, count)
+        with NameReader(path) as reader:
+            run('  NameReader (stream)', lambda: sum(1 for _ in reader), count)
+            run('  NameReader (random access)', lambda: [reader[i] for i in range(0, count, 7)], count // 7 + 1)
+        print(f'  size: {os.path.getsize(path) / count:.1f} bytes/name')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,57 @@
+"""
+Deduplicating parsed names: a set of `Namefully` objects against a set keyed by
+their `full` strings, and dict lookups of names.
+
+Usage:
+    python benchmarks/bench_dedup.py [count]
+"""
+
+import sys
+import time
+
+from bench_parse_many import corpus
+
+from namefully import Namefully
+
+
+def best(fn, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def fresh(names):
+    # Names not formatted nor hashed yet, as in a pipeline seeing them once.
+    return [Namefully._of(name._full_name) for name in names]
+
+
+def main(count: int = 100_000) -> None:
+    raw = corpus(count // 2) * 2  # every name twice.
+    names = list(Namefully.parse_many(raw))
+
+    def by_full():
+        batch = fresh(names)
+        start = time.perf_counter()
+        unique = {name.full: name for name in batch}
+        return time.perf_counter() - start, len(unique)
+
+    def by_name():
+        batch = fresh(names)
+        start = time.perf_counter()
+        unique = set(batch)
+        return time.perf_counter() - start, len(unique)
+
+    for label, fn in [('dict keyed by full', by_full), ('set of names', by_name)]:
+        elapsed, unique = min(fn() for _ in range(5))
+        print(f'{label:<24} {count / elapsed:>12,.0f} names/s  ({unique:,} unique)')
+
+    index = set(names)
+    elapsed = best(lambda: sum(name in index for name in names))
+    print(f'{"lookup (hashed)":<24} {count / elapsed:>12,.0f} names/s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,75 @@
+"""
+End-to-end external sort of a name file larger than the memory budget: read
+with `read_lines()`, sorted with `sort_names()`, written back line by line.
+
+Each sort runs in a fresh process, to report its own peak memory, against an
+in-memory `sorted()` of the same file.
+
+Usage:
+    python benchmarks/bench_external_sort.py [count] [budget in MiB]
+"""
+
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_phonetic import CODAS, ONSETS, VOWELS
+
+from namefully import Namefully, read_lines, sort_names
+
+
+def write_names(path: str, count: int, seed: int = 11) -> None:
+    rng = random.Random(seed)
+
+    def word(syllables: int) -> str:
+        return ''.join(
+            rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS) for _ in range(syllables)
+        ).capitalize()
+
+    firsts = [word(rng.randint(1, 3)) for _ in range(2_000)]
+    with open(path, 'w', encoding='utf-8') as file:
+        for _ in range(count):
+            file.write(f'{rng.choice(firsts)} {word(rng.randint(2, 3))}\n')
+
+
+def sort_file(path: str, budget: int) -> None:
+    """Runs in a child process: sorts a file and reports the time and peak memory."""
+    output = path + '.sorted'
+    start = time.perf_counter()
+    with open(output, 'w', encoding='utf-8') as file:
+        if budget:
+            names = sort_names(read_lines(path), budget=budget, directory=os.path.dirname(path))
+        else:
+            names = sorted(Namefully.parse_many(read_lines(path)), key=lambda name: name._sort_key('last_name'))
+        for name in names:
+            file.write(name.full + '\n')
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    print(f'{elapsed:.2f} {peak:.1f}')
+
+
+def main(count: int = 1_000_000, budget_mib: int = 16) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'names.txt')
+        write_names(path, count)
+        size = os.path.getsize(path) / 2**20
+        print(f'{count:,} names, {size:.1f} MiB file, {budget_mib} MiB budget')
+
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        for label, budget in [('sort_names', budget_mib * 2**20), ('sorted() in memory', 0)]:
+            run = subprocess.run(
+                [sys.executable, __file__, '--sort', path, str(budget)], capture_output=True, text=True, env=env
+            )
+            elapsed, peak = map(float, run.stdout.split())
+            print(f'  {label:<20} {elapsed:>7.2f}s  ({count / elapsed:>8,.0f} names/s), peak RSS {peak:,.0f} MiB')
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--sort']:
+        sort_file(sys.argv[2], int(sys.argv[3]))
+    else:
+        main(*[int(arg) for arg in sys.argv[1:3]])
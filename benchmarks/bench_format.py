@@ -0,0 +1,42 @@
+"""
+Cost of `Namefully.format()` against a precompiled `Namefully.compile_format()`.
+
+Usage:
+    python benchmarks/bench_format.py [count]
+"""
+
+import sys
+import time
+
+from bench_parse_many import corpus
+
+from namefully import Namefully
+
+PATTERNS = ['L, f m', 'f $l.', 'o', 'b']
+
+
+def run(label, fn, repeat: int = 3):
+    elapsed, count = float('inf'), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = fn()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    print(f'{label:<32} {count / elapsed:>12,.0f} calls/s  ({elapsed:.3f}s)')
+    return elapsed
+
+
+def main(count: int = 100_000) -> None:
+    names = list(Namefully.parse_many(corpus(count)))
+    for pattern in PATTERNS:
+        print(f'pattern {pattern!r}')
+        run('  Namefully.format', lambda pattern=pattern: sum(1 for name in names if name.format(pattern) is not None))
+        if hasattr(Namefully, 'compile_format'):
+            formatter = Namefully.compile_format(pattern)
+            run(
+                '  compiled formatter',
+                lambda formatter=formatter: sum(1 for name in names if formatter(name) is not None),
+            )
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
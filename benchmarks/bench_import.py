@@ -0,0 +1,52 @@
+"""
+Import time of namefully, as reported by `python -X importtime`.
+
+Each statement runs in a fresh interpreter; the best cumulative time of the
+top-level imports it triggers is kept out of a few runs.
+
+Usage:
+    python benchmarks/bench_import.py [repeat]
+"""
+
+import os
+import subprocess
+import sys
+
+STATEMENTS = [
+    'import namefully',
+    'from namefully import NameIndex',
+    'from namefully import Namefully',
+    'from namefully import *',
+]
+
+
+def import_time(statement: str) -> float:
+    """Sums the cumulative times (in microseconds) of the top-level imports of a statement."""
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    env = dict(os.environ, PYTHONPATH=root)
+
+    def run(code: str) -> subprocess.CompletedProcess:
+        return subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, env=env)
+
+    # Modules already loaded by the interpreter itself are not counted.
+    preloaded = {line.split('|')[-1].strip() for line in run('pass').stderr.splitlines() if '|' in line}
+
+    result = run(statement)
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if not name.startswith('  ') and name.strip() not in preloaded and cumulative.strip().isdigit():
+            total += int(cumulative)
+    return total
+
+
+def main(repeat: int = 5) -> None:
+    for statement in STATEMENTS:
+        best = min(import_time(statement) for _ in range(repeat))
+        print(f'{statement:<48} {best / 1000:>8.1f}ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
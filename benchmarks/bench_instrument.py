@@ -0,0 +1,48 @@
+"""
+Overhead of the instrumentation (`namefully.instrument()`) on parsing and formatting.
+
+The 'disabled' run comes after instrumenting and then turning it off again, which
+must cost the same as never instrumenting at all.
+
+Usage:
+    python benchmarks/bench_instrument.py [count]
+"""
+
+import sys
+import time
+
+from bench_parse_many import corpus
+
+from namefully import Namefully, instrument, stats
+
+
+def workload(names):
+    for raw in names:
+        name = Namefully(raw, bypass=False)
+        name.format('L, f m')
+        name.flatten(limit=0)
+
+
+def run(label, names, repeat: int = 5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload(names)
+        best = min(best, time.perf_counter() - start)
+    print(f'{label:<24} {len(names) / best:>12,.0f} names/s  ({best:.3f}s)')
+    return best
+
+
+def main(count: int = 20_000) -> None:
+    names = corpus(count)
+    never = run('never instrumented', names)
+    instrument()
+    enabled = run('enabled', names)
+    instrument(enabled=False)
+    disabled = run('disabled', names)
+    print(f'overhead: enabled {enabled / never - 1:+.1%}, disabled {disabled / never - 1:+.1%}')
+    print(f"stages recorded: {len(stats())}, e.g. parse.StringParser: {stats()['parse.StringParser']['calls']:,} calls")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
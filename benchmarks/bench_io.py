@@ -0,0 +1,57 @@
+"""
+Ingestion of a large newline-delimited name file: file iteration against the
+memory-mapped reader (`read_lines()`, `read_names()`).
+
+Each mode runs in a fresh process, which reports its time and peak RSS.
+
+Usage:
+    python benchmarks/bench_io.py [count]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+from bench_parse_many import corpus
+
+MODES = {
+    'file iteration (lines)': 'n = sum(1 for line in open(path, encoding="utf-8") if line.strip())',
+    'read_lines': 'n = sum(1 for _ in read_lines(path))',
+    'file iteration + Namefully': 'n = sum(1 for line in open(path, encoding="utf-8") if Namefully(line.strip()))',
+    'read_names': 'n = sum(1 for _ in read_names(path))',
+}
+
+SCRIPT = """
+import resource, sys, time
+from namefully import Namefully, read_lines, read_names
+path = sys.argv[1]
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(n, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def main(count: int = 1_000_000) -> None:
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'names.txt')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(corpus(count)))
+        print(f'{count:,} names, {os.path.getsize(path) / 1e6:.1f} MB')
+
+        for label, statement in MODES.items():
+            output = subprocess.run(
+                [sys.executable, '-c', SCRIPT.format(statement=statement), path],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=dict(os.environ, PYTHONPATH=root),
+            ).stdout.split()
+            names, elapsed, rss = int(output[0]), float(output[1]), int(output[2])
+            print(f'{label:<28} {names / elapsed:>12,.0f} names/s  ({elapsed:.2f}s)  peak RSS {rss / 1024:>6.1f} MB')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
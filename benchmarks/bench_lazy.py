@@ -0,0 +1,32 @@
+"""
+Cost of names that are created then discarded, eager versus lazy parsing.
+
+Usage:
+    python benchmarks/bench_lazy.py [count]
+"""
+
+import sys
+import time
+
+from bench_parse_many import corpus
+
+from namefully import Namefully
+
+
+def run(label, names, build):
+    start = time.perf_counter()
+    kept = [name.full for i, name in enumerate(build(names)) if i % 10 == 0]  # 9 names out of 10 are discarded.
+    elapsed = time.perf_counter() - start
+    print(f'{label:<32} {elapsed:.3f}s  ({len(kept):,} names kept)')
+
+
+def main(count: int = 200_000) -> None:
+    names = corpus(count)
+    run('eager Namefully(...)', names, lambda items: (Namefully(n) for n in items))
+    run('lazy Namefully(..., lazy=True)', names, lambda items: (Namefully(n, lazy=True) for n in items))
+    run('eager parse_many', names, Namefully.parse_many)
+    run('lazy parse_many', names, lambda items: Namefully.parse_many(items, lazy=True))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
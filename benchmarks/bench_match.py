@@ -0,0 +1,60 @@
+"""
+Throughput of `NameMatcher` between two synthetic name sets, the queries being
+misspelled names of the reference list, against all-pairs comparisons.
+
+Usage:
+    python benchmarks/bench_match.py [count] [workers]
+"""
+
+import random
+import sys
+import time
+
+from bench_phonetic import synthetic
+
+from namefully import Namefully, NameMatcher, jaro_winkler
+
+
+def misspell(name: str, rng: random.Random) -> str:
+    """Swaps, drops or replaces a letter of the surname (at least 2 letters are kept)."""
+    first, last = name.split(' ')
+    i = rng.randrange(1, len(last) - 1)
+    change = rng.choice(('swap', 'drop', 'replace'))
+    if change == 'swap':
+        last = last[:i] + last[i + 1] + last[i] + last[i + 2 :]
+    elif change == 'drop' and len(last) > 3:
+        last = last[:i] + last[i + 1 :]
+    else:
+        last = last[:i] + rng.choice('aeiouy') + last[i + 1 :]
+    return f'{first} {last}'
+
+
+def main(count: int = 100_000, workers: int = 2) -> None:
+    rng = random.Random(3)
+    raw = synthetic(count)
+    reference = list(Namefully.parse_many(raw))
+    queries = list(Namefully.parse_many([misspell(name, rng) for name in rng.sample(raw, 2_000)]))
+
+    for metric in ('jaro_winkler', 'levenshtein'):
+        start = time.perf_counter()
+        matcher = NameMatcher(reference, metric=metric, threshold=0.85 if metric == 'jaro_winkler' else 0.8)
+        print(f'{metric}: built in {time.perf_counter() - start:.2f}s for {count:,} names')
+        for n in (1, workers):
+            start = time.perf_counter()
+            matches = list(matcher.match_many(queries, workers=n))
+            elapsed = time.perf_counter() - start
+            found = sum(1 for m in matches if m)
+            print(f'  workers={n}: {len(queries) / elapsed:>10,.0f} names/s, {found / len(queries):.0%} matched')
+
+    # All pairs, on a sample: what the blocking avoids.
+    sample = reference[:2_000]
+    start = time.perf_counter()
+    for query in queries[:20]:
+        [jaro_winkler(query.last.lower(), name.last.lower()) for name in sample]
+    per_pair = (time.perf_counter() - start) / (20 * len(sample))
+    print(f'all pairs: {1 / (per_pair * count):,.2f} names/s against {count:,} names (surnames only)')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
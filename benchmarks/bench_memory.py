@@ -0,0 +1,65 @@
+"""
+Memory held per parsed name, measured with tracemalloc.
+
+To compare with an older object model (e.g., before `__slots__`), run the same
+script against another checkout of the package; the measurements it does not
+support are skipped:
+    git worktree add /tmp/before <revision>
+    PYTHONPATH=/tmp/before python benchmarks/bench_memory.py [count]
+
+Usage:
+    python benchmarks/bench_memory.py [count]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from bench_parse_many import corpus
+
+import namefully
+from namefully import Namefully
+
+
+def measure(label, build, raw):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    names = build(raw)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f'{label:<28} {(after - before) / len(names):>8,.0f} bytes/name  ({len(names):,} names)')
+    return names
+
+
+def main(count: int = 100_000) -> None:
+    raw = corpus(count)
+    print(f'namefully from {os.path.dirname(namefully.__file__)}')
+    measure('Namefully (parse_many)', lambda items: list(Namefully.parse_many(items)), raw)
+    measure('Namefully (with full cached)', lambda items: [n for n in Namefully.parse_many(items) if n.full], raw)
+    if not hasattr(namefully, 'NamePool'):
+        return
+
+    pool = namefully.NamePool()
+    measure('Namefully (with NamePool)', lambda items: list(Namefully.parse_many(items, pool=pool)), raw)
+    stats = pool.stats()
+    print(f"  pool: {stats['size']:,} parts, hit rate {stats['hit_rate']:.1%}, saved {stats['saved_bytes']:,} bytes")
+
+    if not hasattr(namefully, 'NameTable'):
+        return
+    table = measure('NameTable (columnar)', namefully.NameTable.from_names, raw)
+    names = list(Namefully.parse_many(raw))
+    for label, scan in [
+        ('scan last names (objects)', lambda: sum(1 for name in names if name.last == 'Smith')),
+        ('scan last names (NameTable)', lambda: sum(1 for last in table.column('last_name') if last == 'Smith')),
+    ]:
+        start = time.perf_counter()
+        scan()
+        print(f'{label:<28} {time.perf_counter() - start:>8.3f}s')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
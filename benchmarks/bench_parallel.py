@@ -0,0 +1,40 @@
+"""
+Scaling of `parse_parallel()`/`format_parallel()` with the number of workers.
+
+Usage:
+    python benchmarks/bench_parallel.py [count] [max_workers]
+"""
+
+import os
+import sys
+import time
+
+from bench_parse_many import corpus
+
+from namefully import format_parallel, parse_parallel
+
+
+def run(label, fn, names, workers):
+    start = time.perf_counter()
+    count = sum(1 for _ in fn(names, workers=workers))
+    elapsed = time.perf_counter() - start
+    print(f'{label:<16} workers={workers:<3} {count / elapsed:>12,.0f} names/s  ({elapsed:.3f}s)')
+    return elapsed
+
+
+def main(count: int = 1_000_000, max_workers: int = os.cpu_count() or 1) -> None:
+    names = corpus(count)
+    workers, single = 1, 0.0
+    while workers <= max_workers:
+        elapsed = run('parse_parallel', parse_parallel, names, workers)
+        run('format_parallel', lambda items, workers: format_parallel(items, 'L, f m', workers=workers), names, workers)
+        if workers == 1:
+            single = elapsed
+        else:
+            print(f'  speedup vs 1 worker: {single / elapsed:.2f}x')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    main(count, int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1)
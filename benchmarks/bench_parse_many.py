@@ -0,0 +1,47 @@
+"""
+Throughput of `Namefully.parse_many()` against the per-item constructor loop.
+
+Usage:
+    python benchmarks/bench_parse_many.py [count]
+"""
+
+import random
+import sys
+import time
+
+from namefully import Namefully
+
+FIRST_NAMES = ['John', 'Maria', 'Ahmed', 'Wei', 'Olga', 'Jean', 'Fatima', 'Carlos', 'Anna', 'Kofi']
+MIDDLE_NAMES = ['Ben', 'Rose', 'Lee', 'Marie', 'Alva']
+LAST_NAMES = ['Smith', 'Garcia', 'Nguyen', 'Muller', 'Ivanova', 'Dupont', 'Okafor', 'Silva', 'Kim', 'Rossi']
+
+
+def corpus(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        parts = [rng.choice(FIRST_NAMES)]
+        if rng.random() < 0.3:
+            parts.append(rng.choice(MIDDLE_NAMES))
+        parts.append(rng.choice(LAST_NAMES))
+        names.append(' '.join(parts))
+    return names
+
+
+def run(label, fn, names):
+    start = time.perf_counter()
+    count = sum(1 for _ in fn(names))
+    elapsed = time.perf_counter() - start
+    print(f'{label:<24} {count / elapsed:>12,.0f} names/s  ({elapsed:.3f}s)')
+    return elapsed
+
+
+def main(count: int = 200_000) -> None:
+    names = corpus(count)
+    loop = run('Namefully(...) loop', lambda items: (Namefully(n) for n in items), names)
+    bulk = run('Namefully.parse_many', Namefully.parse_many, names)
+    print(f'speedup: {loop / bulk:.2f}x')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,69 @@
+"""
+Candidate lookups in a `PhoneticIndex` over a synthetic reference list: build
+throughput, index memory and lookup latency, against a full scan.
+
+Usage:
+    python benchmarks/bench_phonetic.py [count]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from namefully import Namefully, PhoneticIndex, soundex
+
+ONSETS = ['b', 'br', 'c', 'ch', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'n', 'p', 'r', 's', 'sh', 't', 'v', 'w', 'z']
+VOWELS = ['a', 'e', 'i', 'o', 'u', 'ai', 'ou', 'y']
+CODAS = ['', '', 'n', 'r', 'l', 's', 'th', 'ck', 'm', 'tz']
+
+
+def synthetic(count: int, seed: int = 7):
+    """Pronounceable names, with enough variety to look like a large reference list."""
+    rng = random.Random(seed)
+
+    def word(syllables: int) -> str:
+        return ''.join(
+            rng.choice(ONSETS) + rng.choice(VOWELS) + rng.choice(CODAS) for _ in range(syllables)
+        ).capitalize()
+
+    firsts = [word(rng.randint(1, 3)) for _ in range(2_000)]
+    lasts = [word(rng.randint(2, 3)) for _ in range(50_000)]
+    return [f'{rng.choice(firsts)} {rng.choice(lasts)}' for _ in range(count)]
+
+
+def main(count: int = 200_000) -> None:
+    names = list(Namefully.parse_many(synthetic(count)))
+    queries = [names[i] for i in random.Random(1).sample(range(count), 1_000)]
+
+    for encoder in ('soundex', 'metaphone'):
+        tracemalloc.start()
+        start = time.perf_counter()
+        index = PhoneticIndex(encoder=encoder)
+        index.extend(names)
+        elapsed = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f'{encoder}: built in {elapsed:.2f}s ({count / elapsed:,.0f} names/s), {index.key_count:,} keys')
+        print(f'  memory: {memory / 2**20:.1f} MiB ({memory / count:.1f} bytes/name)')
+
+        latencies, found = [], 0
+        for query in queries:
+            start = time.perf_counter()
+            found += len(index.candidates(query))
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        p50, p99 = latencies[len(latencies) // 2], latencies[len(latencies) * 99 // 100]
+        print(f'  lookup: p50 {p50 * 1e6:.1f}µs, p99 {p99 * 1e6:.1f}µs, {found / len(queries):.1f} candidates')
+
+    # Computed once, as a scan would keep the codes of the reference list around.
+    codes = [(soundex(n.first), soundex(n.last)) for n in names]
+    start = time.perf_counter()
+    for query in queries[:20]:
+        key = (soundex(query.first), soundex(query.last))
+        [i for i, code in enumerate(codes) if code == key]
+    print(f'full scan: {(time.perf_counter() - start) / 20 * 1e3:.1f}ms per lookup')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
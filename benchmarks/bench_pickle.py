@@ -0,0 +1,47 @@
+"""
+Pickling parsed names, as done when shipping them to other processes: bytes per
+name and round-trip time, for single names and for lists of names.
+
+Usage:
+    python benchmarks/bench_pickle.py [count]
+"""
+
+import pickle
+import sys
+import time
+
+from bench_parse_many import corpus
+
+from namefully import Namefully
+
+
+def best(fn, repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(count: int = 20_000) -> None:
+    names = list(Namefully.parse_many(corpus(count), bypass=False))
+    for name in names:
+        _ = name.full  # memoized values are not pickled.
+    lazy = list(Namefully.parse_many(corpus(count), lazy=True))
+    parts = [(n.prefix, n.first, tuple(n.middle_name()), n.last, n.suffix) for n in names]
+
+    print(f'{"payload":<28} {"bytes/name":>10} {"round-trip/name":>16}')
+    for label, payload in [('parts tuples (baseline)', parts), ('Namefully', names), ('Namefully (lazy)', lazy)]:
+        size = len(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)) / count
+        elapsed = best(lambda payload=payload: pickle.loads(pickle.dumps(payload, pickle.HIGHEST_PROTOCOL)))
+        print(f'{label + " list":<28} {size:>10.1f} {elapsed / count * 1e6:>14.2f}µs')
+
+    sample = names[: count // 10]
+    size = sum(len(pickle.dumps(name, pickle.HIGHEST_PROTOCOL)) for name in sample) / len(sample)
+    elapsed = best(lambda: [pickle.loads(pickle.dumps(name, pickle.HIGHEST_PROTOCOL)) for name in sample])
+    print(f'{"Namefully (one by one)":<28} {size:>10.1f} {elapsed / len(sample) * 1e6:>14.2f}µs')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,56 @@
+"""
+Sorting large name lists: `sort_key()` and `sort_keys()` against formatting a
+key string per name, for `Namefully` objects and for a `NameTable`.
+
+Usage:
+    python benchmarks/bench_sort.py [count]
+"""
+
+import random
+import sys
+import time
+
+from bench_phonetic import synthetic
+
+from namefully import Namefully, NameTable, sort_keys
+
+ACCENTS = str.maketrans('aeiouc', 'àéîöüç')
+
+
+def names(count: int):
+    rng = random.Random(5)
+    raw = synthetic(count)
+    # Some accented and lowercase names, which a plain string sort puts last.
+    for i in rng.sample(range(count), count // 10):
+        raw[i] = raw[i].translate(ACCENTS) if i % 2 else raw[i].lower()
+    return raw
+
+
+def timed(label: str, fn, count: int):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f'  {label:<36} {elapsed:>7.2f}s  ({count / elapsed:>10,.0f} names/s)')
+    return result
+
+
+def main(count: int = 5_000_000) -> None:
+    raw = names(count)
+    table = timed('NameTable.from_names', lambda: NameTable.from_names(raw), count)
+    print(f'NameTable: {count:,} names')
+    keys = timed('sort_keys(table)', lambda: sort_keys(table), count)
+    timed('sort by the keys', lambda: sorted(range(count), key=keys.__getitem__), count)
+    del keys
+
+    sample = min(count, 500_000)
+    parsed = list(Namefully.parse_many(raw[:sample]))
+    print(f'Namefully: {sample:,} names')
+    timed("sorted(key=format('L f m'))", lambda: sorted(parsed, key=lambda n: n.format('L f m')), sample)
+    timed('sorted(key=Namefully.sort_key)', lambda: sorted(parsed, key=Namefully.sort_key), sample)
+    timed('sorted() again (memoized keys)', lambda: sorted(parsed), sample)
+    keys = timed('sort_keys(names)', lambda: sort_keys(parsed), sample)
+    timed('sort by the keys', lambda: sorted(range(sample), key=keys.__getitem__), sample)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,65 @@
+"""
+Validation costs:
+- latency of the name validation rule on adversarial inputs of growing length:
+  the legacy rule (nested quantifiers) backtracks exponentially on a long run of
+  letters ending with an invalid character, while the current rule stays linear;
+- bulk validation of mostly invalid rows with `check()` versus `validate()`.
+
+Usage:
+    python benchmarks/bench_validation.py
+"""
+
+import re
+import time
+
+from namefully import NameError
+from namefully._validators import ValidationRule, Validators
+
+BASE = ValidationRule.base.pattern
+LEGACY_NAMON = re.compile(r'^' + BASE + r'+(([ -]' + BASE + r')?' + BASE + r'*)*$')
+
+
+def latency(rule, text):
+    start = time.perf_counter()
+    rule.match(text)
+    return time.perf_counter() - start
+
+
+def bulk(count: int = 200_000) -> None:
+    # 4 rows out of 5 fail the first name rule.
+    rows = [{'first_name': 'Jane' if i % 5 == 0 else f'J{i % 10}ne', 'last_name': 'Doe'} for i in range(count)]
+
+    def with_exceptions():
+        failed = 0
+        for row in rows:
+            try:
+                Validators.nama.validate(row)
+            except NameError:
+                failed += 1
+        return failed
+
+    def with_results():
+        return sum(1 for row in rows if not Validators.nama.check(row))
+
+    for label, fn in [('validate() + except', with_exceptions), ('check()', with_results)]:
+        start = time.perf_counter()
+        failed = fn()
+        elapsed = time.perf_counter() - start
+        print(f'{label:<22} {count / elapsed:>12,.0f} rows/s  ({failed:,} invalid rows)')
+
+
+def main() -> None:
+    print(f"{'length':>8} {'legacy (ms)':>14} {'current (ms)':>14}")
+    legacy_done = False
+    for length in [8, 12, 16, 18, 20, 22, 24, 1_000, 100_000, 1_000_000]:
+        attack = 'a' * length + '1'
+        legacy = '-' if legacy_done else f'{latency(LEGACY_NAMON, attack) * 1000:.3f}'
+        legacy_done = legacy_done or length >= 24  # beyond this, the legacy rule takes minutes.
+        current = latency(ValidationRule.namon, attack) * 1000
+        print(f'{length:>8} {legacy:>14} {current:>14.3f}')
+    print()
+    bulk()
+
+
+if __name__ == '__main__':
+    main()
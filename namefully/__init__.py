@@ -1,9 +1,94 @@
-from ._config import *
-from ._constants import *
-from ._errors import *
-from ._full_name import *
-from ._name import *
-from ._namefully import *
-from ._parser import *
-from ._utils import *
+"""Handle personal names in a particular order, way, or shape.
+
+The public names are loaded on first access, so that importing the package stays
+cheap: e.g., `from namefully import NameIndex` does not compile the validation
+rules nor load the parsers. `from namefully import *` loads everything.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
 from ._version import *
+
+# Public name -> private module defining it.
+_EXPORTS = {
+    'aparse_many': '_aio',
+    'aformat_many': '_aio',
+    'NameReader': '_archive',
+    'NameWriter': '_archive',
+    'format_many': '_batch',
+    'upper_many': '_batch',
+    'lower_many': '_batch',
+    'initials_many': '_batch',
+    'zip_many': '_batch',
+    'sort_keys': '_batch',
+    'Config': '_config',
+    'MIN_NUMBER_OF_NAME_PARTS': '_constants',
+    'MAX_NUMBER_OF_NAME_PARTS': '_constants',
+    'ALLOWED_TOKENS': '_constants',
+    'NameErrorType': '_errors',
+    'NameError': '_errors',
+    'InputError': '_errors',
+    'ValidationError': '_errors',
+    'NotAllowedError': '_errors',
+    'UnknownError': '_errors',
+    'FullName': '_full_name',
+    'instrument': '_instrument',
+    'stats': '_instrument',
+    'read_lines': '_io',
+    'read_names': '_io',
+    'levenshtein': '_match',
+    'jaro_winkler': '_match',
+    'NameMatcher': '_match',
+    'Name': '_name',
+    'FirstName': '_name',
+    'LastName': '_name',
+    'Namefully': '_namefully',
+    'parse_parallel': '_parallel',
+    'format_parallel': '_parallel',
+    'Parser': '_parser',
+    'soundex': '_phonetic',
+    'metaphone': '_phonetic',
+    'PhoneticIndex': '_phonetic',
+    'NamePool': '_pool',
+    'sort_names': '_sort',
+    'NameTable': '_table',
+    'NameIndex': '_utils',
+}
+
+__all__ = ['__version__', '__title__', '__description__', 'version', *_EXPORTS]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value  # next lookups skip this function.
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+if TYPE_CHECKING:
+    from ._aio import *
+    from ._archive import *
+    from ._batch import *
+    from ._config import *
+    from ._constants import *
+    from ._errors import *
+    from ._full_name import *
+    from ._instrument import *
+    from ._io import *
+    from ._match import *
+    from ._name import *
+    from ._namefully import *
+    from ._parallel import *
+    from ._parser import *
+    from ._phonetic import *
+    from ._pool import *
+    from ._sort import *
+    from ._table import *
+    from ._utils import *
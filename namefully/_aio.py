@@ -0,0 +1,143 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from ._namefully import Namefully, _compile_format
+
+__all__ = ['aparse_many', 'aformat_many']
+
+T = TypeVar('T')
+
+_RawNames = Union[Iterable[Any], AsyncIterable[Any]]
+
+
+async def aparse_many(
+    names: _RawNames,
+    *,
+    chunksize: int = 256,
+    executor: Optional[Executor] = None,
+    concurrency: int = 2,
+    **options: Any,
+) -> AsyncIterator[Namefully]:
+    """
+    Parses many raw names without blocking the event loop.
+
+    Names are parsed by chunks of `chunksize` items, giving control back to the
+    event loop after each chunk, so that other tasks keep being served while a
+    large batch is processed. Names are yielded in the same order as the input.
+
+    Args:
+        names: raw names accepted by `Namefully.parse_many()`, from an iterable
+            or an async iterable.
+        chunksize: number of names handled between two yields to the event loop.
+        executor: a thread or process pool to offload the chunks to; chunks are
+            parsed inline (on the event loop) if omitted.
+        concurrency: maximum number of chunks in flight in the executor.
+        options: the same keyword arguments accepted by `Namefully`.
+
+    Example:
+    --------
+    >>> async def main():
+    ...     return [name.short async for name in aparse_many(['John Smith', 'Jane Doe'])]
+    >>> asyncio.run(main())
+    ['John Smith', 'Jane Doe']
+    """
+    async for name in _run(_parse_chunk, names, (options,), chunksize, executor, concurrency):
+        yield name
+
+
+async def aformat_many(
+    names: _RawNames,
+    pattern: str,
+    *,
+    chunksize: int = 256,
+    executor: Optional[Executor] = None,
+    concurrency: int = 2,
+    **options: Any,
+) -> AsyncIterator[str]:
+    """
+    Parses and formats many raw names without blocking the event loop.
+
+    Works like `aparse_many()`, but only the formatted strings are yielded; see
+    `Namefully.format()` for the supported patterns. The pattern is validated
+    before any name is parsed.
+    """
+    _compile_format(pattern)
+    async for name in _run(_format_chunk, names, (pattern, options), chunksize, executor, concurrency):
+        yield name
+
+
+def _parse_chunk(chunk: Sequence[Any], options: dict) -> List[Namefully]:
+    return list(Namefully.parse_many(chunk, **options))
+
+
+def _format_chunk(chunk: Sequence[Any], pattern: str, options: dict) -> List[str]:
+    formatter = _compile_format(pattern)
+    return [formatter(name) for name in Namefully.parse_many(chunk, **options)]
+
+
+async def _run(
+    task: Callable[..., List[T]],
+    names: _RawNames,
+    args: tuple,
+    chunksize: int,
+    executor: Optional[Executor],
+    concurrency: int,
+) -> AsyncIterator[T]:
+    if chunksize < 1 or concurrency < 1:
+        raise ValueError('chunksize and concurrency must be positive integers')
+
+    if executor is None:
+        async for chunk in _chunks(names, chunksize):
+            for result in task(chunk, *args):
+                yield result
+            await asyncio.sleep(0)
+        return
+
+    # Chunks are submitted in order and drained in order; at most `concurrency`
+    # of them are pending at any time, which bounds the memory held by results.
+    loop = asyncio.get_running_loop()
+    pending: Deque[asyncio.Future] = deque()
+    try:
+        async for chunk in _chunks(names, chunksize):
+            pending.append(loop.run_in_executor(executor, task, chunk, *args))
+            if len(pending) >= concurrency:
+                for result in await pending.popleft():
+                    yield result
+        while pending:
+            for result in await pending.popleft():
+                yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _chunks(names: _RawNames, size: int) -> AsyncIterator[List[Any]]:
+    chunk: List[Any] = []
+    if hasattr(names, '__aiter__'):
+        async for name in names:  # type: ignore
+            chunk.append(name)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    else:
+        for name in names:
+            chunk.append(name)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,154 @@
+import os
+import struct
+import sys
+from array import array
+from typing import IO, Iterator, Optional, Union
+
+from ._errors import NameError
+from ._full_name import FullName, _decode
+from ._namefully import Namefully
+
+__all__ = ['NameWriter', 'NameReader']
+
+# The layout of a name archive:
+# - a header: the magic bytes and the format version;
+# - the records, one per name: its length (4 bytes) then its binary form (see
+#   `FullName.to_bytes()`);
+# - an index: the offset of every record (8 bytes each);
+# - a footer: the offset of the index, the number of records and the magic bytes.
+# All the integers are little-endian.
+_MAGIC = b'NMFY'
+_VERSION = 1
+_HEADER = struct.Struct('<4sB3x')
+_RECORD = struct.Struct('<I')
+_FOOTER = struct.Struct('<QQ4s')
+
+_Path = Union[str, 'os.PathLike[str]']
+
+
+class NameWriter:
+    """
+    Writes parsed names to a binary archive, one record after the other.
+
+    The archive is only complete once the writer is closed, which appends the
+    index of the records; use the writer as a context manager.
+
+    Example:
+    --------
+    >>> with NameWriter('names.nmfy') as writer:
+    ...     writer.extend(Namefully.parse_many(['John Smith', 'Jane Doe']))
+    >>> NameReader('names.nmfy')[1].full
+    'Jane Doe'
+    """
+
+    __slots__ = ('_file', '_offsets')
+
+    def __init__(self, path: _Path) -> None:
+        self._file: Optional[IO[bytes]] = open(path, 'wb')
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION))
+        self._offsets = array('Q')
+
+    def __enter__(self) -> 'NameWriter':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def write(self, name: Union[Namefully, FullName]) -> None:
+        if self._file is None:
+            raise NameError.not_allowed(source=str(name), operation='write', message='the archive is closed')
+        full_name = name._full_name if isinstance(name, Namefully) else name
+        data = full_name.to_bytes()
+        self._offsets.append(self._file.tell())
+        self._file.write(_RECORD.pack(len(data)))
+        self._file.write(data)
+
+    def extend(self, names: Iterator[Union[Namefully, FullName]]) -> None:
+        for name in names:
+            self.write(name)
+
+    def close(self) -> None:
+        """Writes the index of the records and closes the archive."""
+        if self._file is None:
+            return
+        file, self._file = self._file, None
+        try:
+            index = file.tell()
+            file.write(self._offsets.tobytes() if _LITTLE_ENDIAN else _swapped(self._offsets).tobytes())
+            file.write(_FOOTER.pack(index, len(self._offsets), _MAGIC))
+        finally:
+            file.close()
+
+
+class NameReader:
+    """
+    Reads the names of a binary archive written by `NameWriter`.
+
+    Names are yielded in order by iterating over the reader, or accessed at random
+    through their record index. They are not validated again: they were when
+    first parsed.
+    """
+
+    __slots__ = ('_file', '_count', '_index_offset', '_offsets')
+
+    def __init__(self, path: _Path) -> None:
+        self._file: IO[bytes] = open(path, 'rb')
+        try:
+            magic, version = _HEADER.unpack(self._file.read(_HEADER.size))
+            self._file.seek(-_FOOTER.size, 2)
+            self._index_offset, self._count, trailer = _FOOTER.unpack(self._file.read(_FOOTER.size))
+        except (OSError, struct.error):
+            magic, version, trailer = None, None, None
+        if magic != _MAGIC or trailer != _MAGIC or version != _VERSION:
+            self._file.close()
+            raise NameError.input(source=str(path), message='not a complete name archive (or an unsupported version)')
+        self._offsets: Optional[array] = None
+
+    def __enter__(self) -> 'NameReader':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Namefully]:
+        file, position = self._file, _HEADER.size
+        for _ in range(self._count):
+            file.seek(position)  # random accesses may have moved the file position in between.
+            (length,) = _RECORD.unpack(file.read(_RECORD.size))
+            yield Namefully._of(_decode(file.read(length), 0)[0])
+            position += _RECORD.size + length
+
+    def __getitem__(self, index: int) -> Namefully:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('NameReader index out of range')
+
+        offsets = self._offsets
+        if offsets is None:
+            self._file.seek(self._index_offset)
+            offsets = self._offsets = array('Q', self._file.read(8 * self._count))
+            if not _LITTLE_ENDIAN:
+                offsets.byteswap()
+
+        self._file.seek(offsets[index])
+        (length,) = _RECORD.unpack(self._file.read(_RECORD.size))
+        return Namefully._of(_decode(self._file.read(length), 0)[0])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def _swapped(values: array) -> array:
+    values = array(values.typecode, values)
+    values.byteswap()
+    return values
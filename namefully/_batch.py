@@ -0,0 +1,324 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ._errors import NameError
+from ._namefully import Namefully, _compile_format, _tokenize
+from ._table import _UNIT_SEP, NameTable
+from ._types import _Surname
+from ._utils import _collate
+
+__all__ = ['format_many', 'upper_many', 'lower_many', 'initials_many', 'zip_many', 'sort_keys']
+
+_Names = Union[NameTable, Iterable[Namefully]]
+_Transform = Callable[[List[str]], List[str]]
+
+
+def format_many(names: _Names, pattern: str, *, backend: str = 'python') -> List[str]:
+    """
+    Formats a whole column of names with the same pattern.
+
+    The pattern is compiled once (see `Namefully.compile_format()`) and gives the
+    same results as calling `format(pattern)` on every name. Given a `NameTable`,
+    the name tokens are computed column by column: each distinct string of the
+    table is transformed once, then the rows are assembled from the results.
+
+    Args:
+        names: a `NameTable` or an iterable of `Namefully` instances.
+        pattern: the same patterns as `Namefully.format()`.
+        backend: 'python' (default) or 'numpy' to run the case transforms of a
+            `NameTable` as NumPy string operations; requires `numpy`.
+
+    Example:
+    --------
+    >>> format_many(NameTable.from_names(['Joe Smith', 'Jane Doe']), 'L, f')
+    ['SMITH, Joe', 'DOE, Jane']
+    """
+    transforms = _backend(backend)
+    if isinstance(names, NameTable):
+        return _Columns(names, transforms).format(pattern)
+    formatter = _compile_format(pattern)
+    return [formatter(name) for name in names]
+
+
+def upper_many(names: _Names, *, backend: str = 'python') -> List[str]:
+    """Same as calling `upper()` on every name: the birth names in capital letters."""
+    transforms = _backend(backend)
+    if isinstance(names, NameTable):
+        return _Columns(names, transforms).birth('upper')
+    return transforms['upper']([name.birth for name in names])
+
+
+def lower_many(names: _Names, *, backend: str = 'python') -> List[str]:
+    """Same as calling `lower()` on every name: the birth names in small letters."""
+    transforms = _backend(backend)
+    if isinstance(names, NameTable):
+        return _Columns(names, transforms).birth('lower')
+    return transforms['lower']([name.birth for name in names])
+
+
+def initials_many(names: _Names, *, backend: str = 'python') -> List[List[str]]:
+    """Same as calling `initials()` (with its default arguments) on every name."""
+    transforms = _backend(backend)
+    if isinstance(names, NameTable):
+        return _Columns(names, transforms).initials()
+    return [name.initials() for name in names]  # type: ignore
+
+
+def zip_many(names: _Names, by: str = 'mid_last', with_period: bool = True) -> List[str]:
+    """Same as calling `zip(by, with_period)` on every name."""
+    return [name.zip(by, with_period) for name in names]
+
+
+def sort_keys(names: _Names) -> List[Tuple[str, ...]]:
+    """
+    Same as calling `sort_key()` on every name, without memoizing the keys on the names.
+
+    Given a `NameTable`, the keys are computed column by column: each distinct
+    string of the table is collated once.
+
+    Example:
+    --------
+    >>> table = NameTable.from_names(['Émile Zola', 'Zoe Adams', 'Elodie Martin'])
+    >>> keys = sort_keys(table)
+    >>> [table[i].full for i in sorted(range(len(table)), key=keys.__getitem__)]
+    ['Elodie Martin', 'Émile Zola', 'Zoe Adams']
+    """
+    if isinstance(names, NameTable):
+        return _Columns(names, _PYTHON).sort_keys()
+    return [name._sort_key() for name in names]
+
+
+def _upper(values: List[str]) -> List[str]:
+    return [value.upper() for value in values]
+
+
+def _lower(values: List[str]) -> List[str]:
+    return [value.lower() for value in values]
+
+
+def _initial(values: List[str]) -> List[str]:
+    return [value[:1] for value in values]
+
+
+def _collated(values: List[str]) -> List[str]:
+    return [_collate(value) for value in values]
+
+
+_PYTHON: Dict[str, _Transform] = {'upper': _upper, 'lower': _lower, 'initial': _initial, 'collate': _collated}
+
+
+# A change of case makes a string 3 times longer at most (e.g., 'ﬃ' -> 'FFI').
+_CASE_EXPANSION = 3
+
+
+def _backend(name: str) -> Dict[str, _Transform]:
+    if name == 'python':
+        return _PYTHON
+    if name == 'numpy':
+        return _numpy_backend()
+    raise NameError.not_allowed(source=name, operation='backend', message="expecting 'python' or 'numpy'")
+
+
+def _numpy_backend() -> Dict[str, _Transform]:
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError('the numpy backend requires numpy to be installed: pip install numpy') from None
+
+    def to_list(values: List[str], transform: Callable) -> List[str]:
+        if not values:
+            return []
+        # The case functions keep the width of the array: room is made for the strings they
+        # lengthen (e.g., 'ß' -> 'SS'), which would be truncated otherwise.
+        width = _CASE_EXPANSION * max(map(len, values))
+        return transform(np.array(values, dtype=f'U{width}')).tolist()
+
+    return {
+        'upper': lambda values: to_list(values, np.char.upper),
+        'lower': lambda values: to_list(values, np.char.lower),
+        'initial': lambda values: to_list(values, lambda array: array.astype('U1')),
+    }
+
+
+class _Columns:
+    """
+    Decodes the columns of a `NameTable` for one batch operation.
+
+    The distinct strings of the table are transformed (e.g., capitalized) once per
+    case, and the columns are decoded through them; decoded columns are reused by
+    all the tokens of a pattern.
+    """
+
+    __slots__ = ('_table', '_transforms', '_strings', '_decoded')
+
+    def __init__(self, table: NameTable, transforms: Dict[str, _Transform]) -> None:
+        self._table = table
+        self._transforms = transforms
+        self._strings: Dict[Optional[str], List[str]] = {}
+        self._decoded: Dict[tuple, List[str]] = {}
+
+    def format(self, pattern: str) -> List[str]:
+        if pattern == 'short':
+            return self.short()
+        if pattern == 'long':
+            return self.birth()
+        if pattern == 'public':
+            pattern = 'f $l'
+        elif pattern == 'official':
+            pattern = 'o'
+
+        size = len(self._table)
+        columns = [_TOKENS[chunk](self) if chunk in _TOKENS else [chunk] * size for chunk in _tokenize(pattern)]
+
+        if not columns:
+            return [''] * len(self._table)
+        return [''.join(parts).strip() for parts in zip(*columns)]
+
+    def decode(self, field: str, case: Optional[str] = None) -> List[str]:
+        """Decodes a field, using '' for the missing values and spaces between many names."""
+        key = (field, case)
+        column = self._decoded.get(key)
+        if column is None:
+            lookup = self._lookup(case)
+            column = self._decoded[key] = [lookup[index] for index in self._table._columns[field]]
+        return column
+
+    def first(self, case: Optional[str] = None) -> List[str]:
+        firsts, mores = self.decode('first_name', case), self.decode('more', case)
+        return [f'{first} {more}' if more else first for first, more in zip(firsts, mores)]
+
+    def last(self, case: Optional[str] = None) -> List[str]:
+        fathers = self.decode('last_name', case)
+        surnames = self._table._surnames
+        if not any(surnames):  # father's surname only
+            return fathers
+
+        formats = [_LAST_NAMES[_Surname[index]] for index in surnames]
+        return [fmt(father, mother) for fmt, father, mother in zip(formats, fathers, self.decode('mother', case))]
+
+    def birth(self, case: Optional[str] = None) -> List[str]:
+        firsts, middles, lasts = self.first(case), self.decode('middle_name', case), self.last(case)
+        if self._table.config.ordered_by == 'first_name':
+            return [
+                f'{first} {middle} {last}' if middle else f'{first} {last}'
+                for first, middle, last in zip(firsts, middles, lasts)
+            ]
+        return [
+            f'{last} {first} {middle}' if middle else f'{last} {first}'
+            for first, middle, last in zip(firsts, middles, lasts)
+        ]
+
+    def official(self, case: Optional[str] = None) -> List[str]:
+        sep = ',' if self._table.config.ending else ''
+        prefixes, firsts, middles = self.decode('prefix', case), self.first(case), self.decode('middle_name', case)
+        names = []
+        for prefix, first, middle, last, suffix in zip(
+            prefixes, firsts, middles, self.last('upper'), self.decode('suffix', case)
+        ):
+            parts = [prefix, f'{last},'] if prefix else [f'{last},']
+            parts.extend([first, middle + sep] if middle else [first + sep])
+            if suffix:
+                parts.append(suffix)
+            names.append(' '.join(parts).strip())
+        return names
+
+    def short(self) -> List[str]:
+        firsts, lasts = self.decode('first_name'), self.last()
+        if self._table.config.ordered_by == 'first_name':
+            return [f'{first} {last}' for first, last in zip(firsts, lasts)]
+        return [f'{last} {first}' for first, last in zip(firsts, lasts)]
+
+    def initials(self) -> List[List[str]]:
+        table = self._table
+        strings = table._strings
+        # The middle names of a row are stored as a single entry.
+        middle_initials = [[name[0] for name in value.split(_UNIT_SEP)] for value in strings] + [[]]
+        firsts = self.decode('first_name', 'initial')
+        middles = [middle_initials[index] for index in table._columns['middle_name']]
+        lasts = self._last_initials()
+
+        if table.config.ordered_by == 'first_name':
+            return [[first, *middle, *last] for first, middle, last in zip(firsts, middles, lasts)]
+        return [[*last, first, *middle] for first, middle, last in zip(firsts, middles, lasts)]
+
+    def sort_keys(self) -> List[Tuple[str, ...]]:
+        # Collating the parts of a row one by one or joined is the same. The ties are broken by
+        # the parts as stored, whose many names are already joined by unit separators.
+        raw = self._table._strings + ['']
+        columns = self._table._columns
+        firsts, mores, middles, fathers, mothers, prefixes, suffixes = (
+            [raw[index] for index in columns[field]]
+            for field in ('first_name', 'more', 'middle_name', 'last_name', 'mother', 'prefix', 'suffix')
+        )
+        firsts = [f'{first}{_UNIT_SEP}{more}' if more else first for first, more in zip(firsts, mores)]
+        lasts = [f'{father}{_UNIT_SEP}{mother}' if mother else father for father, mother in zip(fathers, mothers)]
+        collated_fathers, collated_mothers = self.decode('last_name', 'collate'), self.decode('mother', 'collate')
+        collated_lasts = [
+            f'{father} {mother}' if mother else father for father, mother in zip(collated_fathers, collated_mothers)
+        ]
+        collated_firsts, order = self.first('collate'), self._table.config.ordered_by
+        if order == 'last_name':  # the surnames go first.
+            collated_firsts, collated_lasts, firsts, lasts = collated_lasts, collated_firsts, lasts, firsts
+        keys = zip(collated_firsts, collated_lasts, self.decode('middle_name', 'collate'))
+        ties = zip(firsts, lasts, middles, prefixes, suffixes)
+        return [(*key, *tie, order) for key, tie in zip(keys, ties)]
+
+    def _last_initials(self) -> List[List[str]]:
+        fathers = self.decode('last_name', 'initial')
+        surnames = self._table._surnames
+        if not any(surnames):
+            return [[father] for father in fathers]
+
+        mothers = self.decode('mother', 'initial')
+        initials = []
+        for index, father, mother in zip(surnames, fathers, mothers):
+            format = _Surname[index]
+            if format == 'mother' and mother:
+                initials.append([mother])
+            elif format in ('hyphenated', 'all') and mother:
+                initials.append([father, mother])
+            else:
+                initials.append([father])
+        return initials
+
+    def _lookup(self, case: Optional[str]) -> List[str]:
+        # The trailing '' is what the missing values (index -1) point to.
+        lookup = self._strings.get(case)
+        if lookup is None:
+            if None not in self._strings:
+                self._strings[None] = [value.replace(_UNIT_SEP, ' ') for value in self._table._strings] + ['']
+            lookup = self._strings[None]
+            if case is not None:
+                lookup = self._strings[case] = self._transforms[case](lookup)
+        return lookup
+
+
+_LAST_NAMES: Dict[str, Callable[[str, str], str]] = {
+    'father': lambda father, _: father,
+    'mother': lambda _, mother: mother,
+    'hyphenated': lambda father, mother: f'{father}-{mother}' if mother else father,
+    'all': lambda father, mother: f'{father} {mother}' if mother else father,
+}
+
+# The column-wise equivalents of the format tokens.
+_TOKENS: Dict[str, Callable[[_Columns], List[str]]] = {
+    'b': lambda columns: columns.birth(),
+    'B': lambda columns: columns.birth('upper'),
+    'f': lambda columns: columns.first(),
+    'F': lambda columns: columns.first('upper'),
+    'l': lambda columns: columns.last(),
+    'L': lambda columns: columns.last('upper'),
+    'm': lambda columns: columns.decode('middle_name'),
+    'M': lambda columns: columns.decode('middle_name', 'upper'),
+    'p': lambda columns: columns.decode('prefix'),
+    'P': lambda columns: columns.decode('prefix', 'upper'),
+    's': lambda columns: columns.decode('suffix'),
+    'S': lambda columns: columns.decode('suffix', 'upper'),
+    'o': lambda columns: columns.official(),
+    'O': lambda columns: columns.official('upper'),
+    '$f': lambda columns: columns.decode('first_name', 'initial'),
+    '$F': lambda columns: columns.decode('first_name', 'initial'),
+    '$l': lambda columns: columns.decode('last_name', 'initial'),
+    '$L': lambda columns: columns.decode('last_name', 'initial'),
+    '$m': lambda columns: columns.decode('middle_name', 'initial'),
+    '$M': lambda columns: columns.decode('middle_name', 'initial'),
+}
@@ -1,10 +1,31 @@
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from ._types import Separator, _NameOrder, _Surname, _Title
 
+__all__ = ['Config']
+
+_ConfigKey = Tuple[str, str, str, str, bool, bool, str]
+
 
 class Config:
+    """
+    An immutable set of options that shapes how a name is parsed and formatted.
+
+    Configurations are interned by their field values: merging the same options
+    twice gives back the very same instance, and no instance is ever modified
+    in place. Every name holds its own snapshot, so names can safely be created
+    from several threads with different options.
+
+    The latest configuration merged under a given name is also remembered, which
+    is what `Config.create(name)` gives back. Partial merges start from the
+    default options instead, so that they never pick up options merged elsewhere
+    under the same name.
+    """
+
+    __slots__ = ('_name', '_ordered_by', '_separator', '_title', '_ending', '_bypass', '_surname', '_key', '_hash')
+
     _cache: Dict[str, 'Config'] = {}
+    _interned: Dict[_ConfigKey, 'Config'] = {}
 
     def __new__(cls) -> None:
         raise RuntimeError('use Config.create() to create Config instances')
@@ -20,13 +41,15 @@ class Config:
         bypass: bool = True,
         surname: str = 'father',
     ) -> None:
-        self._name: str = name
-        self._ordered_by: str = ordered_by in _NameOrder and ordered_by or 'first_name'
-        self._separator: str = separator in Separator.tokens() and separator or ' '
-        self._title: str = title in _Title and title or 'uk'
-        self._ending: bool = ending
-        self._bypass: bool = bypass
-        self._surname: str = surname in _Surname and surname or 'father'
+        self._assign(
+            name,
+            ordered_by in _NameOrder and ordered_by or 'first_name',
+            separator in Separator.tokens() and separator or ' ',
+            title in _Title and title or 'uk',
+            ending,
+            bypass,
+            surname in _Surname and surname or 'father',
+        )
 
     def __str__(self) -> str:
         return f'<Config: {self._name}>'
@@ -37,6 +60,21 @@ class Config:
             f'title={self.title}, ending={self.ending}, bypass={self.bypass}, surname={self.surname})'
         )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'Config is immutable; cannot set {name}')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'Config is immutable; cannot delete {name}')
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Config) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return Config._intern, self._key
+
     @property
     def ordered_by(self) -> str:
         return self._ordered_by
@@ -67,11 +105,12 @@ class Config:
 
     @classmethod
     def create(cls, name: str = 'default') -> 'Config':
-        if name not in cls._cache:
+        config = cls._cache.get(name)
+        if config is None:
             instance = object.__new__(cls)
             instance.__init__(name)
-            cls._cache[name] = instance
-        return cls._cache[name]
+            config = cls._cache.setdefault(name, cls._interned.setdefault(instance._key, instance))
+        return config
 
     @classmethod
     def merge(
@@ -85,18 +124,22 @@ class Config:
         bypass: Optional[bool] = None,
         surname: Optional[str] = None,
     ) -> 'Config':
-        config = cls.create(name or 'default')
-        config._ordered_by = ordered_by if ordered_by is not None else config.ordered_by
-        config._separator = separator if separator is not None else config.separator
-        config._title = title if title is not None else config.title
-        config._ending = ending if ending is not None else config.ending
-        config._bypass = bypass if bypass is not None else config.bypass
-        config._surname = surname if surname is not None else config.surname
+        config = cls._intern(
+            name or 'default',
+            ordered_by if ordered_by is not None else 'first_name',
+            separator if separator is not None else ' ',
+            title if title is not None else 'uk',
+            ending if ending is not None else False,
+            bypass if bypass is not None else True,
+            surname if surname is not None else 'father',
+        )
+        cls._cache[config.name] = config
         return config
 
     @classmethod
     def clear(cls) -> None:
         cls._cache.clear()
+        cls._interned.clear()
 
     def copy_with(
         self,
@@ -110,31 +153,37 @@ class Config:
         surname: Optional[str] = None,
     ) -> 'Config':
         name = name or self._name + '_copy'
-        config = Config.create(self._gen_name(name))
-        config._ordered_by = ordered_by if ordered_by is not None else self._ordered_by
-        config._separator = separator if separator is not None else self._separator
-        config._title = title if title is not None else self._title
-        config._ending = ending if ending is not None else self._ending
-        config._bypass = bypass if bypass is not None else self._bypass
-        config._surname = surname if surname is not None else self._surname
+        config = Config._intern(
+            self._gen_name(name),
+            ordered_by if ordered_by is not None else self._ordered_by,
+            separator if separator is not None else self._separator,
+            title if title is not None else self._title,
+            ending if ending is not None else self._ending,
+            bypass if bypass is not None else self._bypass,
+            surname if surname is not None else self._surname,
+        )
+        Config._cache[config.name] = config
         return config
 
     def clone(self) -> 'Config':
         return self.copy_with()
 
-    def reset(self) -> None:
-        self._ordered_by = 'first_name'
-        self._separator = ' '
-        self._title = 'uk'
-        self._ending = False
-        self._bypass = True
-        self._surname = 'father'
-        Config._cache[self._name] = self
+    def reset(self) -> 'Config':
+        """Returns the default configuration registered under the same name."""
+        config = Config._intern(self._name, 'first_name', ' ', 'uk', False, True, 'father')
+        Config._cache[self._name] = config
+        return config
+
+    def update_order(self, order: str) -> 'Config':
+        """Returns a snapshot of this configuration using another name order.
 
-    def update_order(self, order: str) -> None:
+        Unlike `merge()`, this does not change what is registered under the name.
+        """
         if order and order != self._ordered_by:
-            self._assert_cache()
-            Config._cache[self._name]._ordered_by = order
+            return Config._intern(
+                self._name, order, self._separator, self._title, self._ending, self._bypass, self._surname
+            )
+        return self
 
     def to_dict(self):
         return {
@@ -147,9 +196,31 @@ class Config:
             'surname': self._surname,
         }
 
+    @classmethod
+    def _intern(
+        cls, name: str, ordered_by: str, separator: str, title: str, ending: bool, bypass: bool, surname: str
+    ) -> 'Config':
+        key = (name, ordered_by, separator, title, ending, bypass, surname)
+        config = cls._interned.get(key)
+        if config is None:
+            instance = object.__new__(cls)
+            instance._assign(*key)
+            config = cls._interned.setdefault(key, instance)
+        return config
+
+    def _assign(
+        self, name: str, ordered_by: str, separator: str, title: str, ending: bool, bypass: bool, surname: str
+    ) -> None:
+        assign = object.__setattr__
+        assign(self, '_name', name)
+        assign(self, '_ordered_by', ordered_by)
+        assign(self, '_separator', separator)
+        assign(self, '_title', title)
+        assign(self, '_ending', ending)
+        assign(self, '_bypass', bypass)
+        assign(self, '_surname', surname)
+        assign(self, '_key', (name, ordered_by, separator, title, ending, bypass, surname))
+        assign(self, '_hash', hash(self._key))
+
     def _gen_name(self, name: str) -> str:
         return name if name != self._name and name not in Config._cache else self._gen_name(f'{name}_copy')
-
-    def _assert_cache(self) -> None:
-        if self._name not in Config._cache:
-            Config._cache[self._name] = self
@@ -68,6 +68,11 @@ class NameError(Exception):
     def __repr__(self) -> str:
         return f'<{self.name}>'
 
+    def __reduce__(self):
+        # The subclasses do not share the same constructor, so errors are rebuilt
+        # from their state when crossing process boundaries.
+        return _rebuild, (self.__class__, self.__dict__)
+
 
 class InputError(NameError):
     def __init__(self, source: _NameSource, message: Optional[str] = None):
@@ -118,3 +123,9 @@ class UnknownError(NameError):
         if self.origin:
             report = f'{report}\n{self.origin}'
         return report
+
+
+def _rebuild(cls: type, state: dict) -> NameError:
+    error = cls.__new__(cls)
+    error.__dict__.update(state)
+    return error
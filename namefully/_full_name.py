@@ -1,12 +1,36 @@
-from typing import Any, Iterator, List, Mapping, Optional, Sequence, Union
+import functools
+import struct
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 from ._config import Config
 from ._errors import NameError
 from ._name import FirstName, LastName, Name
+from ._types import Separator, _Surname
 from ._validators import Validators
 
 __all__ = ['FullName']
 
+# The binary layout of a full name (see `FullName.to_bytes()`):
+# - a header: format version, config flags, separator, role flags, count of extra
+#   first names and count of middle names (1 byte each);
+# - the length in bytes of every string field (2 bytes each, little-endian);
+# - the string fields in UTF-8: the config name, the first names, the middle names,
+#   the last name, then the mother's surname, the prefix and the suffix if flagged.
+_BINARY_VERSION = 1
+_HEADER = struct.Struct('<6B')
+
+# Config flags.
+_LAST_NAME_ORDER, _US_TITLE, _ENDING, _BYPASS = 1, 2, 4, 8
+_SURNAME_SHIFT = 4
+
+# Role flags.
+_HAS_PREFIX, _HAS_SUFFIX, _HAS_MOTHER = 1, 2, 4
+_FORMAT_SHIFT = 3
+_EXTRA_FIELDS = [bin(flags).count('1') for flags in range(8)]
+
+_SEPARATORS = Separator.tokens()
+_SURNAMES = {surname: index for index, surname in enumerate(_Surname)}
+
 
 class FullName:
     """
@@ -26,11 +50,13 @@ class FullName:
     behaviors related to that name handling.
     """
 
+    __slots__ = ('_config', '_prefix', '_first_name', '_middle_name', '_last_name', '_suffix', '__index')
+
     _first_name: FirstName
     _last_name: LastName
 
-    def __init__(self, **options: Any):
-        self._config = Config.merge(**options)
+    def __init__(self, *, config: Optional[Config] = None, **options: Any):
+        self._config = config if config is not None else Config.merge(**options)
         self._prefix: Optional[Name] = None
         self._middle_name: List[Name] = []
         self._suffix: Optional[Name] = None
@@ -48,6 +74,40 @@ class FullName:
         self.__index += 1
         return names[self.__index]
 
+    def _key(self) -> tuple:
+        """The parts identifying this name, tagged by their position (and role), whatever the config."""
+        first_name, last_name = self._first_name, self._last_name
+        return (
+            self._prefix,
+            first_name,
+            tuple(first_name._more),
+            tuple(self._middle_name),
+            last_name,
+            last_name._mother,
+            self._suffix,
+        )
+
+    def _version(self) -> int:
+        """How many times the parts of this name were edited (e.g., by `caps()`) since their creation."""
+        first_name, last_name = self._first_name, self._last_name
+        version = first_name._version + last_name._version
+        for name in first_name._more:
+            version += name._version
+        for name in self._middle_name:
+            version += name._version
+        if last_name._mother is not None:
+            version += last_name._mother._version
+        if self._prefix is not None:
+            version += self._prefix._version
+        if self._suffix is not None:
+            version += self._suffix._version
+        return version
+
+    def __reduce__(self):
+        # The config is re-interned by the receiving process; the parts are not validated again.
+        middle_name = tuple(self._middle_name)
+        return _rebuild, (self._config, self._first_name, self._last_name, self._prefix, middle_name, self._suffix)
+
     @property
     def prefix(self) -> Optional[Name]:
         return self._prefix
@@ -144,6 +204,86 @@ class FullName:
             names.append(self._suffix)
         return tuple(names)
 
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the name parts, their roles and the configuration into a compact binary form.
+
+        Use `FullName.from_bytes()` to decode it.
+        """
+        config, first, last, middles = self._config, self._first_name, self._last_name, self._middle_name
+        config_flags = (
+            (config.ordered_by == 'last_name') * _LAST_NAME_ORDER
+            | (config.title == 'us') * _US_TITLE
+            | config.ending * _ENDING
+            | config.bypass * _BYPASS
+            | _SURNAMES[config.surname] << _SURNAME_SHIFT
+        )
+        mother = last._mother
+        role_flags = _SURNAMES[last.format] << _FORMAT_SHIFT
+        fields = [config.name.encode(), first.value.encode()]
+        fields.extend([name.value.encode() for name in first._more])
+        fields.extend([name.value.encode() for name in middles])
+        fields.append(last.value.encode())
+        if mother is not None:
+            role_flags |= _HAS_MOTHER
+            fields.append(mother.value.encode())
+        if self._prefix is not None:
+            role_flags |= _HAS_PREFIX
+            fields.append(self._prefix.value.encode())
+        if self._suffix is not None:
+            role_flags |= _HAS_SUFFIX
+            fields.append(self._suffix.value.encode())
+
+        if config.separator not in _SEPARATORS:
+            message = f'cannot encode the separator {config.separator!r}; expecting one of {_SEPARATORS}'
+            raise NameError.not_allowed(source=self._first_name.value, operation='to_bytes', message=message)
+        lengths = [len(field) for field in fields]
+        if max(lengths) > 0xFFFF:
+            raise NameError.input(source=self._first_name.value, message='a name part cannot exceed 65535 bytes')
+        if len(first._more) > 0xFF or len(middles) > 0xFF:
+            raise NameError.input(source=self._first_name.value, message='cannot encode more than 255 extra names')
+        header = _HEADER.pack(
+            _BINARY_VERSION,
+            config_flags,
+            _SEPARATORS.index(config.separator),
+            role_flags,
+            len(first._more),
+            len(middles),
+        )
+        return header + _lengths(len(fields)).pack(*lengths) + b''.join(fields)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> 'FullName':
+        """
+        Decodes a full name encoded by `to_bytes()`.
+
+        The name parts were already validated when encoded, so they are not
+        validated again.
+        """
+        full_name, end = _decode(data, 0)
+        if end != len(data):
+            raise NameError.input(source=repr(bytes(data[:32])), message='unexpected data after the full name')
+        return full_name
+
+    @classmethod
+    def _assemble(
+        cls,
+        config: Config,
+        first_name: FirstName,
+        last_name: LastName,
+        prefix: Optional[Name] = None,
+        middle_name: Sequence[Name] = (),
+        suffix: Optional[Name] = None,
+    ) -> 'FullName':
+        """Puts together name parts known to be valid, skipping the setters' validation."""
+        full_name = cls(config=config)
+        full_name._prefix = prefix
+        full_name._first_name = first_name
+        full_name._middle_name = list(middle_name)
+        full_name._last_name = last_name
+        full_name._suffix = suffix
+        return full_name
+
     @staticmethod
     def parse(names: Mapping[str, str], **options: Any) -> 'FullName':
         try:
@@ -162,3 +302,64 @@ class FullName:
                 message='could not parse Mapping[str, str] content',
                 error=exc,
             ) from exc
+
+
+def _rebuild(
+    config: Config,
+    first_name: FirstName,
+    last_name: LastName,
+    prefix: Optional[Name],
+    middle_name: Sequence[Name],
+    suffix: Optional[Name],
+) -> FullName:
+    return FullName._assemble(config, first_name, last_name, prefix, middle_name, suffix)
+
+
+@functools.lru_cache(maxsize=None)
+def _lengths(count: int) -> struct.Struct:
+    return struct.Struct(f'<{count}H')
+
+
+def _decode(data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[FullName, int]:
+    """Decodes a full name starting at `offset`; returns it with the offset right after it."""
+    begin = offset
+    try:
+        version, config_flags, separator, role_flags, more, middles = _HEADER.unpack_from(data, offset)
+        if version != _BINARY_VERSION:
+            raise NameError.input(source=version, message=f'unsupported binary format version {version}')
+
+        lengths = _lengths(3 + more + middles + _EXTRA_FIELDS[role_flags & 7])
+        offset += _HEADER.size
+        values = []
+        start = offset + lengths.size
+        for length in lengths.unpack_from(data, offset):
+            values.append(str(data[start : start + length], 'utf-8'))
+            start += length
+        if start > len(data):
+            raise IndexError(start)
+        if not all(values[1:]):
+            raise ValueError('empty name part')
+        offset = start
+
+        config = Config._intern(
+            values[0],
+            'last_name' if config_flags & _LAST_NAME_ORDER else 'first_name',
+            _SEPARATORS[separator],
+            'us' if config_flags & _US_TITLE else 'uk',
+            bool(config_flags & _ENDING),
+            bool(config_flags & _BYPASS),
+            _Surname[config_flags >> _SURNAME_SHIFT & 3],
+        )
+        index = 2 + more + middles
+        first = FirstName._unchecked(*values[1 : 2 + more])
+        middle_name = [Name._unchecked(value, 'middle_name') for value in values[2 + more : index]]
+        extras = iter(values[index + 1 :])
+        mother = next(extras) if role_flags & _HAS_MOTHER else None
+        last = LastName._unchecked(values[index], mother, _Surname[role_flags >> _FORMAT_SHIFT & 3])
+        prefix = Name._unchecked(next(extras), 'prefix') if role_flags & _HAS_PREFIX else None
+        suffix = Name._unchecked(next(extras), 'suffix') if role_flags & _HAS_SUFFIX else None
+    except NameError:
+        raise
+    except Exception as exc:
+        raise NameError.input(source=repr(bytes(data[begin : begin + 32])), message='invalid binary name') from exc
+    return FullName._assemble(config, first, last, prefix, middle_name, suffix), offset
@@ -0,0 +1,233 @@
+import functools
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from . import _batch
+from ._config import Config
+from ._namefully import Namefully
+from ._parser import (
+    NamaParser,
+    Parser,
+    SequentialNameParser,
+    SequentialStringParser,
+    StringParser,
+    _AffixedStringParser,
+)
+from ._validators import (
+    FirstNameValidator,
+    LastNameValidator,
+    MiddleNameValidator,
+    NamaValidator,
+    NameValidator,
+    NamonValidator,
+    SequenceValidator,
+    SequentialNameValidator,
+)
+
+__all__ = ['instrument', 'stats']
+
+# Computes the stage a call is recorded under, from the call arguments.
+_KeyFn = Callable[[tuple, dict], str]
+
+# What is patched: the owner (class or module), the function, the kind of stage and its key.
+_Target = Tuple[Any, str, str, _KeyFn]
+
+# Custom format patterns are free text: only the first ones get a stage of their
+# own, the next ones share one, so that the counters stay bounded.
+_MAX_PATTERNS = 64
+_OTHER_PATTERNS = 'format.<other>'
+
+_lock = threading.Lock()
+_counters: Dict[str, List[float]] = {}  # stage -> [calls, errors, seconds]
+_patterns: Dict[str, str] = {}  # format pattern -> stage
+_originals: Dict[Tuple[Any, str], Any] = {}
+_active = threading.local()  # the kinds of stages being recorded in the current thread.
+
+
+def instrument(enabled: bool = True) -> None:
+    """
+    Turns the instrumentation of the hot paths on or off.
+
+    Once enabled, call counts, errors and cumulative times are recorded per stage:
+    - 'parse.<Parser>': parsing by parser class;
+    - 'validate.<Validator>[.<check>]': validation by validator (failed checks count
+      as errors);
+    - 'config.merge': the resolution of the options into a `Config`;
+    - 'format.<pattern>': `Namefully.format()` and the formatters compiled by
+      `Namefully.compile_format()` by pattern; past 64 distinct patterns, the next
+      ones are recorded together as 'format.<other>';
+    - 'compile.format': the compilation of the patterns by `compile_format()`;
+    - 'flatten.<by>': `Namefully.flatten()` (and `zip()`) by strategy;
+    - 'batch.<function>': the batch operations, e.g. `format_many()`.
+
+    Only the outermost call of a kind is recorded: a parser delegating to another
+    parser, or a validator to other validators, counts once, under the first one.
+
+    The hot paths are wrapped in place, for the whole process (all threads), and
+    only while enabled: turning the instrumentation off puts the original functions
+    back, so there is no overhead at all when disabled. The counters are kept until
+    `stats(reset=True)`.
+    """
+    with _lock:
+        if enabled and not _originals:
+            for owner, attr, kind, key in _targets():
+                _patch(owner, attr, kind, key)
+        elif not enabled:
+            package = sys.modules[__package__]
+            for (owner, attr), original in _originals.items():
+                # The package keeps the functions it exports once looked up, wrapped or not.
+                if package.__dict__.get(attr) is owner.__dict__[attr]:
+                    setattr(package, attr, original)
+                setattr(owner, attr, original)
+            _originals.clear()
+
+
+def stats(reset: bool = False) -> Dict[str, Dict[str, float]]:
+    """
+    Returns the recorded counters per stage: calls, errors and time (in seconds).
+
+    Example:
+    --------
+    >>> instrument()
+    >>> Namefully('John Smith').format('L, f')
+    'SMITH, John'
+    >>> stats()['format.L, f']['calls']
+    1
+    """
+    with _lock:
+        snapshot = {
+            stage: {'calls': int(calls), 'errors': int(errors), 'time': seconds}
+            for stage, (calls, errors, seconds) in sorted(_counters.items())
+        }
+        if reset:
+            _counters.clear()
+            _patterns.clear()
+    return snapshot
+
+
+def _targets() -> List[_Target]:
+    targets: List[_Target] = [
+        (Config, 'merge', 'config', _stage('config.merge')),
+        (Namefully, 'format', 'format', _format_stage),
+        (Namefully, 'compile_format', 'compile', _stage('compile.format')),
+        (Namefully, 'flatten', 'flatten', _flatten_stage),
+    ]
+    parsers = (Parser, StringParser, SequentialStringParser, SequentialNameParser, NamaParser, _AffixedStringParser)
+    for parser in parsers:
+        targets.append((parser, '_parse', 'parse', _parse_stage))
+    for function in _batch.__all__:
+        targets.append((_batch, function, 'batch', _stage(f'batch.{function}')))
+
+    validators = (
+        NameValidator,
+        NamonValidator,
+        FirstNameValidator,
+        MiddleNameValidator,
+        LastNameValidator,
+        NamaValidator,
+        SequenceValidator,
+    )
+    for validator in validators:
+        targets.append((validator, 'check', 'validate', _stage(f'validate.{validator.__name__}')))
+    targets.append((NamaValidator, 'check_keys', 'validate', _stage('validate.NamaValidator.keys')))
+    for method in ('check_index', 'check_as_str', 'check_as_name'):
+        stage = f"validate.SequentialNameValidator.{method.replace('check_', '')}"
+        targets.append((SequentialNameValidator, method, 'validate', _stage(stage)))
+    return targets
+
+
+def _stage(name: str) -> _KeyFn:
+    return lambda *_: name
+
+
+def _parse_stage(args: tuple, _kwargs: dict) -> str:
+    return f'parse.{type(args[0]).__name__}'
+
+
+def _format_stage(args: tuple, kwargs: dict) -> str:
+    return _pattern_stage(kwargs['pattern'] if 'pattern' in kwargs else args[1])
+
+
+def _pattern_stage(pattern: Any) -> str:
+    pattern = str(pattern)
+    stage = _patterns.get(pattern)
+    if stage is None:
+        with _lock:
+            if len(_patterns) < _MAX_PATTERNS:
+                stage = _patterns.setdefault(pattern, f'format.{pattern}')
+            else:
+                stage = _patterns.get(pattern, _OTHER_PATTERNS)
+    return stage
+
+
+def _flatten_stage(args: tuple, kwargs: dict) -> str:
+    by = kwargs.get('by', args[2] if len(args) > 2 else 'middle_name')
+    return f'flatten.{by}'
+
+
+def _patch(owner: Any, attr: str, kind: str, key: _KeyFn) -> None:
+    original = owner.__dict__[attr]
+    decorator: Optional[Callable] = type(original) if isinstance(original, (classmethod, staticmethod)) else None
+    fn = original.__func__ if decorator is not None else original
+    # Validators report failures as results rather than exceptions.
+    failed = attr.startswith('check')
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        kinds = _active_kinds()
+        if kind in kinds:  # nested in a call of the same kind, which gets the whole time.
+            return fn(*args, **kwargs)
+        kinds.add(kind)
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            _record(key(args, kwargs), time.perf_counter() - start, True)
+            raise
+        finally:
+            kinds.discard(kind)
+        _record(key(args, kwargs), time.perf_counter() - start, failed and not result)
+        if kind == 'compile':  # the compiled formatter is then recorded like `format()`.
+            return _recorded_formatter(result, _pattern_stage(kwargs['pattern'] if 'pattern' in kwargs else args[0]))
+        return result
+
+    _originals[(owner, attr)] = original
+    setattr(owner, attr, decorator(wrapper) if decorator is not None else wrapper)
+    package = sys.modules[__package__]
+    if package.__dict__.get(attr) is original:
+        setattr(package, attr, wrapper)
+
+
+def _recorded_formatter(formatter: Callable[[Namefully], str], stage: str) -> Callable[[Namefully], str]:
+    @functools.wraps(formatter)
+    def recorded(name: Namefully) -> str:
+        start = time.perf_counter()
+        try:
+            result = formatter(name)
+        except Exception:
+            _record(stage, time.perf_counter() - start, True)
+            raise
+        _record(stage, time.perf_counter() - start, False)
+        return result
+
+    return recorded
+
+
+def _active_kinds() -> Set[str]:
+    try:
+        return _active.kinds
+    except AttributeError:
+        kinds = _active.kinds = set()
+        return kinds
+
+
+def _record(stage: str, elapsed: float, error: bool) -> None:
+    with _lock:
+        counters = _counters.get(stage)
+        if counters is None:
+            counters = _counters[stage] = [0, 0, 0.0]
+        counters[0] += 1
+        counters[1] += error
+        counters[2] += elapsed
@@ -0,0 +1,118 @@
+import mmap
+import os
+from typing import Any, Iterator, Tuple, Union
+
+from ._errors import NameError
+from ._namefully import Namefully
+from ._types import Separator
+
+__all__ = ['read_lines', 'read_names']
+
+# Lines are decoded by blocks of about this size, ending on a record boundary.
+_BLOCK = 1024 * 1024
+
+# Pages already scanned are handed back to the OS by windows of this size.
+_WINDOW = 8 * 1024 * 1024
+
+_Path = Union[str, 'os.PathLike[str]']
+
+
+def read_lines(path: _Path, *, encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Reads the non-blank lines of a newline-delimited file through a memory map.
+
+    The record boundaries are found directly in the mapped buffer, which is then
+    decoded block by block (from slices of the buffer, without intermediate bytes
+    copies) as the lines are consumed. Pages already scanned are released as the
+    reading goes, so that the memory used stays about the same whatever the size
+    of the file.
+
+    The encoding must keep the newline a single byte (e.g., UTF-8, Latin-1).
+    Trailing carriage returns and surrounding whitespace are stripped.
+    """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            _advise(buffer, 'MADV_SEQUENTIAL')
+            view = memoryview(buffer)
+            try:
+                start, released = 0, 0
+                while start < size:
+                    end = _boundary(buffer, start, size)
+                    for line in str(view[start:end], encoding).split('\n'):
+                        line = line.strip()
+                        if line:
+                            yield line
+                    start = end
+                    if start - released >= _WINDOW:
+                        released = _release(buffer, released, start)
+            finally:
+                view.release()
+
+
+def read_names(
+    path: _Path,
+    *,
+    encoding: str = 'utf-8',
+    separator: Union[str, Tuple[str, str]] = ' ',
+    **options: Any,
+) -> Iterator[Namefully]:
+    """
+    Parses the names of a newline-delimited file, one name per line.
+
+    Lines are read with `read_lines()` and parsed with `Namefully.parse_many()`,
+    which accepts the remaining options (e.g., `ordered_by`, `pool`, `lazy`).
+
+    Args:
+        path: the file to read.
+        encoding: the encoding of the file; the newline must be a single byte.
+        separator: how the name parts of a line are separated: a token (e.g., ',')
+            or its name (e.g., 'comma').
+
+    Example:
+    --------
+    >>> for name in read_names('names.csv', separator='comma'):
+    ...     print(name.short)
+    """
+    return Namefully.parse_many(read_lines(path, encoding=encoding), separator=_token(separator), **options)
+
+
+def _token(separator: Union[str, Tuple[str, str]]) -> str:
+    if isinstance(separator, tuple):
+        separator = separator[1]
+    elif separator in Separator.all():
+        separator = Separator.all()[separator][1]
+    if separator not in Separator.tokens():
+        raise NameError.not_allowed(
+            source=separator, operation='read_names', message=f'expecting one of {Separator.tokens()}'
+        )
+    return separator
+
+
+def _boundary(buffer: mmap.mmap, start: int, size: int) -> int:
+    """Finds the end of the next block: right after the last newline of the block."""
+    end = start + _BLOCK
+    if end >= size:
+        return size
+    boundary = buffer.rfind(b'\n', start, end)
+    if boundary < 0:  # a line longer than a block.
+        boundary = buffer.find(b'\n', end)
+        if boundary < 0:
+            return size
+    return boundary + 1
+
+
+def _advise(buffer: mmap.mmap, option: str, *args: int) -> None:
+    # `madvise()` is only available on some platforms (and Python 3.8+).
+    if hasattr(buffer, 'madvise') and hasattr(mmap, option):
+        buffer.madvise(getattr(mmap, option), *args)
+
+
+def _release(buffer: mmap.mmap, start: int, end: int) -> int:
+    """Lets the OS drop the pages in [start, end) and returns where the next release starts."""
+    end -= end % mmap.PAGESIZE
+    if end > start:
+        _advise(buffer, 'MADV_DONTNEED', start, end - start)
+    return end
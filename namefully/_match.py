@@ -0,0 +1,284 @@
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ._errors import NameError
+from ._full_name import FullName
+from ._namefully import Namefully
+from ._parallel import _run
+from ._phonetic import _ENCODERS, _fold
+
+__all__ = ['levenshtein', 'jaro_winkler', 'NameMatcher']
+
+# How much each field weighs in the score of a pair of names.
+_FIRST_WEIGHT = 0.4
+_LAST_WEIGHT = 0.6
+
+# The Winkler boost only applies to strings similar enough already.
+_BOOST_THRESHOLD = 0.7
+
+# A name prepared for matching: its normalized first name and surnames.
+_Fields = Tuple[str, Tuple[str, ...]]
+
+# Similarity in [0, 1] of two strings; 0 as soon as it cannot reach the minimum.
+_Similarity = Callable[[str, str, float], float]
+
+
+def levenshtein(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Computes the edit distance between two strings: the least number of single
+    character insertions, deletions or substitutions turning one into the other.
+
+    With `max_distance`, only a band of that width around the diagonal is
+    computed, and the computation stops as soon as the distance exceeds it;
+    `max_distance + 1` is returned then.
+    """
+    if a == b:
+        return 0
+    if len(a) > len(b):
+        a, b = b, a
+    # The common prefix and suffix do not change the distance.
+    start, end_a, end_b = 0, len(a), len(b)
+    while start < end_a and a[start] == b[start]:
+        start += 1
+    while end_a > start and a[end_a - 1] == b[end_b - 1]:
+        end_a, end_b = end_a - 1, end_b - 1
+    a, b = a[start:end_a], b[start:end_b]
+
+    size_a, size_b = len(a), len(b)
+    limit = size_b if max_distance is None else max_distance
+    above = limit + 1
+    if size_b - size_a > limit:
+        return above
+    if not a:
+        return size_b
+
+    previous = [j if j <= limit else above for j in range(size_b + 1)]
+    for i in range(1, size_a + 1):
+        char = a[i - 1]
+        current = [above] * (size_b + 1)
+        if i <= limit:
+            current[0] = i
+        lowest = current[0]
+        for j in range(max(1, i - limit), min(size_b, i + limit) + 1):
+            cost = previous[j - 1] + (char != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if cost > above:
+                cost = above
+            current[j] = cost
+            if cost < lowest:
+                lowest = cost
+        if lowest > limit:  # every path is already too long.
+            return above
+        previous = current
+    return previous[size_b] if previous[size_b] <= limit else above
+
+
+def jaro_winkler(a: str, b: str, prefix_weight: float = 0.1) -> float:
+    """
+    Computes the Jaro-Winkler similarity of two strings, between 0 (nothing in
+    common) and 1 (the same), which favors strings starting alike.
+    """
+    similarity = _jaro(a, b)
+    if similarity <= _BOOST_THRESHOLD:
+        return similarity
+    prefix = 0
+    for char_a, char_b in zip(a[:4], b[:4]):
+        if char_a != char_b:
+            break
+        prefix += 1
+    return similarity + prefix * prefix_weight * (1 - similarity)
+
+
+class NameMatcher:
+    """
+    Finds the names of a reference list that match a name, with a similarity score.
+
+    To avoid comparing every pair of names, only the names of the same block are
+    compared: those with the same first initial and the same phonetic code of a
+    surname (the father's or the mother's). A pair is then scored per field,
+    first name and surname, on names without case nor accents. A pair is dropped
+    as soon as it can no longer reach the threshold: e.g., the first names are
+    not compared when the surnames are too far apart already.
+
+    Args:
+        names: the reference names; a match refers to its position in this list.
+        metric: how fields are compared, 'jaro_winkler' or 'levenshtein' (the edit
+            distance relative to the longest field).
+        threshold: the lowest score of a match, between 0 and 1.
+        blocking: the phonetic encoder of the surnames, 'soundex' or 'metaphone'.
+
+    Example:
+    --------
+    >>> matcher = NameMatcher(Namefully.parse_many(['John Smith', 'Jane Doe']))
+    >>> matcher.match(Namefully('Jon Smyth'))
+    [(0, 0.909)]
+    """
+
+    __slots__ = ('_records', '_blocks', '_similarity', '_threshold', '_encode')
+
+    def __init__(
+        self,
+        names: Iterable[Union[Namefully, FullName]],
+        *,
+        metric: str = 'jaro_winkler',
+        threshold: float = 0.85,
+        blocking: str = 'soundex',
+    ) -> None:
+        for option, choices in ((metric, _METRICS), (blocking, _ENCODERS)):
+            if option not in choices:
+                message = f'expecting one of {list(choices)}'
+                raise NameError.not_allowed(source=option, operation='NameMatcher', message=message)
+        self._similarity = _METRICS[metric]
+        self._threshold = threshold
+        self._encode = _ENCODERS[blocking]
+        self._records: List[_Fields] = []
+        self._blocks: Dict[str, List[int]] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, name: Union[Namefully, FullName]) -> int:
+        """Adds a reference name and returns its position."""
+        record = len(self._records)
+        fields = _fields(name)
+        self._records.append(fields)
+        blocks = self._blocks
+        for key in self._keys(fields):
+            block = blocks.get(key)
+            if block is None:
+                blocks[key] = [record]
+            else:
+                block.append(record)
+        return record
+
+    def match(self, name: Union[Namefully, FullName], limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Finds the reference names matching a name, as `(position, score)` pairs from
+        the best match; the scores are rounded to 3 decimals.
+        """
+        matches = self._match(_fields(name))
+        return matches[:limit] if limit is not None else matches
+
+    def match_many(
+        self,
+        names: Iterable[Union[Namefully, FullName]],
+        *,
+        workers: Optional[int] = 1,
+        chunksize: Optional[int] = None,
+        mp_context: Any = None,
+    ) -> Iterator[List[Tuple[int, float]]]:
+        """
+        Matches many names, yielding their matches in the same order as the input.
+
+        With several `workers`, names are matched across a pool of processes (all
+        the CPUs if `None`); the reference names are sent once to every worker,
+        then only the normalized fields of the names and their matches travel.
+        """
+        fields = (_fields(name) for name in names)
+        workers = max(1, workers or os.cpu_count() or 1)
+        if workers == 1:
+            return map(self._match, fields)
+        return _run(_match_chunk, fields, (), workers, chunksize, mp_context, _set_worker_matcher, (self,))
+
+    def _keys(self, fields: _Fields) -> List[str]:
+        first, surnames = fields
+        encode = self._encode
+        return list(dict.fromkeys(f'{first[:1]} {encode(surname)}' for surname in surnames))
+
+    def _match(self, fields: _Fields) -> List[Tuple[int, float]]:
+        records, blocks, threshold, similarity = self._records, self._blocks, self._threshold, self._similarity
+        first, surnames = fields
+        # The lowest surname similarity still reaching the threshold with identical first names.
+        least_last = (threshold - _FIRST_WEIGHT) / _LAST_WEIGHT
+
+        candidates = set()
+        for key in self._keys(fields):
+            candidates.update(blocks.get(key, ()))
+
+        matches = []
+        for record in candidates:
+            other_first, other_surnames = records[record]
+            last = max(similarity(a, b, least_last) for a in surnames for b in other_surnames)
+            if last < least_last:
+                continue
+            least_first = (threshold - _LAST_WEIGHT * last) / _FIRST_WEIGHT
+            score = _LAST_WEIGHT * last + _FIRST_WEIGHT * similarity(first, other_first, least_first)
+            if score >= threshold:
+                matches.append((record, round(score, 3)))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+
+def _fields(name: Union[Namefully, FullName]) -> _Fields:
+    full_name = name._full_name if isinstance(name, Namefully) else name
+    last_name = full_name.last_name
+    surnames = [_normalize(last_name.value)]
+    if last_name._mother is not None:
+        surnames.append(_normalize(last_name._mother.value))
+    return _normalize(full_name.first_name.value), tuple(surnames)
+
+
+def _normalize(text: str) -> str:
+    # Names without Latin letters are kept as is, rather than erased.
+    return _fold(text) or text.casefold()
+
+
+def _jaro(a: str, b: str) -> float:
+    if a == b:
+        return 1.0
+    size_a, size_b = len(a), len(b)
+    if not size_a or not size_b:
+        return 0.0
+
+    window = max(max(size_a, size_b) // 2 - 1, 0)
+    taken = [False] * size_b
+    matched_a = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(i + window + 1, size_b)):
+            if not taken[j] and b[j] == char:
+                taken[j] = True
+                matched_a.append(char)
+                break
+    matches = len(matched_a)
+    if not matches:
+        return 0.0
+    matched_b = [char for char, used in zip(b, taken) if used]
+    transpositions = sum(x != y for x, y in zip(matched_a, matched_b)) // 2
+    return (matches / size_a + matches / size_b + (matches - transpositions) / matches) / 3
+
+
+def _jaro_winkler_similarity(a: str, b: str, minimum: float) -> float:
+    # At best, the shorter string matches entirely and gets the full Winkler boost.
+    shorter, longer = sorted((len(a), len(b)))
+    if longer and 0.6 * (2 + shorter / longer) / 3 + 0.4 < minimum:
+        return 0.0
+    return jaro_winkler(a, b)
+
+
+def _levenshtein_similarity(a: str, b: str, minimum: float) -> float:
+    longer = max(len(a), len(b))
+    if not longer:
+        return 1.0
+    limit = int((1 - max(minimum, 0.0)) * longer)
+    distance = levenshtein(a, b, limit)
+    return 0.0 if distance > limit else 1 - distance / longer
+
+
+_METRICS: Dict[str, _Similarity] = {'jaro_winkler': _jaro_winkler_similarity, 'levenshtein': _levenshtein_similarity}
+
+# The matcher of a worker process, set once when the worker starts.
+_worker_matcher: Optional[NameMatcher] = None
+
+
+def _set_worker_matcher(matcher: NameMatcher) -> None:
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _match_chunk(chunk: List[_Fields]) -> List[List[Tuple[int, float]]]:
+    return [_worker_matcher._match(fields) for fields in chunk]  # type: ignore
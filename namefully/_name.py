@@ -6,14 +6,22 @@ from ._utils import capitalize, decapitalize
 
 __all__ = ['Name', 'FirstName', 'LastName']
 
+# How many times any name part was edited after its creation (e.g., by `caps()`): while
+# it holds, no derived value (see `Namefully`) needs checking the versions of its parts.
+_edits = 0
+
 
 class Name:
+    __slots__ = ('_caps_range', '_type', '_namon', '_initial', '_hash', '_version')
+
     def __init__(self, value: str, *, type: str, caps_range: Optional[str] = None):
         self._caps_range = caps_range in _CapsRange and caps_range or 'initial'
         self._type = type in _Namon and type or 'first_name'
-        self.value = value
+        self._version = 0
+        self._assign(value)
         if caps_range is not None:
             self.caps(caps_range)
+            self._version = 0  # capitalizing a new name is not an edit.
 
     @property
     def initial(self) -> str:
@@ -25,9 +33,10 @@ class Name:
 
     @value.setter
     def value(self, value: str) -> None:
-        self._validate(value)
-        self._namon = value
-        self._initial = value[0]
+        global _edits
+        self._assign(value)
+        self._version += 1
+        _edits += 1
 
     @property
     def type(self) -> str:
@@ -77,6 +86,18 @@ class Name:
     def suffix(value: str, caps_range: Optional[str] = None) -> 'Name':
         return Name(value, type='suffix', caps_range=caps_range)
 
+    @classmethod
+    def _unchecked(cls, value: str, type: str) -> 'Name':
+        """Builds a name part already known to be valid (e.g., decoded), skipping the checks."""
+        name = object.__new__(cls)
+        name._caps_range = 'initial'
+        name._type = type
+        name._namon = value
+        name._initial = value[0]
+        name._hash = hash((type, value.casefold()))
+        name._version = 0
+        return name
+
     def to_str(self) -> str:
         return self._namon
 
@@ -91,6 +112,12 @@ class Name:
         self.value = decapitalize(self._namon, caps_range or self._caps_range)
         return self
 
+    def _assign(self, value: str) -> None:
+        self._validate(value)
+        self._namon = value
+        self._initial = value[0]
+        self._hash = hash((self._type, value.casefold()))
+
     def _validate(self, name: str):
         if len(name.strip()) < 2:
             raise NameError.input(source=name, message='must be 2+ characters')
@@ -102,10 +129,26 @@ class Name:
         return f'<{self._type}: {self._namon}>'
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Name) and self.value == other.value and self.type == other.type
+        return (
+            isinstance(other, Name)
+            and self._hash == other._hash
+            and self._namon == other._namon
+            and self._type == other._type
+        )
+
+    def __hash__(self) -> int:
+        # Computed when the value is set, from the role and the value without case, so that
+        # `caps()` and `decaps()` keep it: a name stays found in a set or dict it was put in.
+        return self._hash
+
+    def __reduce__(self):
+        # Only the state needed to rebuild the name travels; it is not validated again.
+        return _rebuild_name, (self._namon, self._type, self._caps_range)
 
 
 class FirstName(Name):
+    __slots__ = ('_more',)
+
     def __init__(self, value: str, *more: str):
         super().__init__(value, type='first_name')
         self._more: List[Name] = []
@@ -129,6 +172,12 @@ class FirstName(Name):
     def more(self) -> List[str]:
         return [n.value for n in self._more]
 
+    @classmethod
+    def _unchecked(cls, value: str, *more: str) -> 'FirstName':  # type: ignore
+        name = super()._unchecked(value, 'first_name')
+        name._more = [Name._unchecked(n, 'first_name') for n in more]
+        return name  # type: ignore
+
     def to_str(self, with_more=False) -> str:
         if with_more and self.has_more:
             return f"{self.value} {' '.join([n.value for n in self._more])}".strip()
@@ -157,8 +206,13 @@ class FirstName(Name):
     def copy_with(self, *, first: Optional[str] = None, more: Optional[List[str]] = None) -> 'FirstName':
         return FirstName(first or self.value, *more or self.more)
 
+    def __reduce__(self):
+        return _rebuild_first_name, (self._namon, *[name._namon for name in self._more])
+
 
 class LastName(Name):
+    __slots__ = ('_mother', 'format')
+
     def __init__(self, father: str, mother: Optional[str] = None, format: str = 'father'):
         super().__init__(father, type='last_name')
         self._mother: Optional[Name] = None
@@ -190,6 +244,15 @@ class LastName(Name):
             names.append(self._mother)
         return names
 
+    @classmethod
+    def _unchecked(  # type: ignore
+        cls, father: str, mother: Optional[str] = None, format: str = 'father'
+    ) -> 'LastName':
+        name = super()._unchecked(father, 'last_name')
+        name._mother = Name._unchecked(mother, 'last_name') if mother else None
+        name.format = format
+        return name  # type: ignore
+
     def to_str(self, format: Optional[str] = None) -> str:
         format = format in _Surname and format or self.format
         mother = self._mother and self._mother.value or ''
@@ -235,3 +298,22 @@ class LastName(Name):
         self, *, father: Optional[str] = None, mother: Optional[str] = None, format: Optional[str] = None
     ) -> 'LastName':
         return LastName(father or self.value, mother=mother or self.mother, format=format or self.format)
+
+    def __reduce__(self):
+        mother = self._mother._namon if self._mother is not None else None
+        return _rebuild_last_name, (self._namon, mother, self.format)
+
+
+# Module-level so that pickles refer to them by a short name.
+def _rebuild_name(value: str, type: str, caps_range: str) -> Name:
+    name = Name._unchecked(value, type)
+    name._caps_range = caps_range
+    return name
+
+
+def _rebuild_first_name(value: str, *more: str) -> FirstName:
+    return FirstName._unchecked(value, *more)
+
+
+def _rebuild_last_name(father: str, mother: Optional[str], format: str) -> LastName:
+    return LastName._unchecked(father, mother, format)
@@ -1,13 +1,18 @@
 import re
-from typing import Iterator, List, Mapping, Optional, Sequence, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
+from . import _name
 from ._config import Config
 from ._constants import ALLOWED_TOKENS
-from ._errors import NameError
+from ._errors import NameError, NotAllowedError
 from ._full_name import FullName
 from ._name import FirstName, LastName, Name
 from ._parser import NamaParser, Parser, SequentialNameParser, SequentialStringParser, StringParser
-from ._utils import NameIndex, decapitalize, toggle_case
+from ._pool import NamePool
+from ._utils import _UNIT_SEP, NameIndex, _collate, decapitalize, toggle_case
+
+__all__ = ['Namefully']
 
 
 class Namefully(object):
@@ -44,6 +49,10 @@ class Namefully(object):
 
     To use this utility, simply create an instance of `Namefully` and the rest will follow.
 
+    When many instances end up discarded unread, use `lazy=True`: the raw names and
+    options are kept as is, and parsing only happens on first access to the name
+    (or on `resolve()`). In that case, parsing errors surface at that point.
+
     Terminologies used throughout the library:
     - namon: a single piece of a name (e.g., first name)
     - nama: two or more pieces of a name (e.g., first name + last name)
@@ -51,6 +60,8 @@ class Namefully(object):
     Happy name handling 😊!
     """
 
+    __slots__ = ('_memo', '_stamp', '_version', '_parsed', '_pending', '_hash', '__index')
+
     def __init__(
         self,
         names: Union[str, Sequence[str], Sequence[Name], Mapping[str, str], FullName, Parser],
@@ -62,8 +73,15 @@ class Namefully(object):
         ending: bool = False,
         bypass: bool = True,
         surname: str = 'father',
+        lazy: bool = False,
     ) -> None:
-        self._full_name = self.__to_parser(names).parse(
+        self._memo: Optional[Dict[str, Any]] = None
+        self._stamp = self._version = 0
+        self._parsed: Optional[FullName] = None
+        self._pending: Optional[Tuple[Any, Config, Optional[NamePool]]] = None
+        self._hash: Optional[int] = None
+
+        options = dict(
             name=context,
             ordered_by=ordered_by,
             separator=separator,
@@ -72,6 +90,10 @@ class Namefully(object):
             bypass=bypass,
             surname=surname,
         )
+        if lazy:
+            self._pending = (names, Config.merge(**options), None)
+        else:
+            self._parsed = _to_parser(names).parse(**options)
 
     def __str__(self) -> str:
         return self.full
@@ -80,7 +102,53 @@ class Namefully(object):
         return f'<Namefully: {self.full}>'
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Namefully) and self.full == other.full
+        """Whether both names have the same parts in the same roles, and the same name order."""
+        if self is other:
+            return True
+        return (
+            isinstance(other, Namefully)
+            and hash(self) == hash(other)
+            and self._full_name._config.ordered_by == other._full_name._config.ordered_by
+            and self._full_name._key() == other._full_name._key()
+        )
+
+    def __hash__(self) -> int:
+        # Computed once, on first use. Changing the case of a part keeps its hash, but
+        # renaming a part (setting its value) changes it: the hash is computed again.
+        if self._stamp != _name._edits:
+            self._refresh()
+        value = self._hash
+        if value is None:
+            value = self._hash = hash((self._full_name._key(), self._full_name._config.ordered_by))
+        return value
+
+    def __reduce__(self):
+        # Lazy names travel unparsed (without their pool, which is per process); the
+        # derived values are recomputed on demand.
+        if self._parsed is None and self._pending is not None:
+            names, config, _ = self._pending
+            return _rebuild, (None, names, config)
+        return _rebuild, (self._full_name,)
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Namefully):
+            return NotImplemented
+        return self.sort_key() < other.sort_key()
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, Namefully):
+            return NotImplemented
+        return self.sort_key() <= other.sort_key()
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, Namefully):
+            return NotImplemented
+        return self.sort_key() > other.sort_key()
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, Namefully):
+            return NotImplemented
+        return self.sort_key() >= other.sort_key()
 
     def __len__(self) -> int:
         """The length of the full name."""
@@ -109,6 +177,54 @@ class Namefully(object):
         except Exception:
             return None
 
+    @staticmethod
+    def parse_many(
+        names: Iterable[Union[str, Sequence[str], Sequence[Name], Mapping[str, str], FullName, Parser]],
+        *,
+        context: Optional[str] = None,
+        ordered_by: str = 'first_name',
+        separator: str = ' ',
+        title: str = 'uk',
+        ending: bool = False,
+        bypass: bool = True,
+        surname: str = 'father',
+        pool: Optional[NamePool] = None,
+        lazy: bool = False,
+    ) -> Iterator['Namefully']:
+        """
+        Lazily parses many raw names sharing the same set of options.
+
+        The configuration is resolved once for the whole batch, and the parser
+        dispatch is only redone when the type of the raw input changes. Names are
+        yielded as they are consumed, in the same order as the input.
+
+        If a `NamePool` is given, repeated first, middle and last names are shared
+        across the parsed names instead of being allocated for each of them.
+
+        Raises a `NameError` for the first name that cannot be parsed, unless
+        `lazy` is set: names are then only parsed on first access (see `Namefully`).
+        """
+        config = Config.merge(
+            name=context,
+            ordered_by=ordered_by,
+            separator=separator,
+            title=title,
+            ending=ending,
+            bypass=bypass,
+            surname=surname,
+        )
+        if lazy:
+            for raw in names:
+                yield Namefully._deferred(raw, config, pool)
+            return
+
+        kind, factory = None, None
+        for raw in names:
+            if type(raw) is not kind:
+                kind, factory = type(raw), _parser_factory(raw)
+            parser = factory(raw) if factory is not None else _to_parser(raw)
+            yield Namefully._of(parser._parse(config, pool))
+
     @staticmethod
     def only(
         first: Union[str, FirstName],
@@ -141,6 +257,83 @@ class Namefully(object):
         full_name.suffix = suffix
         return Namefully(full_name)
 
+    @classmethod
+    def _of(cls, full_name: FullName) -> 'Namefully':
+        """Wraps an already parsed full name without going through a parser."""
+        instance = cls.__new__(cls)
+        instance._memo = None
+        instance._stamp = instance._version = 0
+        instance._parsed = full_name
+        instance._pending = None
+        instance._hash = None
+        return instance
+
+    @classmethod
+    def _deferred(cls, names: Any, config: Config, pool: Optional[NamePool] = None) -> 'Namefully':
+        """Holds on to raw names to be parsed on first access."""
+        instance = cls.__new__(cls)
+        instance._memo = None
+        instance._stamp = instance._version = 0
+        instance._parsed = None
+        instance._pending = (names, config, pool)
+        instance._hash = None
+        return instance
+
+    @property
+    def _full_name(self) -> FullName:
+        full_name = self._parsed
+        if full_name is None:
+            self.resolve()
+            full_name = self._parsed
+        return full_name  # type: ignore
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the raw names have been parsed already."""
+        return self._parsed is not None
+
+    def resolve(self) -> 'Namefully':
+        """
+        Parses the raw names of a lazy instance right away.
+
+        This is a no-op for names already parsed. Otherwise, parsing errors are
+        raised here, and again on every later access until the parsing succeeds.
+        """
+        if self._parsed is None and self._pending is not None:
+            names, config, pool = self._pending
+            self._parsed = _to_parser(names)._parse(config, pool)
+            self._pending = None
+        return self
+
+    def _cached(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Computes a derived value once, then serves it from the instance memo.
+
+        The memo is dropped once a part of this name is edited (e.g., by `caps()`),
+        since the values derived from that part would be stale.
+        """
+        if self._stamp != _name._edits:
+            self._refresh()
+        memo = self._memo
+        if memo is None:  # allocated on first use only, as many names are never formatted.
+            memo = self._memo = {}
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = compute()
+            return value
+
+    def _refresh(self) -> None:
+        """Drops the memo and the hash if a part of this name was edited since they were computed.
+
+        Only called once some name part was edited, whichever name it belongs to.
+        """
+        version = self._full_name._version()
+        if version != self._version:
+            self._memo = None
+            self._hash = None
+            self._version = version
+        self._stamp = _name._edits
+
     @property
     def config(self) -> Config:
         return self._full_name.config
@@ -148,7 +341,7 @@ class Namefully(object):
     @property
     def length(self) -> int:
         """The number of characters of the birth name, including spaces."""
-        return len(self.birth)
+        return self._cached('length', lambda: len(self.birth))
 
     @property
     def size(self) -> int:
@@ -181,11 +374,11 @@ class Namefully(object):
 
     @property
     def birth(self) -> str:
-        return self.birth_name()
+        return self._cached('birth', self.birth_name)
 
     @property
     def short(self) -> str:
-        return self.shorten()
+        return self._cached('short', self.shorten)
 
     @property
     def long(self) -> str:
@@ -193,7 +386,7 @@ class Namefully(object):
 
     @property
     def full(self) -> str:
-        return self.full_name()
+        return self._cached('full', self.full_name)
 
     @property
     def parts(self) -> Sequence[Name]:
@@ -201,11 +394,11 @@ class Namefully(object):
 
     @property
     def public(self) -> str:
-        return self.format('f $l')
+        return self._cached('public', lambda: self.format('f $l'))
 
     @property
     def salutation(self) -> str:
-        return self.format('p l')
+        return self._cached('salutation', lambda: self.format('p l'))
 
     def get(self, namon: str) -> Union[None, Name, List[Name]]:
         if namon == 'prefix':
@@ -232,6 +425,15 @@ class Namefully(object):
     def to_str(self) -> str:
         return self.full
 
+    def to_bytes(self) -> bytes:
+        """Encodes the name into a compact binary form (see `FullName.to_bytes()`)."""
+        return self._full_name.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> 'Namefully':
+        """Decodes a name encoded by `to_bytes()`, without validating it again."""
+        return cls._of(FullName.from_bytes(data))
+
     def has(self, namon: str) -> bool:
         return self._full_name.has(namon)
 
@@ -268,6 +470,13 @@ class Namefully(object):
 
     def initials(
         self, *, ordered_by: Optional[str] = None, only: Optional[str] = None, as_json: bool = False
+    ) -> Union[List[str], Mapping[str, List[str]]]:
+        if ordered_by is None and only is None and not as_json:
+            return list(self._cached('initials', lambda: tuple(self._initials())))
+        return self._initials(ordered_by=ordered_by, only=only, as_json=as_json)
+
+    def _initials(
+        self, *, ordered_by: Optional[str] = None, only: Optional[str] = None, as_json: bool = False
     ) -> Union[List[str], Mapping[str, List[str]]]:
         first_inits = self._full_name.first_name.initials()
         mid_inits = [n.initial for n in self._full_name.middle_name]
@@ -429,34 +638,74 @@ class Namefully(object):
         The escape character is only valid for the birth name parts: first, middle, and last names.
         """
 
-        if pattern == 'short':
-            return self.short
-        if pattern == 'long':
-            return self.long
-        if pattern == 'public':
-            return self.public
-        if pattern == 'official':
-            pattern = 'o'
+        try:
+            formatter = _compile_format(pattern)
+        except NotAllowedError as error:
+            raise NameError.not_allowed(source=self.full, operation='format', message=error.message) from None
+        return formatter(self)
+
+    @staticmethod
+    def compile_format(pattern: str) -> Callable[['Namefully'], str]:
+        """
+        Compiles a format pattern into a reusable formatter.
+
+        The pattern is tokenized and validated once; the returned callable takes
+        a `Namefully` instance and gives the same result as `format(pattern)`.
+        Compiled patterns are kept in a bounded cache, which `format()` also uses.
 
-        group = ''
-        formatted = []
-        for char in pattern:
-            if char not in ALLOWED_TOKENS:
-                raise NameError.not_allowed(
-                    source=self.full, operation='format', message=f'unsupported character <{char}> from {pattern}.'
-                )
-            group += char
-            if char == '$':
-                continue
-            formatted.append(self.__map(group) or '')
-            group = ''
-        return ''.join(formatted).strip()
+        Example:
+        --------
+        >>> formatter = Namefully.compile_format('L, f')
+        >>> [formatter(name) for name in Namefully.parse_many(['Joe Smith', 'Jane Doe'])]
+        ['SMITH, Joe', 'DOE, Jane']
+        """
+        return _compile_format(pattern)
+
+    def sort_key(self) -> Tuple[str, ...]:
+        """
+        The key sorting names alphabetically in their name order, then by middle names.
+
+        The key holds the first names and the surnames (father's then mother's) in the
+        order of the config, surnames first when ordered by last name, then the middle
+        names, all without case nor accents: 'élodie Martin' sorts right after 'Elodie
+        Martin', and 'Émile' before 'Zoe'. The parts as they are, the prefix, the suffix
+        and the name order break the ties, so that two names have the same key only if
+        they are equal. It is computed once, like the other derived values, and is what
+        the comparison operators use: `sorted(names)` sorts names by their keys.
+        """
+        memo = self._memo  # read first: the comparison operators call this a lot.
+        key = memo.get('sort_key') if memo is not None and self._stamp == _name._edits else None
+        return key if key is not None else self._cached('sort_key', self._sort_key)
+
+    def _sort_key(self, ordered_by: Optional[str] = None) -> Tuple[str, ...]:
+        # `None` sorts by the name order of this name; `sort_names()` may force another.
+        full_name = self._full_name
+        order = full_name._config.ordered_by
+        first_name, last_name = full_name._first_name, full_name._last_name
+        prefix, suffix = full_name._prefix, full_name._suffix
+        firsts = [first_name._namon, *[name._namon for name in first_name._more]]
+        lasts = [last_name._namon, last_name._mother._namon] if last_name._mother else [last_name._namon]
+        middles = [name._namon for name in full_name._middle_name]
+        if (ordered_by or order) == 'last_name':
+            firsts, lasts = lasts, firsts  # the surnames go first.
+        # Unit separators keep the parts apart when breaking the ties, e.g., 'Ann Mary' and 'Ann' + 'Mary'.
+        return (
+            _collate(' '.join(firsts)),
+            _collate(' '.join(lasts)),
+            _collate(' '.join(middles)),
+            _UNIT_SEP.join(firsts),
+            _UNIT_SEP.join(lasts),
+            _UNIT_SEP.join(middles),
+            prefix._namon if prefix else '',
+            suffix._namon if suffix else '',
+            order,
+        )
 
     def flip(self) -> None:
-        if self.config.ordered_by == 'first_name':
-            self._full_name.config.update_order('last_name')
-        else:
-            self._full_name.config.update_order('first_name')
+        """Flips the name order of this name only; other names are not affected."""
+        order = 'last_name' if self.config.ordered_by == 'first_name' else 'first_name'
+        self._full_name._config = self.config.update_order(order)
+        self._memo = self._hash = None  # derived values and equality depend on the name order.
 
     def split(self, sep: Union[str, re.Pattern] = re.compile(r"[' -]")) -> List[str]:
         return re.sub(sep, ' ', self.birth).split(' ')
@@ -491,68 +740,136 @@ class Namefully(object):
     def toggle(self) -> str:
         return toggle_case(self.birth)
 
-    def __to_parser(
-        self, names: Union[str, Sequence[str], Sequence[Name], Mapping[str, str], FullName, Parser]
-    ) -> Parser:
-        if isinstance(names, Parser):
-            return names
-        elif isinstance(names, str):
-            return StringParser(names)
-        elif isinstance(names, Sequence):
-            if all(isinstance(name, str) for name in names):
-                return SequentialStringParser(names)  # type: ignore
-            elif all(isinstance(name, Name) for name in names):
-                return SequentialNameParser(names)  # type: ignore
-        elif isinstance(names, Mapping):
-            return NamaParser(names)
-        elif isinstance(names, FullName):
-            return SequentialNameParser(names.to_iterable())
-        raise NameError.input(source=str(names), message='cannot parse raw data; review expected data types')
-
-    def __map(self, char: str) -> Optional[str]:
-        if char in ['.', ',', ' ', '-', '_']:
-            return char
-        elif char == 'b':
-            return self.birth
-        elif char == 'B':
-            return self.birth.upper()
-        elif char == 'f':
-            return self.first
-        elif char == 'F':
-            return self.first.upper()
-        elif char == 'l':
-            return self.last
-        elif char == 'L':
-            return self.last.upper()
-        elif char in ['m', 'M']:
-            middle_name = ' '.join(self.middle_name())
-            return middle_name if char == 'm' else middle_name.upper()
-        elif char in ['o', 'O']:
-            sep, names = ',' if self.config.ending else '', []
-            if self.prefix:
-                names.append(self.prefix)
-            names.append(f'{self.last},'.upper())
-            if self.has_middle:
-                names.extend([self.first, ' '.join(self.middle_name()) + sep])
-            else:
-                names.append(self.first + sep)
-            if self.suffix:
-                names.append(self.suffix)
-            nama = ' '.join(names).strip()
-            return nama if char == 'o' else nama.upper()
-        elif char == 'p':
-            return self.prefix
-        elif char == 'P':
-            return self.prefix.upper() if self.prefix else None
-        elif char == 's':
-            return self.suffix
-        elif char == 'S':
-            return self.suffix.upper() if self.suffix else None
-        elif char in ['$f', '$F']:
-            return self._full_name.first_name.initial
-        elif char in ['$l', '$L']:
-            return self._full_name.last_name.initial
-        elif char in ['$m', '$M']:
-            return self.middle[0] if self.middle else None
+    def _official(self) -> str:
+        sep, names = ',' if self.config.ending else '', []
+        if self.prefix:
+            names.append(self.prefix)
+        names.append(f'{self.last},'.upper())
+        if self.has_middle:
+            names.extend([self.first, ' '.join(self.middle_name()) + sep])
         else:
-            return None
+            names.append(self.first + sep)
+        if self.suffix:
+            names.append(self.suffix)
+        return ' '.join(names).strip()
+
+
+_RawNames = Union[str, Sequence[str], Sequence[Name], Mapping[str, str], FullName, Parser]
+
+
+def _to_parser(names: _RawNames) -> Parser:
+    if isinstance(names, Parser):
+        return names
+    elif isinstance(names, str):
+        return StringParser(names)
+    elif isinstance(names, Sequence):
+        if all(isinstance(name, str) for name in names):
+            return SequentialStringParser(names)  # type: ignore
+        elif all(isinstance(name, Name) for name in names):
+            return SequentialNameParser(names)  # type: ignore
+    elif isinstance(names, Mapping):
+        return NamaParser(names)
+    elif isinstance(names, FullName):
+        return SequentialNameParser(names.to_iterable())
+    raise NameError.input(source=str(names), message='cannot parse raw data; review expected data types')
+
+
+def _parser_factory(names: _RawNames) -> Optional[Callable[[_RawNames], Parser]]:
+    """Finds the parser that fits every raw input of the same type, if any.
+
+    Sequences are left out since their parser depends on the type of their items.
+    """
+    if isinstance(names, str):
+        return StringParser
+    if isinstance(names, Mapping):
+        return NamaParser
+    if isinstance(names, Parser):
+        return _identity
+    return None
+
+
+def _identity(parser: Parser) -> Parser:
+    return parser
+
+
+_Token = Callable[[Namefully], Optional[str]]
+
+_TOKENS: Dict[str, _Token] = {
+    'b': lambda name: name.birth,
+    'B': lambda name: name.birth.upper(),
+    'f': lambda name: name.first,
+    'F': lambda name: name.first.upper(),
+    'l': lambda name: name.last,
+    'L': lambda name: name.last.upper(),
+    'm': lambda name: ' '.join(name.middle_name()),
+    'M': lambda name: ' '.join(name.middle_name()).upper(),
+    'o': lambda name: name._official(),
+    'O': lambda name: name._official().upper(),
+    'p': lambda name: name.prefix,
+    'P': lambda name: name.prefix.upper() if name.prefix else None,
+    's': lambda name: name.suffix,
+    'S': lambda name: name.suffix.upper() if name.suffix else None,
+    '$f': lambda name: name._full_name.first_name.initial,
+    '$F': lambda name: name._full_name.first_name.initial,
+    '$l': lambda name: name._full_name.last_name.initial,
+    '$L': lambda name: name._full_name.last_name.initial,
+    '$m': lambda name: name.middle[0] if name.middle else None,
+    '$M': lambda name: name.middle[0] if name.middle else None,
+}
+
+_NAMED_FORMATS: Dict[str, Callable[[Namefully], str]] = {
+    'short': lambda name: name.short,
+    'long': lambda name: name.long,
+    'public': lambda name: name.public,
+}
+
+_PUNCTUATIONS = ('.', ',', ' ', '-', '_')
+
+
+def _tokenize(pattern: str) -> List[str]:
+    """Splits a format pattern into name tokens (keys of `_TOKENS`) and constant chunks.
+
+    Adjacent punctuations are merged into a single chunk and unknown groups (e.g.
+    '$p') are dropped.
+    """
+    chunks: List[str] = []
+    group = ''
+    for char in pattern:
+        if char not in ALLOWED_TOKENS:
+            raise NameError.not_allowed(
+                source=pattern, operation='format', message=f'unsupported character <{char}> from {pattern}.'
+            )
+        group += char
+        if char == '$':
+            continue
+        if group in _PUNCTUATIONS:
+            if chunks and chunks[-1] not in _TOKENS:
+                chunks[-1] += group
+            else:
+                chunks.append(group)
+        elif group in _TOKENS:
+            chunks.append(group)
+        group = ''
+    return chunks
+
+
+def _rebuild(full_name: Optional[FullName], names: Any = None, config: Optional[Config] = None) -> Namefully:
+    if full_name is None:
+        return Namefully._deferred(names, config)  # type: ignore
+    return Namefully._of(full_name)
+
+
+@lru_cache(maxsize=256)
+def _compile_format(pattern: str) -> Callable[[Namefully], str]:
+    if pattern in _NAMED_FORMATS:
+        return _NAMED_FORMATS[pattern]
+    if pattern == 'official':
+        pattern = 'o'
+
+    # Only the name tokens are left to run per name.
+    chunks: List[Union[str, _Token]] = [_TOKENS.get(chunk, chunk) for chunk in _tokenize(pattern)]
+
+    def formatter(name: Namefully) -> str:
+        return ''.join([chunk if isinstance(chunk, str) else chunk(name) or '' for chunk in chunks]).strip()
+
+    return formatter
@@ -0,0 +1,136 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from ._namefully import Namefully
+
+__all__ = ['parse_parallel', 'format_parallel']
+
+T = TypeVar('T')
+
+# A parsed name shipped back from a worker: (prefix, first, middles, last, suffix).
+_NameTuple = Tuple[Optional[str], str, Tuple[str, ...], str, Optional[str]]
+
+_MIN_CHUNK_SIZE = 256
+_MAX_CHUNK_SIZE = 16_384
+
+
+def parse_parallel(
+    names: Iterable[Any],
+    *,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    mp_context: Any = None,
+    **options: Any,
+) -> Iterator[_NameTuple]:
+    """
+    Parses many raw names across a pool of processes.
+
+    Only compact tuples `(prefix, first, middles, last, suffix)` travel back to
+    the parent process; they are yielded in the same order as the input.
+
+    Args:
+        names: raw names accepted by `Namefully.parse_many()`.
+        workers: number of processes, defaults to the number of CPUs.
+        chunksize: number of names sent per task, adapted to the input if omitted.
+        mp_context: the multiprocessing context used to start the workers.
+        options: the same keyword arguments accepted by `Namefully`.
+    """
+    return _run(_parse_chunk, names, (options,), workers, chunksize, mp_context)
+
+
+def format_parallel(
+    names: Iterable[Any],
+    pattern: str,
+    *,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    mp_context: Any = None,
+    **options: Any,
+) -> Iterator[str]:
+    """
+    Parses and formats many raw names across a pool of processes.
+
+    Only the formatted strings travel back to the parent process; they are
+    yielded in the same order as the input. See `Namefully.format()` for the
+    supported patterns.
+    """
+    return _run(_format_chunk, names, (pattern, options), workers, chunksize, mp_context)
+
+
+def _parse_chunk(chunk: Sequence[Any], options: dict) -> List[_NameTuple]:
+    return [
+        (name.prefix, name.first, tuple(name.middle_name()), name.last, name.suffix)
+        for name in Namefully.parse_many(chunk, **options)
+    ]
+
+
+def _format_chunk(chunk: Sequence[Any], pattern: str, options: dict) -> List[str]:
+    return [name.format(pattern) for name in Namefully.parse_many(chunk, **options)]
+
+
+def _run(
+    task: Callable[..., List[T]],
+    names: Iterable[Any],
+    args: tuple,
+    workers: Optional[int],
+    chunksize: Optional[int],
+    mp_context: Any,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple = (),
+) -> Iterator[T]:
+    workers = max(1, workers or os.cpu_count() or 1)
+    chunks = _chunks(names, workers, chunksize)
+
+    if workers == 1:  # no point paying for inter-process communication.
+        for chunk in chunks:
+            yield from task(chunk, *args)
+        return
+
+    # Keep a bounded number of chunks in flight so that memory does not grow with
+    # the input size, and collect them in submission order to preserve the output.
+    # State shared by all the tasks (`initargs`) is sent once per worker instead.
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp_context, initializer=initializer, initargs=initargs
+    )
+    pending: Deque[Future] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(task, chunk, *args))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _chunks(names: Iterable[Any], workers: int, chunksize: Optional[int]) -> Iterator[List[Any]]:
+    """Splits the input into chunks, adapting their size when none is given.
+
+    When the input size is known, it is spread over a few chunks per worker.
+    Otherwise, chunks start small (fast first results) and double up to a cap
+    (low dispatch overhead on long streams).
+    """
+    iterator = iter(names)
+    growing = chunksize is None
+    if chunksize is None:
+        try:
+            size = len(names)  # type: ignore
+            chunksize = min(max(size // (workers * 4), _MIN_CHUNK_SIZE), _MAX_CHUNK_SIZE)
+            growing = False
+        except TypeError:
+            chunksize = _MIN_CHUNK_SIZE
+    chunksize = max(1, chunksize)
+
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+        if growing:
+            chunksize = min(chunksize * 2, _MAX_CHUNK_SIZE)
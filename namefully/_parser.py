@@ -1,16 +1,71 @@
+import functools
+import os
 from abc import ABC, abstractmethod
-from typing import Any, List, Mapping, Optional, Sequence
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
 
 from ._config import Config
 from ._errors import InputError
 from ._full_name import FullName
 from ._name import FirstName, LastName, Name
-from ._types import Separator
+from ._pool import NamePool
+from ._types import Separator, _NameOrder
 from ._utils import NameIndex
 from ._validators import SequentialNameValidator, Validators
 
 __all__ = ['Parser']
 
+# Positional indexes are fixed per (order, count), so they are computed once
+# instead of being rebuilt for every parsed name.
+_INDEXES: Dict[Tuple[str, int], NameIndex] = {
+    (order, count): NameIndex.when(order, count) for order in _NameOrder for count in range(2, 6)
+}
+
+
+def _index_of(order: str, count: int) -> NameIndex:
+    index = _INDEXES.get((order, count))
+    return index if index is not None else NameIndex.when(order, count)
+
+
+_AFFIXES_PATH = os.path.join(os.path.dirname(__file__), 'data', 'affixes.txt')
+
+
+@functools.lru_cache(maxsize=None)
+def _affixes() -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """The known titles and suffixes, normalized, read from the bundled data file on first use."""
+    sections: Dict[str, set] = {'prefix': set(), 'suffix': set()}
+    entries = sections['prefix']
+    with open(_AFFIXES_PATH, encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('['):
+                entries = sections[line.strip('[]')]
+            else:
+                entries.add(_normalize(line))
+    return frozenset(sections['prefix']), frozenset(sections['suffix'])
+
+
+def _normalize(token: str) -> str:
+    return token.replace('.', '').rstrip(',').casefold()
+
+
+def _peel(parts: List[str], ordered_by: str = 'first_name') -> Tuple[List[str], List[str], List[str]]:
+    """
+    Splits the leading titles and trailing suffixes off the name parts, keeping at least 2 of them.
+
+    A surname-first name keeps 3 parts at least when losing a title: its first part
+    is more likely a surname than a title otherwise (e.g., 'Dr Smith John').
+    """
+    prefixes, suffixes = _affixes()
+    start, end = 0, len(parts)
+    least = 3 if ordered_by == 'last_name' else 2
+    while end - start > least and _normalize(parts[start]) in prefixes:
+        start += 1
+    while end - start > 2 and _normalize(parts[end - 1]) in suffixes:
+        end -= 1
+    return parts[:start], parts[start:end], parts[end:]
+
 
 class Parser(ABC):
     def __init__(self, raw: Any) -> None:
@@ -20,8 +75,25 @@ class Parser(ABC):
     def parse(self, **options) -> FullName:
         raise NotImplementedError
 
+    def _parse(self, config: Config, _pool: Optional[NamePool] = None) -> FullName:
+        """Parses the raw content using an already resolved configuration.
+
+        Built-in parsers override this to skip merging the options again and to
+        draw name parts from a `NamePool` if any; custom parsers fall back on
+        their own `parse()` implementation, without a pool.
+        """
+        return self.parse(**config.to_dict())
+
     @staticmethod
     def build(text: str, index: Optional[NameIndex] = None) -> 'Parser':
+        """
+        Finds a parser for a name given as one piece of text, separated by spaces.
+
+        Without an `index`, leading titles (e.g., 'Dr.') and trailing suffixes
+        (e.g., 'Jr.', 'PhD') are recognized from a bundled list, so that the
+        remaining parts are the first, middle and last names, whatever their
+        count. A comma before a suffix is dropped: 'John Smith, Jr.'.
+        """
         parts = text.strip().split(Separator.space[1])
         length = len(parts)
 
@@ -31,6 +103,9 @@ class Parser(ABC):
         else:
             if length < 2:
                 raise InputError(source=text, message='2+ name parts need to be provided to proceed')
+            prefixes, _, suffixes = _peel(parts)
+            if prefixes or suffixes:  # peeled again once the name order is known.
+                return _AffixedStringParser(parts)
             elif length == 2 or length == 3:
                 return StringParser(text)
             else:
@@ -44,9 +119,10 @@ class StringParser(Parser):
         super().__init__(raw)
 
     def parse(self, **options) -> FullName:
-        config = Config.merge(**options)
-        names = self.raw.split(config.separator)
-        return SequentialStringParser(names).parse(**options)
+        return self._parse(Config.merge(**options))
+
+    def _parse(self, config: Config, pool: Optional[NamePool] = None) -> FullName:
+        return SequentialStringParser(self.raw.split(config.separator))._parse(config, pool)
 
 
 class SequentialStringParser(Parser):
@@ -54,23 +130,31 @@ class SequentialStringParser(Parser):
         super().__init__(names)
 
     def parse(self, **options) -> FullName:
-        full_name = FullName(**options)
+        return self._parse(Config.merge(**options))
+
+    def _parse(self, config: Config, pool: Optional[NamePool] = None) -> FullName:
+        full_name = FullName(config=config)
 
         raw: List[str] = [name.strip() for name in self.raw]
         length = len(raw)
-        index = NameIndex.when(full_name.config.ordered_by, length)
-        validator = SequentialNameValidator(index)
+        index = _index_of(config.ordered_by, length)
+        validator = SequentialNameValidator()
 
-        if full_name.config.bypass:
+        if config.bypass:
             validator.validate_index(raw)
         else:
-            validator.validate_as_str(raw)
+            validator.validate_as_str(raw, index)
 
-        full_name.first_name = raw[index.first_name]
-        full_name.last_name = raw[index.last_name]
-
-        if length >= 3:
-            full_name.middle_name = raw[index.middle_name].split(full_name.config.separator)
+        if pool is None:
+            full_name.first_name = raw[index.first_name]
+            full_name.last_name = raw[index.last_name]
+            if length >= 3:
+                full_name.middle_name = raw[index.middle_name].split(config.separator)
+        else:
+            full_name.first_name = pool.first(raw[index.first_name])
+            full_name.last_name = pool.last(raw[index.last_name])
+            if length >= 3:
+                full_name.middle_name = [pool.middle(name) for name in raw[index.middle_name].split(config.separator)]
         if length >= 4:
             full_name.prefix = raw[index.prefix]
         if length == 5:
@@ -84,7 +168,10 @@ class SequentialNameParser(Parser):
         super().__init__(names)
 
     def parse(self, **options) -> FullName:
-        full_name = FullName(**options)
+        return self._parse(Config.merge(**options))
+
+    def _parse(self, config: Config, pool: Optional[NamePool] = None) -> FullName:
+        full_name = FullName(config=config)
 
         raw: List[Name] = self.raw
         SequentialNameValidator().validate_as_name(raw)
@@ -95,17 +182,18 @@ class SequentialNameParser(Parser):
             elif name.is_suffix:
                 full_name.suffix = name
             elif name.is_first:
-                first_name = name if isinstance(name, FirstName) else FirstName(name.value)
-                full_name.first_name = first_name
+                if isinstance(name, FirstName):
+                    full_name.first_name = name
+                else:
+                    full_name.first_name = FirstName(name.value) if pool is None else pool.first(name.value)
             elif name.is_middle:
                 full_name.middle_name.append(name)
             elif name.is_last:
-                last_name = LastName(
-                    father=name.value,
-                    mother=name.mother if isinstance(name, LastName) else None,
-                    format=full_name.config.surname,
-                )
-                full_name.last_name = last_name
+                mother = name.mother if isinstance(name, LastName) else None
+                if pool is not None and mother is None and config.surname == 'father':
+                    full_name.last_name = pool.last(name.value)
+                else:
+                    full_name.last_name = LastName(father=name.value, mother=mother, format=config.surname)
 
         return full_name
 
@@ -115,12 +203,48 @@ class NamaParser(Parser):
         super().__init__(names)
 
     def parse(self, **options) -> FullName:
-        config = Config.merge(**options)
-        raw: Mapping[str, str] = self.raw
+        return self._parse(Config.merge(**options))
+
+    def _parse(self, config: Config, pool: Optional[NamePool] = None) -> FullName:
+        raw: Mapping[str, Any] = self.raw
 
         if config.bypass:
             Validators.nama.validate_keys(raw)
         else:
             Validators.nama.validate(raw)
 
-        return FullName.parse(raw, **options)
+        if pool is not None and isinstance(raw.get('first_name'), str) and isinstance(raw.get('last_name'), str):
+            raw = {**raw, 'first_name': pool.first(raw['first_name']), 'last_name': pool.last(raw['last_name'])}
+        return FullName.parse(raw, config=config)
+
+
+class _AffixedStringParser(Parser):
+    """
+    Parses names that may carry known titles and suffixes; these are split off and
+    the other parts are assigned their role once the name order is known.
+    """
+
+    def __init__(self, names: Sequence[str]) -> None:
+        super().__init__(names)
+
+    def parse(self, **options) -> FullName:
+        return self._parse(Config.merge(**options))
+
+    def _parse(self, config: Config, pool: Optional[NamePool] = None) -> FullName:
+        prefixes, names, suffixes = _peel(self.raw, config.ordered_by)
+        names = [name.rstrip(',') for name in names]
+        if config.ordered_by == 'last_name':
+            last, first, *middles = names
+        else:
+            first, *middles, last = names
+
+        raw: Dict[str, Any] = {'first_name': first, 'last_name': last}
+        if middles:
+            raw['middle_name'] = middles if pool is None else [pool.middle(name) for name in middles]
+        if prefixes:
+            prefix = ' '.join(prefixes)
+            # The US title adds its own period.
+            raw['prefix'] = prefix[:-1] if config.title == 'us' and prefix.endswith('.') else prefix
+        if suffixes:
+            raw['suffix'] = ' '.join([name.rstrip(',') for name in suffixes])
+        return NamaParser(raw)._parse(config, pool)
@@ -0,0 +1,279 @@
+import unicodedata
+from array import array
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Union
+
+from ._errors import NameError
+from ._full_name import FullName
+from ._name import FirstName, LastName, Name
+from ._namefully import Namefully
+
+__all__ = ['soundex', 'metaphone', 'PhoneticIndex']
+
+_SOUNDEX_CODES = dict.fromkeys('bfpv', '1')
+_SOUNDEX_CODES.update(dict.fromkeys('cgjkqsxz', '2'))
+_SOUNDEX_CODES.update(dict.fromkeys('dt', '3'))
+_SOUNDEX_CODES.update({'l': '4', 'm': '5', 'n': '5', 'r': '6'})
+
+_VOWELS = frozenset('aeiou')
+_FRONT_VOWELS = frozenset('eiy')
+_SILENCING_H = frozenset('cgpst')
+
+_Text = Union[str, Name]
+
+
+def soundex(name: _Text) -> str:
+    """
+    Encodes a name with the American Soundex: its first letter, then the codes of
+    the next consonants (e.g., 'Robert' -> 'R163', 'Rupert' -> 'R163').
+
+    Accents are ignored, as well as anything that is not a letter. Name parts
+    (e.g., a `FirstName`) are encoded by their value; see `PhoneticIndex` for the
+    mother's surname of a `LastName`.
+    """
+    return _soundex(name.value if isinstance(name, Name) else name)
+
+
+def metaphone(name: _Text) -> str:
+    """
+    Encodes a name with the original Metaphone, which groups names by their
+    English pronunciation more closely than Soundex: e.g., 'Catherine' and 'Kathryn'
+    both give 'K0RN' ('0' stands for 'th'), while their Soundex codes differ.
+
+    Accents are ignored, as well as anything that is not a letter.
+    """
+    return _metaphone(name.value if isinstance(name, Name) else name)
+
+
+class PhoneticIndex:
+    """
+    An in-memory inverted index from phonetic keys to record ids, to find the
+    candidate matches of a name without scanning a whole reference list.
+
+    A record is keyed by the phonetic code of its first name combined with the
+    code of each of its surnames (the father's and, if any, the mother's), so
+    that 'Jon Smyth' finds 'John Smith' and 'Maria Garcia Lopez' is found from
+    either surname. With `with_first=False`, the surnames alone are the keys.
+    A name without any Latin letter (e.g., 'Анна') has no phonetic code: it is
+    keyed by its casefolded value instead, and only matches itself.
+
+    Records get sequential ids in insertion order, like the rows of a `NameTable`.
+    The ids of a key are stored as compact arrays of 32-bit integers (or as a
+    single integer for a key with one record only).
+
+    Example:
+    --------
+    >>> index = PhoneticIndex(encoder='metaphone')
+    >>> index.extend(Namefully.parse_many(['John Smith', 'Jane Doe']))
+    range(0, 2)
+    >>> index.candidates(Namefully('Jon Smyth'))
+    [0]
+    """
+
+    __slots__ = ('_encode', '_with_first', '_postings', '_count')
+
+    def __init__(self, encoder: Union[str, Callable[[str], str]] = 'soundex', *, with_first: bool = True) -> None:
+        if callable(encoder):
+            self._encode: Callable[[str], str] = encoder
+        elif encoder in _ENCODERS:
+            self._encode = _ENCODERS[encoder]
+        else:
+            raise NameError.not_allowed(
+                source=str(encoder), operation='PhoneticIndex', message=f'expecting one of {list(_ENCODERS)}'
+            )
+        self._with_first = with_first
+        self._postings: Dict[str, Union[int, array]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        """The number of records indexed."""
+        return self._count
+
+    @property
+    def key_count(self) -> int:
+        """The number of distinct phonetic keys."""
+        return len(self._postings)
+
+    def keys(self, name: Union[Namefully, FullName]) -> List[str]:
+        """The phonetic keys of a name, one per surname."""
+        full_name = name._full_name if isinstance(name, Namefully) else name
+        return self._keys(full_name.first_name, full_name.last_name)
+
+    def add(self, name: Union[Namefully, FullName]) -> int:
+        """Indexes a name and returns its record id."""
+        record = self._count
+        self._insert(self.keys(name), record)
+        self._count += 1
+        return record
+
+    def extend(self, names: Iterable[Union[Namefully, FullName]]) -> range:
+        """Indexes many names at once and returns their record ids."""
+        start = self._count
+        insert, keys = self._insert, self.keys
+        for name in names:
+            insert(keys(name), self._count)
+            self._count += 1
+        return range(start, self._count)
+
+    def candidates(self, name: Union[Namefully, FullName]) -> List[int]:
+        """The ids of the records sharing a phonetic key with a name, in insertion order."""
+        postings = self._postings
+        found = [postings[key] for key in self.keys(name) if key in postings]
+        if len(found) == 1:
+            ids = found[0]
+            return [ids] if isinstance(ids, int) else ids.tolist()
+        return sorted({record for ids in found for record in ([ids] if isinstance(ids, int) else ids)})
+
+    def _insert(self, keys: List[str], record: int) -> None:
+        postings = self._postings
+        for key in keys:
+            ids = postings.get(key)
+            if ids is None:  # most keys only ever have one record: no array for them.
+                postings[key] = record
+            elif isinstance(ids, int):
+                postings[key] = array('I', (ids, record))
+            else:
+                ids.append(record)
+
+    def _keys(self, first_name: FirstName, last_name: LastName) -> List[str]:
+        encode = self._encode
+        surnames = [encode(last_name.value) or last_name.value.casefold()]
+        if last_name._mother is not None:
+            mother = encode(last_name._mother.value) or last_name._mother.value.casefold()
+            if mother != surnames[0]:
+                surnames.append(mother)
+        if not self._with_first:
+            return surnames
+        first = encode(first_name.value) or first_name.value.casefold()
+        return [f'{first} {surname}' for surname in surnames]
+
+
+def _fold(text: str) -> str:
+    """Lowercases a name and keeps its ASCII letters only, without their accents."""
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return ''.join([char for char in text.lower() if 'a' <= char <= 'z'])
+
+
+# Names repeat a lot in large lists: the codes of the most frequent ones are kept.
+@lru_cache(maxsize=65536)
+def _soundex(text: str) -> str:
+    text = _fold(text)
+    if not text:
+        return ''
+    code, previous = [text[0].upper()], _SOUNDEX_CODES.get(text[0], '')
+    for char in text[1:]:
+        digit = _SOUNDEX_CODES.get(char)
+        if digit is None:
+            if char not in 'hw':  # vowels separate the same codes; 'h' and 'w' do not.
+                previous = ''
+            continue
+        if digit != previous:
+            code.append(digit)
+            if len(code) == 4:
+                break
+        previous = digit
+    return ''.join(code).ljust(4, '0')
+
+
+@lru_cache(maxsize=65536)
+def _metaphone(text: str) -> str:
+    text = _fold(text)
+    if text[:2] in ('ae', 'gn', 'kn', 'pn', 'wr'):
+        text = text[1:]
+    elif text[:1] == 'x':
+        text = 's' + text[1:]
+    elif text[:2] == 'wh':
+        text = 'w' + text[2:]
+
+    code: List[str] = []
+    size = len(text)
+
+    def at(index: int) -> str:
+        return text[index] if 0 <= index < size else ''
+
+    i = 0
+    while i < size:
+        char, before, after = text[i], at(i - 1), at(i + 1)
+        if char == before and char != 'c':
+            i += 1
+            continue
+
+        if char in _VOWELS:
+            if i == 0:
+                code.append(char.upper())
+        elif char == 'b':
+            if not (before == 'm' and i == size - 1):
+                code.append('B')
+        elif char == 'c':
+            if after == 'i' and at(i + 2) == 'a':
+                code.append('X')
+            elif after == 'h':
+                code.append('K' if before == 's' else 'X')
+                i += 1
+            elif after in _FRONT_VOWELS:
+                if before != 's':
+                    code.append('S')
+            else:
+                code.append('K')
+        elif char == 'd':
+            if after == 'g' and at(i + 2) in _FRONT_VOWELS:
+                code.append('J')
+                i += 1
+            else:
+                code.append('T')
+        elif char == 'g':
+            if after == 'h' and i + 2 < size and at(i + 2) not in _VOWELS:
+                pass
+            elif after == 'n' and (i + 2 == size or text[i + 2 :] == 'ed'):
+                pass
+            elif after in _FRONT_VOWELS and before != 'g':
+                code.append('J')
+            else:
+                code.append('K')
+        elif char == 'h':
+            if before not in _SILENCING_H and not (before in _VOWELS and after not in _VOWELS):
+                code.append('H')
+        elif char == 'k':
+            if before != 'c':
+                code.append('K')
+        elif char == 'p':
+            if after == 'h':
+                code.append('F')
+                i += 1
+            else:
+                code.append('P')
+        elif char == 'q':
+            code.append('K')
+        elif char == 's':
+            if after == 'h':
+                code.append('X')
+                i += 1
+            elif after == 'i' and at(i + 2) in ('o', 'a'):
+                code.append('X')
+            else:
+                code.append('S')
+        elif char == 't':
+            if after == 'i' and at(i + 2) in ('o', 'a'):
+                code.append('X')
+            elif after == 'h':
+                code.append('0')
+                i += 1
+            elif not (after == 'c' and at(i + 2) == 'h'):
+                code.append('T')
+        elif char == 'v':
+            code.append('F')
+        elif char in 'wy':
+            if after in _VOWELS:
+                code.append(char.upper())
+        elif char == 'x':
+            code.append('KS')
+        elif char == 'z':
+            code.append('S')
+        else:  # f, j, l, m, n, r
+            code.append(char.upper())
+        i += 1
+    return ''.join(code)
+
+
+_ENCODERS: Dict[str, Callable[[str], str]] = {'soundex': _soundex, 'metaphone': _metaphone}
@@ -0,0 +1,142 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from ._errors import NameError
+from ._name import FirstName, LastName, Name
+
+__all__ = ['NamePool']
+
+
+class _Shared:
+    """Makes a pooled name part read-only, as it may be held by many names."""
+
+    __slots__ = ()
+
+    @property
+    def value(self) -> str:
+        return self._namon  # type: ignore
+
+    @value.setter
+    def value(self, _value: str) -> None:
+        raise NameError.not_allowed(source=self.value, operation='value', message='shared names are read-only')
+
+    def caps(self, _caps_range: Optional[str] = None):
+        raise NameError.not_allowed(source=self.value, operation='caps', message='shared names are read-only')
+
+    def decaps(self, _caps_range: Optional[str] = None):
+        raise NameError.not_allowed(source=self.value, operation='decaps', message='shared names are read-only')
+
+
+class _SharedName(_Shared, Name):
+    __slots__ = ()
+
+
+class _SharedFirstName(_Shared, FirstName):
+    __slots__ = ()
+
+
+class _SharedLastName(_Shared, LastName):
+    __slots__ = ()
+
+
+_PoolKey = Tuple[str, str]
+_PooledName = Union[Name, FirstName, LastName]
+
+
+class NamePool:
+    """
+    An opt-in, bounded pool of shared name parts (flyweights).
+
+    Real-world datasets repeat the same name parts over and over. When a pool is
+    given to `Namefully.parse_many()`, identical first, middle and last names are
+    served as one shared, read-only instance backed by an interned string. The
+    least recently used parts are evicted once `maxsize` is reached.
+
+    Shared parts cannot be edited: `caps()`, `decaps()` or setting their value
+    raises a `NotAllowedError`.
+
+    Example:
+    --------
+    >>> pool = NamePool(maxsize=10_000)
+    >>> names = list(Namefully.parse_many(['John Smith', 'Jane Smith'], pool=pool))
+    >>> names[0].get('last_name') is names[1].get('last_name')
+    True
+    """
+
+    __slots__ = ('_maxsize', '_names', '_lock', '_hits', '_misses', '_evictions', '_saved')
+
+    def __init__(self, maxsize: int = 65_536) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be a positive integer')
+        self._maxsize = maxsize
+        self._names: 'OrderedDict[_PoolKey, Tuple[_PooledName, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._saved = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f'<NamePool: {len(self._names)}/{self._maxsize}>'
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def first(self, value: str) -> FirstName:
+        return self._get(('first_name', value), _SharedFirstName)  # type: ignore
+
+    def middle(self, value: str) -> Name:
+        return self._get(('middle_name', value), lambda v: _SharedName(v, type='middle_name'))
+
+    def last(self, value: str) -> LastName:
+        return self._get(('last_name', value), _SharedLastName)  # type: ignore
+
+    def stats(self) -> Dict[str, float]:
+        """Returns the pool counters, including the hit rate and the bytes saved."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._names),
+                'maxsize': self._maxsize,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'saved_bytes': self._saved,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names.clear()
+            self._hits = self._misses = self._evictions = self._saved = 0
+
+    def _get(self, key: _PoolKey, factory: Callable[[str], _PooledName]) -> _PooledName:
+        with self._lock:
+            entry = self._names.get(key)
+            if entry is not None:
+                self._names.move_to_end(key)
+                self._hits += 1
+                self._saved += entry[1]
+                return entry[0]
+
+        name = factory(sys.intern(key[1]))  # built outside the lock; may raise for invalid values.
+        size = sys.getsizeof(name) + sys.getsizeof(name.value)
+
+        with self._lock:
+            entry = self._names.get(key)
+            if entry is not None:  # another thread got there first.
+                self._hits += 1
+                self._saved += entry[1]
+                return entry[0]
+            self._misses += 1
+            self._names[key] = (name, size)
+            if len(self._names) > self._maxsize:
+                self._names.popitem(last=False)
+                self._evictions += 1
+        return name
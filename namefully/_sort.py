@@ -0,0 +1,102 @@
+import heapq
+import os
+import tempfile
+from contextlib import ExitStack
+from itertools import count, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ._archive import NameReader, NameWriter
+from ._errors import NameError
+from ._namefully import Namefully
+
+__all__ = ['sort_names']
+
+# About the memory taken by a parsed name waiting to be sorted, key included.
+_NAME_SIZE = 1024
+
+# The most runs merged at once; more runs are merged in several passes.
+_FAN_IN = 64
+
+
+def sort_names(
+    names: Iterable[Any],
+    *,
+    by: Optional[str] = 'last_name',
+    budget: int = 64 * 1024 * 1024,
+    directory: Optional[Union[str, 'os.PathLike[str]']] = None,
+    **options: Any,
+) -> Iterator[Namefully]:
+    """
+    Sorts more names than the memory can hold, yielding them in alphabetical order.
+
+    The names are parsed with `Namefully.parse_many()` (which accepts the other
+    options) by chunks fitting in the memory budget. Each chunk is sorted by a key
+    like `Namefully.sort_key()` in the order given by `by`, then spilled to a
+    temporary binary archive (see `NameWriter`); the sorted runs are finally merged
+    while the names are consumed. When all the names fit in the budget, nothing is written to disk.
+
+    Args:
+        names: raw names, e.g., the lines of a file read with `read_lines()`.
+        by: sort by surname first ('last_name'), by first name ('first_name'), or
+            in the name order of each name (`None`).
+        budget: about how much memory (in bytes) the names being sorted may take;
+            this excludes the fixed-size caches of the package (e.g., collation).
+        directory: where the temporary files go, the system default if omitted.
+
+    Example:
+    --------
+    >>> with open('sorted.txt', 'w') as file:
+    ...     for name in sort_names(read_lines('directory.txt'), budget=16 * 1024 * 1024):
+    ...         print(name.format('L, f m'), file=file)
+    """
+    if by not in ('first_name', 'last_name', None):
+        message = "expecting 'first_name', 'last_name' or None"
+        raise NameError.not_allowed(source=str(by), operation='sort_names', message=message)
+    return _sorted(names, by, budget, directory, options)
+
+
+def _sorted(
+    names: Iterable[Any],
+    by: Optional[str],
+    budget: int,
+    directory: Optional[Union[str, 'os.PathLike[str]']],
+    options: Dict[str, Any],
+) -> Iterator[Namefully]:
+    def key(name: Namefully) -> Tuple[str, ...]:
+        return name._sort_key(by)
+
+    chunksize = max(1, budget // _NAME_SIZE)
+    parsed = Namefully.parse_many(names, **options)
+
+    chunk = sorted(islice(parsed, chunksize), key=key)
+    if len(chunk) < chunksize:  # no need for the disk.
+        yield from chunk
+        return
+
+    with tempfile.TemporaryDirectory(prefix='namefully-', dir=directory) as folder:
+        runs: List[str] = []
+        numbers = count()
+        while chunk:
+            runs.append(_spill(chunk, folder, next(numbers)))
+            chunk = []  # released before the next chunk is parsed.
+            chunk = sorted(islice(parsed, chunksize), key=key)
+
+        while len(runs) > _FAN_IN:
+            group, runs = runs[:_FAN_IN], runs[_FAN_IN:]
+            with ExitStack() as stack:
+                readers = [stack.enter_context(NameReader(run)) for run in group]
+                # Back in front: the runs stay in the input order, which keeps the merge stable.
+                runs.insert(0, _spill(heapq.merge(*readers, key=key), folder, next(numbers)))
+            for run in group:
+                os.remove(run)
+
+        with ExitStack() as stack:
+            readers = [stack.enter_context(NameReader(run)) for run in runs]
+            yield from heapq.merge(*readers, key=key)
+
+
+def _spill(names: Iterable[Namefully], folder: str, number: int) -> str:
+    path = os.path.join(folder, f'run-{number}.nmfy')
+    with NameWriter(path) as writer:
+        writer.extend(names)
+    return path
@@ -0,0 +1,187 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from ._config import Config
+from ._errors import NameError
+from ._full_name import FullName
+from ._name import FirstName, LastName, Name
+from ._namefully import Namefully, _to_parser
+from ._pool import NamePool
+from ._types import _Surname
+from ._utils import _UNIT_SEP
+
+__all__ = ['NameTable']
+
+_FIELDS = ('prefix', 'first_name', 'more', 'middle_name', 'last_name', 'mother', 'suffix')
+
+
+class NameTable:
+    """
+    A columnar (struct-of-arrays) container for many parsed names.
+
+    Instead of a graph of objects per name, each name part is stored as an index
+    into a table of distinct strings: one compact `array` per field, the strings
+    being shared by all the rows using them. All rows share the same `Config`:
+    a parsed name is only accepted with the same options (its context aside).
+
+    Rows come back as `Namefully` views built on demand from the shared strings,
+    and single fields can be scanned sequentially through `column()`.
+
+    Example:
+    --------
+    >>> table = NameTable.from_names(['John Smith', 'Jane Ben Smith'])
+    >>> len(table)
+    2
+    >>> list(table.column('last_name'))
+    ['Smith', 'Smith']
+    >>> table[1].middle
+    'Ben'
+    """
+
+    __slots__ = ('_config', '_strings', '_ids', '_columns', '_surnames')
+
+    def __init__(
+        self,
+        *,
+        context: Optional[str] = None,
+        ordered_by: str = 'first_name',
+        separator: str = ' ',
+        title: str = 'uk',
+        ending: bool = False,
+        bypass: bool = True,
+        surname: str = 'father',
+    ) -> None:
+        self._config = Config.merge(
+            name=context,
+            ordered_by=ordered_by,
+            separator=separator,
+            title=title,
+            ending=ending,
+            bypass=bypass,
+            surname=surname,
+        )
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._columns: Dict[str, array] = {field: array('i') for field in _FIELDS}
+        self._surnames = array('b')
+
+    @classmethod
+    def from_names(
+        cls, names: Iterable[Any], *, pool: Optional[NamePool] = None, lazy: bool = False, **options: Any
+    ) -> 'NameTable':
+        """
+        Parses raw names (see `Namefully.parse_many()`) straight into a new table.
+
+        The `pool` and `lazy` options only apply to the parsing; the other options
+        make the config of the table.
+        """
+        table = cls(**options)
+        table.extend(Namefully.parse_many(names, pool=pool, lazy=lazy, **options))
+        return table
+
+    def __len__(self) -> int:
+        return len(self._surnames)
+
+    def __repr__(self) -> str:
+        return f'<NameTable: {len(self)} names>'
+
+    def __getitem__(self, index: int) -> Namefully:
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[Namefully]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    @property
+    def nbytes(self) -> int:
+        """The approximate size of the index columns, excluding the shared strings."""
+        size = sum(column.itemsize * len(column) for column in self._columns.values())
+        return size + self._surnames.itemsize * len(self._surnames)
+
+    def append(self, name: Union[Namefully, Any]) -> None:
+        """
+        Adds a parsed name, or parses raw names using the table's config.
+
+        A parsed name must have the same options as the table (its context aside),
+        since its row is read back with the table's config.
+        """
+        if isinstance(name, Namefully):
+            full_name = name._full_name
+            if full_name._config._key[1:] != self._config._key[1:]:
+                message = f'expecting a name with the same options as the table, not {full_name._config!r}'
+                raise NameError.not_allowed(source=str(name), operation='append', message=message)
+        else:
+            full_name = _to_parser(name)._parse(self._config)
+
+        first, last = full_name.first_name, full_name.last_name
+        columns, intern = self._columns, self._intern
+        columns['prefix'].append(intern(full_name.prefix.value) if full_name.prefix else -1)
+        columns['first_name'].append(intern(first.value))
+        columns['more'].append(intern(_UNIT_SEP.join(first.more)) if first.has_more else -1)
+        middles = full_name.middle_name
+        columns['middle_name'].append(intern(_UNIT_SEP.join(n.value for n in middles)) if middles else -1)
+        columns['last_name'].append(intern(last.father))
+        columns['mother'].append(intern(last.mother) if last.mother else -1)
+        columns['suffix'].append(intern(full_name.suffix.value) if full_name.suffix else -1)
+        self._surnames.append(_Surname.index(last.format) if last.format in _Surname else 0)
+
+    def extend(self, names: Iterable[Union[Namefully, Any]]) -> None:
+        for name in names:
+            self.append(name)
+
+    def column(self, field: str) -> Iterator[Optional[str]]:
+        """
+        Scans a single field over all the rows.
+
+        The fields are: prefix, first_name, more (extra first names), middle_name,
+        last_name, mother (mother's surname) and suffix. Many names in the same
+        field (e.g., middle names) are joined with a space.
+        """
+        if field not in self._columns:
+            raise NameError.not_allowed(source=field, operation='column', message=f'expecting one of {_FIELDS}')
+        strings = self._strings
+        if field in ('more', 'middle_name'):
+            return (strings[i].replace(_UNIT_SEP, ' ') if i >= 0 else None for i in self._columns[field])
+        return (strings[i] if i >= 0 else None for i in self._columns[field])
+
+    def row(self, index: int) -> Namefully:
+        """Builds a `Namefully` view of a row out of the shared strings."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('NameTable index out of range')
+
+        strings, columns = self._strings, self._columns
+        more = columns['more'][index]
+        # The rows were validated when added: their parts are not validated again.
+        first_name = FirstName._unchecked(strings[columns['first_name'][index]], *self._split(more))
+        mother = columns['mother'][index]
+        last_name = LastName._unchecked(
+            strings[columns['last_name'][index]],
+            strings[mother] if mother >= 0 else None,
+            _Surname[self._surnames[index]],
+        )
+        prefix, middle, suffix = columns['prefix'][index], columns['middle_name'][index], columns['suffix'][index]
+        full_name = FullName._assemble(
+            self._config,
+            first_name,
+            last_name,
+            prefix=Name._unchecked(strings[prefix], 'prefix') if prefix >= 0 else None,
+            middle_name=[Name._unchecked(value, 'middle_name') for value in self._split(middle)],
+            suffix=Name._unchecked(strings[suffix], 'suffix') if suffix >= 0 else None,
+        )
+        return Namefully._of(full_name)
+
+    def _intern(self, value: str) -> int:
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self._strings)
+            self._strings.append(value)
+        return index
+
+    def _split(self, index: int) -> List[str]:
+        return self._strings[index].split(_UNIT_SEP) if index >= 0 else []
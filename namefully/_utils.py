@@ -1,3 +1,5 @@
+import unicodedata
+from functools import lru_cache
 from typing import Dict, Optional
 
 from ._constants import *
@@ -34,6 +36,8 @@ class NameIndex:
     don't follow the original name order due to randomness.
     """
 
+    __slots__ = ('prefix', 'first_name', 'middle_name', 'last_name', 'suffix')
+
     def __init__(self, prefix: int, first_name: int, middle_name: int, last_name: int, suffix: int):
         self.prefix = prefix
         self.first_name = first_name
@@ -109,3 +113,17 @@ def toggle_case(s: str) -> str:
         else:
             chars.append(c.upper())
     return ''.join(chars)
+
+
+# Joins many names of the same role (e.g., the middle names) into a single string.
+_UNIT_SEP = '\x1f'
+
+
+# Names repeat a lot in large lists: their keys are computed (and stored) once.
+@lru_cache(maxsize=65536)
+def _collate(s: str) -> str:
+    """The collation key of a string: case and accents are ignored (e.g., 'Élodie' -> 'elodie')."""
+    if s.isascii():
+        return s.lower()
+    decomposed = unicodedata.normalize('NFKD', s)
+    return ''.join([c for c in decomposed if not unicodedata.combining(c)]).casefold()
@@ -1,17 +1,40 @@
 import re
 from abc import ABC, abstractmethod
-from typing import Mapping, Optional, Sequence, Union
+from typing import Any, Mapping, Optional, Sequence, Union
 
 from ._constants import MAX_NUMBER_OF_NAME_PARTS as _max_names
 from ._constants import MIN_NUMBER_OF_NAME_PARTS as _min_names
-from ._errors import InputError, ValidationError
+from ._errors import InputError, NameError, ValidationError
 from ._name import FirstName, LastName, Name
 from ._types import _Namon
 from ._utils import NameIndex
 
 
+class _LazyPattern:
+    """A regular expression compiled on first use rather than at import time."""
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> 're.Pattern[str]':
+        compiled = re.compile(self.pattern)
+        setattr(owner, self.name, compiled)  # next lookups get the compiled pattern directly.
+        return compiled
+
+
+_BASE = r'[a-zA-Z\u00C0-\u00D6\u00D8-\u00f6\u00f8-\u00ff\u0400-\u04FFΆ-ωΑ-ώ]'
+
+# Every repetition starts with a separator (space, hyphen), which is never a
+# letter, so any input can only be matched one way: no catastrophic backtracking,
+# and the time to match (or reject) grows linearly with the input length.
+_NAMON = r'^' + _BASE + r'+(?:[ -]' + _BASE + r'+)*$'
+
+
 class ValidationRule:
-    base = re.compile(r'[a-zA-Z\u00C0-\u00D6\u00D8-\u00f6\u00f8-\u00ff\u0400-\u04FFΆ-ωΑ-ώ]')
+    base = _LazyPattern(_BASE)
 
     # Matches one name part (namon) that is of nature:
     # - Latin (English, Spanish, French, etc.)
@@ -19,14 +42,14 @@ class ValidationRule:
     # - hyphenated
     # - with apostrophe
     # - with space
-    namon = re.compile(r'^' + base.pattern + r'+(([' ' -]' + base.pattern + r')?' + base.pattern + r'*)*$')
+    namon = _LazyPattern(_NAMON)
 
     # Matches one name part (namon) that is of nature:
     # - Latin (English, Spanish, French, etc.)
     # - European (Greek, Cyrillic, Icelandic, German)
     # - hyphenated
     # - with apostrophe
-    first_name = namon
+    first_name = _LazyPattern(_NAMON)
 
     # Matches 1+ names part (namon) that are of nature:
     # - Latin (English, Spanish, French, etc.)
@@ -34,7 +57,7 @@ class ValidationRule:
     # - hyphenated
     # - with apostrophe
     # - with space
-    middle_name = re.compile(r'^' + base.pattern + r'+(([' ' -]' + base.pattern + r')?' + base.pattern + r'*)*$')
+    middle_name = _LazyPattern(_NAMON)
 
     # Matches one name part (namon) that is of nature:
     # - Latin (English, Spanish, French, etc.)
@@ -42,21 +65,100 @@ class ValidationRule:
     # - hyphenated
     # - with apostrophe
     # - with space
-    last_name = namon
+    last_name = _LazyPattern(_NAMON)
+
+
+class ValidationCode:
+    WRONG_TYPE = 'wrong_type'
+    INVALID_CONTENT = 'invalid_content'
+    EMPTY = 'empty'
+    OUT_OF_RANGE = 'out_of_range'
+    MISSING_KEYS = 'missing_keys'
+    MISSING_NAMES = 'missing_names'
+
+
+_INPUT_CODES = (
+    ValidationCode.EMPTY,
+    ValidationCode.OUT_OF_RANGE,
+    ValidationCode.MISSING_KEYS,
+    ValidationCode.MISSING_NAMES,
+)
+
+
+class ValidationResult:
+    """
+    The outcome of a validation check.
+
+    A result is truthy when valid. Otherwise, it carries an error code (see
+    `ValidationCode`), the name field at fault and the raw source. Nothing is
+    formatted until an error is actually needed through `to_error()`.
+    """
+
+    __slots__ = ('code', 'field', 'source', 'message')
+
+    def __init__(
+        self,
+        code: Optional[str] = None,
+        field: Optional[str] = None,
+        source: Any = None,
+        message: Optional[str] = None,
+    ) -> None:
+        self.code = code
+        self.field = field
+        self.source = source
+        self.message = message
+
+    def __bool__(self) -> bool:
+        return self.code is None
+
+    def __repr__(self) -> str:
+        return '<ValidationResult: ok>' if self.ok else f'<ValidationResult: {self.field}={self.code}>'
+
+    @property
+    def ok(self) -> bool:
+        return self.code is None
+
+    def to_error(self) -> Optional[NameError]:
+        """Converts a failed result into the error that `validate()` raises."""
+        if self.code is None:
+            return None
+        source = self.source
+        if isinstance(source, Mapping):
+            source = list(source.values())
+        elif isinstance(source, (list, tuple)):
+            source = [str(s) for s in source]
+        if self.code in _INPUT_CODES:
+            return InputError(source=source, message=self.message)
+        return ValidationError(source=source, name_type=self.field, message=self.message)
+
+
+_VALID = ValidationResult()
 
 
 class Validator(ABC):
     @abstractmethod
-    def validate(self, *args, **kwargs):
+    def check(self, *args, **kwargs) -> ValidationResult:
         raise NotImplementedError
 
-    def is_valid(self, *args, **kwargs):
+    def validate(self, *args, **kwargs):
+        self._raise_for(self.check(*args, **kwargs))
+
+    def is_valid(self, *args, **kwargs) -> bool:
         try:
-            self.validate(*args, **kwargs)
-            return True
+            return self.check(*args, **kwargs).code is None
         except Exception:
             return False
 
+    @staticmethod
+    def _raise_for(result: ValidationResult) -> None:
+        if result.code is not None:
+            raise result.to_error()  # type: ignore
+
+
+def _invalid(value: Any, field: Optional[str], code: str = ValidationCode.INVALID_CONTENT) -> ValidationResult:
+    message = 'wrong type' if code == ValidationCode.WRONG_TYPE else 'invalid content'
+    return ValidationResult(code, field, value, message)
+
 
 class NameValidator(Validator):
     def __new__(cls):
@@ -64,12 +166,13 @@ class NameValidator(Validator):
             cls.instance = super(NameValidator, cls).__new__(cls)
         return cls.instance
 
-    def validate(self, name: Name, type: Optional[str] = None):
+    def check(self, name: Name, type: Optional[str] = None) -> ValidationResult:
         if type in _Namon and name.type != type:
-            raise ValidationError(source=name.value, name_type=name.type, message='wrong type')
+            return _invalid(name.value, name.type, ValidationCode.WRONG_TYPE)
 
         if not ValidationRule.namon.match(name.value):
-            raise ValidationError(source=name.value, name_type=name.type, message='invalid content')
+            return _invalid(name.value, name.type)
+        return _VALID
 
 
 class NamonValidator(Validator):
@@ -78,12 +181,12 @@ class NamonValidator(Validator):
             cls.instance = super(NamonValidator, cls).__new__(cls)
         return cls.instance
 
-    def validate(self, value: Union[str, Name], type: Optional[str] = None):
+    def check(self, value: Union[str, Name], type: Optional[str] = None) -> ValidationResult:
         if isinstance(value, Name):
-            NameValidator().validate(value, type)
-        else:
-            if not ValidationRule.namon.match(value):
-                raise ValidationError(source=value, name_type=type or 'namon', message='invalid content')
+            return NameValidator().check(value, type)
+        if not ValidationRule.namon.match(value):
+            return _invalid(value, type or 'namon')
+        return _VALID
 
 
 class FirstNameValidator(Validator):
@@ -92,13 +195,16 @@ class FirstNameValidator(Validator):
             cls.instance = super(FirstNameValidator, cls).__new__(cls)
         return cls.instance
 
-    def validate(self, value: Union[str, FirstName]):
+    def check(self, value: Union[str, FirstName]) -> ValidationResult:
         if isinstance(value, FirstName):
             for name in value.as_names:
-                self.validate(name.value)
-        else:
-            if not ValidationRule.first_name.match(value):
-                raise ValidationError(source=value, name_type='first_name', message='invalid content')
+                result = self.check(name.value)
+                if not result:
+                    return result
+            return _VALID
+        if not ValidationRule.first_name.match(value):
+            return _invalid(value, 'first_name')
+        return _VALID
 
 
 class MiddleNameValidator(Validator):
@@ -107,17 +213,17 @@ class MiddleNameValidator(Validator):
             cls.instance = super(MiddleNameValidator, cls).__new__(cls)
         return cls.instance
 
-    def validate(self, value: Union[str, Sequence[str], Sequence[Name]]):
+    def check(self, value: Union[str, Sequence[str], Sequence[Name]]) -> ValidationResult:
         if isinstance(value, str):
             if not ValidationRule.middle_name.match(value):
-                raise ValidationError(source=value, name_type='middle_name', message='invalid content')
+                return _invalid(value, 'middle_name')
         elif isinstance(value, Sequence):
-            try:
-                validator = NamonValidator()
-                for name in value:
-                    validator.validate(name, 'middle_name')
-            except ValidationError as e:
-                raise ValidationError(source=str(value), name_type='middle_name', message=e.message) from e
+            validator = NamonValidator()
+            for name in value:
+                result = validator.check(name, 'middle_name')
+                if not result:
+                    return ValidationResult(result.code, 'middle_name', str(value), result.message)
+        return _VALID
 
 
 class LastNameValidator(Validator):
@@ -126,13 +232,16 @@ class LastNameValidator(Validator):
             cls.instance = super(LastNameValidator, cls).__new__(cls)
         return cls.instance
 
-    def validate(self, value: Union[str, LastName]):
+    def check(self, value: Union[str, LastName]) -> ValidationResult:
         if isinstance(value, LastName):
             for name in value.as_names:
-                self.validate(name.value)
-        else:
-            if not ValidationRule.last_name.match(value):
-                raise ValidationError(source=value, name_type='last_name', message='invalid content')
+                result = self.check(name.value)
+                if not result:
+                    return result
+            return _VALID
+        if not ValidationRule.last_name.match(value):
+            return _invalid(value, 'last_name')
+        return _VALID
 
 
 class NamaValidator(Validator):
@@ -141,40 +250,44 @@ class NamaValidator(Validator):
             cls.instance = super(NamaValidator, cls).__new__(cls)
         return cls.instance
 
-    def validate(self, value: Mapping[str, str]):
-        self.validate_keys(value)
-
-        if 'prefix' in value:
-            NamonValidator().validate(value['prefix'], 'prefix')
-        if 'middle_name' in value:
-            MiddleNameValidator().validate(value['middle_name'])
-        if 'suffix' in value:
-            NamonValidator().validate(value['suffix'], 'suffix')
-
-        FirstNameValidator().validate(value['first_name'])
-        LastNameValidator().validate(value['last_name'])
-
-    def validate_keys(self, value: Mapping[str, str]):
+    def check(self, value: Mapping[str, str]) -> ValidationResult:
+        result = self.check_keys(value)
+        if result and 'prefix' in value:
+            result = NamonValidator().check(value['prefix'], 'prefix')
+        if result and 'middle_name' in value:
+            result = MiddleNameValidator().check(value['middle_name'])
+        if result and 'suffix' in value:
+            result = NamonValidator().check(value['suffix'], 'suffix')
+        if result:
+            result = FirstNameValidator().check(value['first_name'])
+        if result:
+            result = LastNameValidator().check(value['last_name'])
+        return result
+
+    def check_keys(self, value: Mapping[str, str]) -> ValidationResult:
         length = len(value)
         if length == 0:
-            raise InputError(source=None, message='dict[str, str] must not be empty')
+            return ValidationResult(ValidationCode.EMPTY, None, None, 'dict[str, str] must not be empty')
 
         if length < _min_names or length > _max_names:
-            raise InputError(
-                source=list(value.values()), message=f'expecting a dict of {_min_names}-{_max_names} elements'
-            )
+            message = f'expecting a dict of {_min_names}-{_max_names} elements'
+            return ValidationResult(ValidationCode.OUT_OF_RANGE, None, value, message)
 
         if 'first_name' not in value or 'last_name' not in value:
-            raise InputError(source=list(value.values()), message='first_name and last_name keys are required')
+            message = 'first_name and last_name keys are required'
+            return ValidationResult(ValidationCode.MISSING_KEYS, None, value, message)
+        return _VALID
+
+    def validate_keys(self, value: Mapping[str, str]):
+        self._raise_for(self.check_keys(value))
 
 
 class SequenceValidator(Validator):
-    def validate(self, values: Sequence[Union[str, Name]]):
+    def check(self, values: Sequence[Union[str, Name]]) -> ValidationResult:
         if len(values) < _min_names or len(values) > _max_names:
-            raise InputError(
-                source=[str(val) for val in values],
-                message=f'expecting a list of {_min_names}-{_max_names} elements',
-            )
+            message = f'expecting a list of {_min_names}-{_max_names} elements'
+            return ValidationResult(ValidationCode.OUT_OF_RANGE, None, values, message)
+        return _VALID
 
 
 class SequentialNameValidator(SequenceValidator):
@@ -186,32 +299,51 @@ class SequentialNameValidator(SequenceValidator):
             cls.instance.index = index or NameIndex.base()
         return cls.instance
 
-    def validate_index(self, values: Sequence[Union[str, Name]]):
-        super().validate(values)
+    def check_index(self, values: Sequence[Union[str, Name]]) -> ValidationResult:
+        return super().check(values)
 
-    def validate_as_str(self, values: Sequence[str]):
-        self.validate_index(values)
+    def check_as_str(self, values: Sequence[str], index: Optional[NameIndex] = None) -> ValidationResult:
+        """Checks the name parts located by `index` (defaults to the validator's own)."""
+        result = self.check_index(values)
+        if not result:
+            return result
 
-        FirstNameValidator().validate(values[self.index.first_name])
-        LastNameValidator().validate(values[self.index.last_name])
+        index = index or self.index
+        result = FirstNameValidator().check(values[index.first_name])
+        if result:
+            result = LastNameValidator().check(values[index.last_name])
 
-        namon_validator = NamonValidator()
         length = len(values)
-        if length >= 3:
-            MiddleNameValidator().validate(values[self.index.middle_name])
-        if length >= 4:
-            namon_validator.validate(values[self.index.prefix], 'prefix')
-        if length == 5:
-            namon_validator.validate(values[self.index.suffix], 'suffix')
-
-    def validate_as_name(self, values: Sequence[Name]):
-        self.validate_index(values)
+        if result and length >= 3:
+            result = MiddleNameValidator().check(values[index.middle_name])
+        if result and length >= 4:
+            result = NamonValidator().check(values[index.prefix], 'prefix')
+        if result and length == 5:
+            result = NamonValidator().check(values[index.suffix], 'suffix')
+        return result
+
+    def check_as_name(self, values: Sequence[Name]) -> ValidationResult:
+        result = self.check_index(values)
+        if not result:
+            return result
 
         if len(values) < _min_names:
-            raise InputError(source=[n.value for n in values], message=f'expecting at least {_min_names} names')
+            message = f'expecting at least {_min_names} names'
+            return ValidationResult(ValidationCode.OUT_OF_RANGE, None, [n.value for n in values], message)
 
         if not any(name.is_first for name in values) or not any(name.is_last for name in values):
-            raise InputError(source=[n.value for n in values], message='both first and last names are required')
+            message = 'both first and last names are required'
+            return ValidationResult(ValidationCode.MISSING_NAMES, None, [n.value for n in values], message)
+        return _VALID
+
+    def validate_index(self, values: Sequence[Union[str, Name]]):
+        self._raise_for(self.check_index(values))
+
+    def validate_as_str(self, values: Sequence[str], index: Optional[NameIndex] = None):
+        self._raise_for(self.check_as_str(values, index))
+
+    def validate_as_name(self, values: Sequence[Name]):
+        self._raise_for(self.check_as_name(values))
 
 
 class Validators:
@@ -0,0 +1,305 @@
+"""A micro-benchmark suite for the hot paths of namefully.
+
+Every case runs over the same deterministic synthetic corpus, in several rounds,
+and reports the median of the best times per operation of each round, along with
+its time relative to a calibration workload. Results are emitted as JSON and can
+be compared with a stored baseline: any case slower than the baseline by more than
+a threshold (50% by default, above the noise of a shared machine) is reported and
+makes the run fail.
+
+Usage:
+    python -m namefully.bench [--count N] [--repeat N] [--rounds N] [--filter TEXT]
+                              [--output FILE] [--baseline FILE] [--threshold RATIO]
+
+The baseline is regenerated with the default options, on an idle machine, from the
+commit the next changes are compared with:
+
+    python -m namefully.bench --output benchmarks/baseline.json
+
+Relative times make it portable across machines of different speeds, but not
+across Python versions: regenerate it when the Python version of the gate changes.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ._name import FirstName, LastName, Name
+from ._namefully import Namefully
+from ._parser import NamaParser, SequentialStringParser, StringParser
+from ._utils import NameIndex
+from ._validators import (
+    FirstNameValidator,
+    LastNameValidator,
+    MiddleNameValidator,
+    NamaValidator,
+    NameValidator,
+    NamonValidator,
+    SequentialNameValidator,
+)
+from .builder import NameBuilder
+
+__all__ = ['CASES', 'corpus', 'run', 'compare', 'main']
+
+PREFIXES = ['Mr', 'Mrs', 'Dr', 'Prof']
+FIRST_NAMES = ['John', 'Maria', 'Ahmed', 'Wei', 'Olga', 'Jean', 'Fatima', 'Carlos', 'Anna', 'Kofi']
+MIDDLE_NAMES = ['Ben', 'Rose', 'Lee', 'Marie', 'Alva']
+LAST_NAMES = ['Smith', 'Garcia', 'Nguyen', 'Muller', 'Ivanova', 'Dupont', 'Okafor', 'Silva', 'Kim', 'Rossi']
+SUFFIXES = ['Jr', 'Sr', 'PhD']
+
+# A synthetic name: (prefix, first, middle, last, suffix).
+_Parts = Tuple[Optional[str], str, Optional[str], str, Optional[str]]
+
+# A case prepares its own inputs from the corpus and returns the function to time.
+_Case = Callable[[List[_Parts]], Callable[[], Any]]
+
+
+def corpus(count: int, seed: int = 42) -> List[_Parts]:
+    """Generates `count` synthetic names; the same seed always gives the same names."""
+    rng = random.Random(seed)
+    return [
+        (
+            rng.choice(PREFIXES) if rng.random() < 0.2 else None,
+            rng.choice(FIRST_NAMES),
+            rng.choice(MIDDLE_NAMES) if rng.random() < 0.3 else None,
+            rng.choice(LAST_NAMES),
+            rng.choice(SUFFIXES) if rng.random() < 0.1 else None,
+        )
+        for _ in range(count)
+    ]
+
+
+def _strings(names: List[_Parts]) -> List[str]:
+    return [' '.join(part for part in (first, middle, last) if part) for _, first, middle, last, _ in names]
+
+
+def _sequences(names: List[_Parts]) -> List[List[str]]:
+    # Sequential strings are read as [prefix, first, middle, last, suffix] when all are present.
+    return [[first, middle, last] if middle else [first, last] for _, first, middle, last, _ in names]
+
+
+def _mappings(names: List[_Parts]) -> List[Dict[str, str]]:
+    keys = ('prefix', 'first_name', 'middle_name', 'last_name', 'suffix')
+    return [{key: part for key, part in zip(keys, name) if part} for name in names]
+
+
+def _namefully(names: List[_Parts]) -> List[Namefully]:
+    return list(Namefully.parse_many(_strings(names)))
+
+
+def _each(items: Sequence[Any], fn: Callable[[Any], Any]) -> Callable[[], Any]:
+    return lambda: [fn(item) for item in items]
+
+
+def _parse_strings(names: List[_Parts]) -> Callable[[], Any]:
+    return _each(_strings(names), lambda raw: StringParser(raw).parse())
+
+
+def _parse_sequences(names: List[_Parts]) -> Callable[[], Any]:
+    return _each(_sequences(names), lambda raw: SequentialStringParser(raw).parse())
+
+
+def _parse_mappings(names: List[_Parts]) -> Callable[[], Any]:
+    return _each(_mappings(names), lambda raw: NamaParser(raw).parse())
+
+
+def _build(names: List[_Parts]) -> Callable[[], Any]:
+    def build(name: _Parts) -> Namefully:
+        prefix, first, middle, last, suffix = name
+        builder = NameBuilder.of(Name.first(first), Name.last(last))
+        if middle:
+            builder.add(Name.middle(middle))
+        if prefix:
+            builder.add(Name.prefix(prefix))
+        if suffix:
+            builder.add(Name.suffix(suffix))
+        return builder.build()
+
+    return _each(names, build)
+
+
+def _method(name: str, *args: Any, **kwargs: Any) -> _Case:
+    return lambda names: _each(_namefully(names), lambda item: getattr(item, name)(*args, **kwargs))
+
+
+def _validate(validator: Any, inputs: Callable[[List[_Parts]], Sequence[Any]], method: str = 'validate') -> _Case:
+    return lambda names: _each(inputs(names), getattr(validator, method))
+
+
+def _validate_sequences(names: List[_Parts]) -> Callable[[], Any]:
+    # Like the parser, every row is validated with the positions of its own length.
+    validate = SequentialNameValidator().validate_as_str
+    rows = [(row, NameIndex.when('first_name', len(row))) for row in _sequences(names)]
+    return lambda: [validate(row, index) for row, index in rows]
+
+
+CASES: Dict[str, _Case] = {
+    'parser.string': _parse_strings,
+    'parser.sequential_string': _parse_sequences,
+    'parser.nama': _parse_mappings,
+    'builder.build': _build,
+    'namefully.format': _method('format', 'L, f m'),
+    'namefully.format_official': _method('format', 'official'),
+    'namefully.flatten': _method('flatten', limit=0, by='middle_name'),
+    'case.upper': _method('upper'),
+    'case.lower': _method('lower'),
+    'case.camel': _method('camel'),
+    'case.pascal': _method('pascal'),
+    'case.snake': _method('snake'),
+    'case.kebab': _method('kebab'),
+    'case.dot': _method('dot'),
+    'case.toggle': _method('toggle'),
+    'validator.name': _validate(NameValidator(), lambda names: [Name.first(n[1]) for n in names]),
+    'validator.namon': _validate(NamonValidator(), lambda names: [n[3] for n in names]),
+    'validator.first_name': _validate(FirstNameValidator(), lambda names: [FirstName(n[1]) for n in names]),
+    'validator.middle_name': _validate(MiddleNameValidator(), lambda names: [n[2] or 'Ben' for n in names]),
+    'validator.last_name': _validate(LastNameValidator(), lambda names: [LastName(n[3]) for n in names]),
+    'validator.nama': _validate(NamaValidator(), _mappings),
+    'validator.sequential_str': _validate_sequences,
+    'validator.sequential_name': _validate(
+        SequentialNameValidator(),
+        lambda names: [[Name.first(n[1]), Name.last(n[3])] for n in names],
+        'validate_as_name',
+    ),
+}
+
+
+def _calibrate(names: List[_Parts]) -> Callable[[], Any]:
+    # A fixed pure-Python workload, independent of namefully, to tell the speed of the machine.
+    return _each(names, lambda name: ' '.join(part.upper() for part in name if part))
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()  # like `timeit`, keeps collections from landing in random cases.
+        try:
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def run(
+    count: int = 10_000, repeat: int = 3, only: Optional[str] = None, seed: int = 42, rounds: int = 5
+) -> Dict[str, Any]:
+    """
+    Runs the cases (or those whose name contains `only`) and returns the results.
+
+    The whole suite runs `rounds` times, keeping the best of `repeat` runs of each
+    case per round, and the median of the rounds: a burst of load on the machine
+    spoils a round, not the results. Each case is also timed relative to the
+    calibration workload run right before it, which follows the speed of the
+    machine at that moment.
+    """
+    names = corpus(count, seed)
+    cases = {case: prepare(names) for case, prepare in CASES.items() if not only or only in case}
+    calibrate = _calibrate(names)
+    for fn in [calibrate, *cases.values()]:
+        fn()  # warm-up: fills the caches (e.g., compiled patterns) the way a real workload would.
+    # The inputs of all the cases are alive at once: kept out of the collections between the runs.
+    gc.collect()
+    gc.freeze()
+
+    times: Dict[str, List[float]] = {case: [] for case in cases}
+    relatives: Dict[str, List[float]] = {case: [] for case in cases}
+    calibrations: List[float] = []
+    try:
+        for _ in range(rounds):
+            for case, fn in cases.items():
+                calibration = _time(calibrate, repeat)
+                best = _time(fn, repeat)
+                calibrations.append(calibration)
+                times[case].append(best)
+                relatives[case].append(best / calibration)
+    finally:
+        gc.unfreeze()
+
+    results = {}
+    for case in cases:
+        best = statistics.median(times[case])
+        results[case] = {
+            'ns_per_op': round(best / count * 1e9, 1),
+            'ops_per_sec': round(count / best),
+            'relative': round(statistics.median(relatives[case]), 3),
+        }
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'count': count,
+        'repeat': repeat,
+        'rounds': rounds,
+        'seed': seed,
+        'calibration_ns': round(statistics.median(calibrations) / count * 1e9, 1) if calibrations else None,
+        'results': results,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.5) -> List[str]:
+    """Lists the cases slower than the baseline by more than `threshold` (e.g., 0.5 for 50%).
+
+    The cases are compared by their times relative to the calibration workload,
+    so that a baseline recorded on a machine of another speed (or under another
+    load) remains meaningful. Baselines without relative times are compared by
+    their times, scaled by the calibrations of both runs.
+    """
+    scale = 1.0
+    if results.get('calibration_ns') and baseline.get('calibration_ns'):
+        scale = baseline['calibration_ns'] / results['calibration_ns']
+
+    regressions = []
+    for case, result in results['results'].items():
+        reference = baseline.get('results', {}).get(case)
+        if not reference:
+            continue
+        if result.get('relative') and reference.get('relative'):
+            ratio = result['relative'] / reference['relative']
+        else:
+            ratio = result['ns_per_op'] * scale / reference['ns_per_op']
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{case}: {result['ns_per_op']:.1f} ns/op vs {reference['ns_per_op']:.1f} ns/op ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m namefully.bench', description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=10_000, help='number of names per case')
+    parser.add_argument('--repeat', type=int, default=3, help='number of runs per case and round; the best is kept')
+    parser.add_argument('--rounds', type=int, default=5, help='number of runs of the suite; the median is kept')
+    parser.add_argument('--filter', dest='only', help='only run the cases whose name contains this text')
+    parser.add_argument('--output', help='write the JSON results to this file instead of stdout')
+    parser.add_argument('--baseline', help='JSON results to compare with')
+    parser.add_argument('--threshold', type=float, default=0.5, help='tolerated slowdown ratio (default: 0.5)')
+    args = parser.parse_args(argv)
+
+    results = run(args.count, args.repeat, args.only, rounds=args.rounds)
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(report + '\n')
+    else:
+        sys.stdout.write(report + '\n')
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for regression in regressions:
+            sys.stderr.write(f'regression: {regression}\n')
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from namefully import NameError, Namefully, aformat_many, aparse_many
+
+NAMES = ['John Smith', 'Jane Ben Doe', 'Mr Ali Reza Khan', 'Mr Carl Lee Smith Ph.D'] * 50
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+async def stream(names):
+    for name in names:
+        yield name
+
+
+def test_aparse_many_matches_parse_many():
+    parsed = asyncio.run(collect(aparse_many(stream(NAMES), chunksize=7, title='us')))
+    assert [name.full for name in parsed] == [name.full for name in Namefully.parse_many(NAMES, title='us')]
+
+
+@pytest.mark.parametrize('executor_class', [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_aformat_many_offloads_chunks_in_order(executor_class):
+    with executor_class(max_workers=2) as executor:
+        formatted = asyncio.run(collect(aformat_many(NAMES, 'L, f', chunksize=16, executor=executor, concurrency=3)))
+        parsed = asyncio.run(collect(aparse_many(NAMES[:4], executor=executor)))
+    assert formatted == [name.format('L, f') for name in Namefully.parse_many(NAMES)]
+    assert [name.short for name in parsed] == ['John Smith', 'Jane Doe', 'Ali Khan', 'Carl Smith']
+
+
+def test_async_batches_yield_to_the_event_loop():
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+        await collect(aparse_many(NAMES, chunksize=10))
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(main()) >= len(NAMES) // 10 - 1
+
+
+def test_async_batches_raise_name_errors():
+    with pytest.raises(NameError):
+        asyncio.run(collect(aparse_many(['John Smith', 'John'])))
+    with pytest.raises(NameError):
+        asyncio.run(collect(aformat_many(NAMES, 'x')))
+    with ThreadPoolExecutor(max_workers=1) as executor, pytest.raises(NameError):
+        asyncio.run(collect(aformat_many(['John'], 'f', executor=executor)))
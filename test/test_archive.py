@@ -0,0 +1,100 @@
+import pytest
+
+from namefully import FirstName, FullName, LastName, Name, NameError, Namefully, NameReader, NameWriter
+
+RAW = [
+    'Mr John Ben Smith Ph.D',
+    'Jane Smith',
+    [FirstName('Daniel', 'Michael'), Name.middle('Blake'), Name.middle('Rose'), LastName('Day', 'Lewis')],
+    {'prefix': 'Dr', 'first_name': 'Émile', 'last_name': 'Zoé'},
+]
+
+
+@pytest.fixture
+def names():
+    return list(Namefully.parse_many(RAW, title='us', surname='hyphenated', ordered_by='last_name', ending=True))
+
+
+def test_names_round_trip_through_bytes(names):
+    for name in names:
+        data = name.to_bytes()
+        copy = Namefully.from_bytes(data)
+        assert copy.to_dict() == name.to_dict()
+        assert copy.full == name.full
+        assert copy.config is name.config
+        assert copy.last_name() == name.last_name()
+        assert FullName.from_bytes(memoryview(data)).to_bytes() == data
+
+    assert len(names[1].to_bytes()) < len(str(names[1].to_dict()))
+
+
+def test_invalid_bytes_are_rejected(names):
+    data = names[0].to_bytes()
+    for corrupted in (data[:-1], data + b'\x00', b'\x09' + data[1:], b''):
+        with pytest.raises(NameError):
+            Namefully.from_bytes(corrupted)
+
+
+def test_truncated_and_corrupted_bytes_raise_name_errors(names):
+    data = names[0].to_bytes()
+    for end in range(len(data)):
+        with pytest.raises(NameError):
+            Namefully.from_bytes(data[:end])
+
+    # An unknown separator, and a first name without any character.
+    with pytest.raises(NameError):
+        Namefully.from_bytes(data[:2] + bytes([200]) + data[3:])
+    first = Namefully.from_bytes(data)._full_name._first_name.value.encode()
+    start = data.index(first)
+    lengths = data.index(len(first).to_bytes(2, 'little'), 6)
+    with pytest.raises(NameError):
+        Namefully.from_bytes(data[:lengths] + b'\x00\x00' + data[lengths + 2 : start] + data[start + len(first) :])
+
+    # Any corrupted byte gives a name or a `NameError`, never another error.
+    for position in range(len(data)):
+        for value in (0, 200, 255):
+            try:
+                Namefully.from_bytes(data[:position] + bytes([value]) + data[position + 1 :])
+            except NameError:
+                pass
+
+
+def test_unknown_separators_cannot_be_encoded():
+    name = Namefully('John~Smith', context='binary_separator', separator='~')
+    with pytest.raises(NameError, match='separator'):
+        name.to_bytes()
+
+
+def test_archive_streams_and_accesses_records(tmp_path, names):
+    path = tmp_path / 'names.nmfy'
+    with NameWriter(path) as writer:
+        writer.extend(names)
+        writer.write(names[0]._full_name)
+        assert len(writer) == 5
+    with pytest.raises(NameError):
+        writer.write(names[0])
+
+    with NameReader(path) as reader:
+        assert len(reader) == 5
+        assert [name.full for name in reader] == [name.full for name in names + names[:1]]
+        assert reader[2].to_dict() == names[2].to_dict()
+        assert reader[-1].full == names[0].full
+        with pytest.raises(IndexError):
+            reader[5]
+
+        iterator = iter(reader)
+        assert next(iterator).full == names[0].full
+        assert reader[3].full == names[3].full  # random access while iterating
+        assert next(iterator).full == names[1].full
+
+
+def test_incomplete_archives_are_rejected(tmp_path, names):
+    path = tmp_path / 'names.nmfy'
+    writer = NameWriter(path)
+    writer.write(names[0])
+    writer._file.flush()
+    with pytest.raises(NameError):
+        NameReader(path)
+    writer.close()
+    with NameReader(path) as reader:
+        assert len(reader) == 1
@@ -0,0 +1,90 @@
+import pytest
+
+from namefully import (
+    FirstName,
+    LastName,
+    Name,
+    NameError,
+    Namefully,
+    NameTable,
+    format_many,
+    initials_many,
+    lower_many,
+    sort_keys,
+    upper_many,
+    zip_many,
+)
+
+RAW = [
+    'Mr John Ben Smith Ph.D',
+    'Jane Smith',
+    [FirstName('Daniel', 'Michael'), Name.middle('Blake'), Name.middle('Rose'), LastName('Day', 'Lewis')],
+    {'prefix': 'Dr', 'first_name': 'Albert', 'last_name': 'Einstein'},
+    [Name.first('Ana'), LastName('Ortiz')],
+]
+
+PATTERNS = [
+    'short',
+    'long',
+    'public',
+    'official',
+    'L, f',
+    'b',
+    'B',
+    'f $m. l',
+    r'$F.$M.$L.',
+    'p f m l s',
+    'P F M L S',
+    'O',
+    '',
+]
+
+
+@pytest.mark.parametrize('surname', ['father', 'mother', 'hyphenated', 'all'])
+@pytest.mark.parametrize('ordered_by', ['first_name', 'last_name'])
+def test_batch_operations_match_per_name_calls(ordered_by, surname):
+    options = dict(ordered_by=ordered_by, surname=surname, title='us', ending=surname == 'all')
+    names = list(Namefully.parse_many(RAW, **options))
+    table = NameTable.from_names(RAW, **options)
+
+    for pattern in PATTERNS:
+        expected = [name.format(pattern) for name in names]
+        assert format_many(names, pattern) == expected
+        assert format_many(table, pattern) == expected
+
+    for source in (names, table):
+        assert upper_many(source) == [name.upper() for name in names]
+        assert lower_many(source) == [name.lower() for name in names]
+        assert initials_many(source) == [name.initials() for name in names]
+        assert zip_many(source, by='first_mid') == [name.zip(by='first_mid') for name in names]
+        assert sort_keys(source) == [name.sort_key() for name in names]
+
+
+def test_batch_operations_reject_bad_input():
+    table = NameTable.from_names(RAW)
+    with pytest.raises(NameError):
+        format_many(table, 'x')
+    with pytest.raises(NameError):
+        upper_many(table, backend='cuda')
+    assert format_many(NameTable(), 'L, f') == []
+
+
+def test_batch_operations_with_numpy_backend():
+    pytest.importorskip('numpy')
+    names = list(Namefully.parse_many(RAW))
+    table = NameTable.from_names(RAW)
+
+    assert format_many(table, 'L, $f.', backend='numpy') == [name.format('L, $f.') for name in names]
+    assert upper_many(names, backend='numpy') == [name.upper() for name in names]
+    assert lower_many(table, backend='numpy') == [name.lower() for name in names]
+    assert initials_many(table, backend='numpy') == [name.initials() for name in names]
+
+
+def test_numpy_backend_keeps_the_case_changes_lengthening_names():
+    pytest.importorskip('numpy')
+    raw = ['Anna Groß', 'Jürgen Strauß']
+    table = NameTable.from_names(raw)
+    for pattern in ('L, f', 'F L', 'l f'):
+        assert format_many(table, pattern, backend='numpy') == format_many(table, pattern)
+    assert format_many(table, 'L', backend='numpy') == ['GROSS', 'STRAUSS']
+    assert upper_many(table, backend='numpy') == upper_many(table)
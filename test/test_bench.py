@@ -0,0 +1,43 @@
+import json
+
+from namefully import bench
+
+
+def test_bench_corpus_is_deterministic():
+    assert bench.corpus(50) == bench.corpus(50)
+    assert bench.corpus(50) != bench.corpus(50, seed=7)
+
+
+def test_bench_runs_every_case(tmp_path):
+    output = tmp_path / 'results.json'
+    assert bench.main(['--count', '20', '--repeat', '1', '--rounds', '2', '--output', str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert results['count'] == 20
+    assert set(results['results']) == set(bench.CASES)
+    assert all(result['ns_per_op'] > 0 for result in results['results'].values())
+
+
+def test_bench_fails_on_regressions(tmp_path):
+    results = bench.run(count=20, repeat=1, only='parser.nama', rounds=1)
+    faster = {'calibration_ns': results['calibration_ns'], 'results': {'parser.nama': {'ns_per_op': 1e-3}}}
+    assert bench.compare(results, results) == []
+    assert bench.compare(results, faster)[0].startswith('parser.nama:')
+
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(faster))
+    args = ['--count', '20', '--repeat', '1', '--rounds', '1', '--filter', 'parser.nama', '--baseline', str(baseline)]
+    assert bench.main(args + ['--output', str(tmp_path / 'results.json')]) == 1
+
+
+def test_bench_compares_times_relative_to_the_calibration():
+    results = bench.run(count=20, repeat=1, only='parser.nama', rounds=3)
+    relative = results['results']['parser.nama']['relative']
+    assert relative > 0
+
+    # A slower machine (or a busier one) takes longer for the same relative times.
+    slower = {'calibration_ns': 1.0, 'results': {'parser.nama': {'ns_per_op': 1e-3, 'relative': relative}}}
+    assert bench.compare(results, slower) == []
+    slower['results']['parser.nama']['relative'] = relative / 2
+    assert bench.compare(results, slower, threshold=0.5)[0].startswith('parser.nama:')
+    assert bench.compare(results, slower, threshold=1.5) == []
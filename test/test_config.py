@@ -1,4 +1,10 @@
-from namefully import Config
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from namefully import Config, Namefully
 
 
 def test_creates_default_configuration():
@@ -73,7 +79,9 @@ def test_can_create_copy_from_existing_configuration():
     assert config.ending is False
     assert config.surname == 'father'
 
-    copy.reset()
+    reset = copy.reset()
+    assert copy.ordered_by == 'last_name'  # configurations are immutable.
+    copy = reset
     assert copy.name == 'config_copy'
     assert copy.ordered_by == 'first_name'
     assert copy.separator == ' '
@@ -81,3 +89,68 @@ def test_can_create_copy_from_existing_configuration():
     assert copy.bypass is True
     assert copy.ending is False
     assert copy.surname == 'father'
+
+
+def test_configuration_is_immutable_and_interned():
+    config = Config.merge(name='frozen', ordered_by='last_name', title='us')
+    with pytest.raises(AttributeError):
+        config._ordered_by = 'first_name'  # type: ignore
+
+    assert Config.merge(name='frozen', ordered_by='last_name', title='us') is config
+    assert Config.merge(name='frozen', ordered_by='first_name') is not config
+    assert config == Config.merge(name='frozen', title='us', ordered_by='last_name')
+    assert hash(config) == hash(Config.merge(name='frozen', title='us', ordered_by='last_name'))
+    assert pickle.loads(pickle.dumps(config)) is config
+    assert config.update_order('first_name').ordered_by == 'first_name'
+    assert config.ordered_by == 'last_name'
+
+
+def test_partial_merges_do_not_inherit_options_merged_elsewhere():
+    custom = Config.merge(name='partial', ordered_by='last_name', title='us', ending=True)
+    partial = Config.merge(name='partial', separator='comma')
+    assert partial.ordered_by == 'first_name'
+    assert partial.title == 'uk'
+    assert partial.ending is False
+    assert custom.ordered_by == 'last_name'
+
+    name = Namefully.only('John', 'Smith', context='partial')
+    assert name.config.ordered_by == 'first_name'
+    assert name.full == 'John Smith'
+
+
+def test_flipping_name_order_does_not_leak_to_other_names():
+    name = Namefully('John Smith', context='shared')
+    other = Namefully('Jane Doe', context='shared')
+    name.flip()
+    assert name.full == 'Smith John'
+    assert other.full == 'Jane Doe'
+    assert Config.create('shared').ordered_by == 'first_name'
+
+
+def test_names_can_be_parsed_concurrently_with_mixed_options():
+    barrier = threading.Barrier(8)
+
+    def parse(worker: int):
+        barrier.wait()
+        by_last = worker % 2 == 1
+        results = []
+        for i in range(300):
+            raw = 'Smith John Ben' if by_last else 'John Ben Smith'
+            name = Namefully(
+                raw,
+                context='stress',
+                ordered_by='last_name' if by_last else 'first_name',
+                title='us' if i % 3 else 'uk',
+                ending=bool(i % 2),
+            )
+            if i % 50 == 0:
+                name.flip()
+                name.flip()
+            results.append((name.first, name.last, name.middle, name.config.ordered_by, name.config.ending))
+        return by_last, results
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for by_last, results in executor.map(parse, range(8)):
+            order = 'last_name' if by_last else 'first_name'
+            for i, result in enumerate(results):
+                assert result == ('John', 'Smith', 'Ben', order, bool(i % 2))
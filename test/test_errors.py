@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from namefully import FullName, NameError, NameErrorType, Namefully
@@ -155,3 +157,14 @@ def test_validation_error_if_dict_name_values_are_incorrect(config):
 def test_validation_error_if_string_list_breaks_validation_rules(config):
     with pytest.raises(ValidationError):
         Namefully(['j4ne', 'doe'], **config)
+
+
+def test_errors_can_be_pickled():
+    for error in [
+        InputError(source=['Jane', 'Doe'], message=MESSAGE),
+        ValidationError(source=NAME, name_type='first_name', message=MESSAGE),
+        NotAllowedError(source=NAME, operation='lower', message=MESSAGE),
+    ]:
+        copy = pickle.loads(pickle.dumps(error))
+        assert type(copy) is type(error)
+        assert str(copy) == str(error)
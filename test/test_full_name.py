@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from namefully import FirstName, FullName, LastName, Name, NameError
@@ -108,3 +110,15 @@ def test_to_iterable_returns_sequence_of_name_parts():
 
     with pytest.raises(StopIteration):
         next(parts)  # no more names available
+
+
+def test_full_names_are_pickled_with_a_shared_config(setup_names):
+    prefix, first_name, middle_name, last_name, suffix = setup_names
+    full_name = FullName(ordered_by='last_name', title='us')
+    full_name.prefix, full_name.first_name, full_name.middle_name = prefix, first_name, middle_name
+    full_name.last_name, full_name.suffix = last_name, suffix
+
+    copy = pickle.loads(pickle.dumps(full_name))
+    assert copy.config is full_name.config
+    assert copy.to_iterable(True) == full_name.to_iterable(True)
+    assert [name.value for name in copy.middle_name] == ['Ben', 'Carl']
@@ -0,0 +1,101 @@
+import pytest
+
+import namefully
+from namefully import NameError, Namefully, NameTable, Parser, _instrument, format_many, instrument, stats
+from namefully._parser import StringParser
+
+
+@pytest.fixture
+def instrumented():
+    stats(reset=True)
+    instrument()
+    yield
+    instrument(enabled=False)
+    stats(reset=True)
+
+
+@pytest.mark.usefixtures('instrumented')
+def test_instrumentation_records_stages():
+    name = Namefully('John Ben Smith', bypass=False)
+    name.format('L, f')
+    name.format(pattern='L, f')
+    name.flatten(limit=0, by='all')
+    with pytest.raises(NameError):
+        Namefully('John')
+    with pytest.raises(NameError):
+        name.format('x')
+
+    counters = stats()
+    assert counters['format.L, f']['calls'] == 2
+    assert counters['format.x'] == {'calls': 1, 'errors': 1, 'time': counters['format.x']['time']}
+    assert counters['flatten.all']['calls'] == 1
+    assert counters['parse.StringParser'] == {'calls': 2, 'errors': 1, 'time': counters['parse.StringParser']['time']}
+    assert 'parse.SequentialStringParser' not in counters  # nested in StringParser: counted once.
+    assert counters['config.merge']['calls'] >= 2
+    assert counters['validate.FirstNameValidator']['calls'] >= 1
+    assert counters['validate.SequentialNameValidator.index']['errors'] == 1
+    assert all(counter['time'] >= 0 for counter in counters.values())
+
+
+@pytest.mark.usefixtures('instrumented')
+def test_instrumentation_covers_compiled_formats_and_batches():
+    names = list(Namefully.parse_many(['John Smith', 'Jane Doe']))
+    formatter = Namefully.compile_format('f L')
+    assert [formatter(name) for name in names] == ['John SMITH', 'Jane DOE']
+    assert namefully.format_many(NameTable.from_names(['John Smith']), 'L') == ['SMITH']
+    namefully.upper_many(names)
+
+    counters = stats()
+    assert counters['compile.format']['calls'] == 1
+    assert counters['format.f L']['calls'] == 2
+    assert counters['batch.format_many']['calls'] == 1
+    assert counters['batch.upper_many']['calls'] == 1
+
+
+@pytest.mark.usefixtures('instrumented')
+def test_instrumentation_covers_every_parser():
+    name = Namefully(Parser.build('Dr John Ben Smith Jr'))
+    assert name.prefix == 'Dr'
+    assert stats()['parse._AffixedStringParser']['calls'] == 1
+
+    def subclasses(cls):
+        for subclass in cls.__subclasses__():
+            yield subclass
+            yield from subclasses(subclass)
+
+    targets = {(owner, attr) for owner, attr, *_ in _instrument._targets()}
+    parsers = [cls for cls in subclasses(Parser) if cls.__module__.startswith('namefully.') and '_parse' in vars(cls)]
+    assert parsers
+    assert [cls.__name__ for cls in parsers if (cls, '_parse') not in targets] == []
+
+
+@pytest.mark.usefixtures('instrumented')
+def test_instrumentation_bounds_the_format_stages():
+    name = Namefully('John Ben Smith')
+    patterns = [f'f {"m" * count} l' for count in range(1, 80)]
+    for pattern in patterns:
+        name.format(pattern)
+    name.format(patterns[0])
+
+    counters = stats()
+    stages = [stage for stage in counters if stage.startswith('format.')]
+    assert len(stages) == 65
+    assert counters[f'format.{patterns[0]}']['calls'] == 2
+    assert counters['format.<other>']['calls'] == 79 - 64
+
+
+@pytest.mark.usefixtures('instrumented')
+def test_instrumentation_is_removed_when_disabled():
+    wrapped = StringParser.__dict__['_parse']
+    instrument()  # already enabled: no double wrapping.
+    assert StringParser.__dict__['_parse'] is wrapped
+    instrument(enabled=False)
+    assert StringParser.__dict__['_parse'] is not wrapped
+    assert not hasattr(StringParser._parse, '__wrapped__')
+
+    assert namefully.format_many is format_many
+    assert not hasattr(namefully.format_many, '__wrapped__')
+
+    stats(reset=True)
+    Namefully('John Smith').format('f')
+    assert stats() == {}
@@ -0,0 +1,48 @@
+import pytest
+
+from namefully import NameError, read_lines, read_names
+from namefully._types import Separator
+
+
+@pytest.fixture
+def names_file(tmp_path):
+    path = tmp_path / 'names.txt'
+    path.write_bytes('John Smith\r\n\n  Jane Ben Doe  \nÉmile Zoé Durand'.encode('utf-8'))
+    return path
+
+
+def test_read_lines_scans_records(names_file, tmp_path):
+    assert list(read_lines(names_file)) == ['John Smith', 'Jane Ben Doe', 'Émile Zoé Durand']
+    assert list(read_lines(str(names_file))) == list(read_lines(names_file))
+
+    empty = tmp_path / 'empty.txt'
+    empty.write_bytes(b'')
+    assert list(read_lines(empty)) == []
+
+
+def test_read_names_parses_each_line(names_file):
+    names = list(read_names(names_file, ordered_by='last_name'))
+    assert [name.first for name in names] == ['Smith', 'Ben', 'Zoé']
+    assert names[2].full == 'Émile Zoé Durand'
+
+
+@pytest.mark.parametrize('separator', [Separator.comma, 'comma', ','])
+def test_read_names_supports_separators(tmp_path, separator):
+    path = tmp_path / 'names.csv'
+    path.write_text('Mr,John,Ben,Smith,Ph.D\nJane,Doe\n', encoding='latin-1')
+    names = list(read_names(path, encoding='latin-1', separator=separator))
+    assert [name.short for name in names] == ['John Smith', 'Jane Doe']
+    assert names[0].prefix == 'Mr'
+    with pytest.raises(NameError):
+        read_names(path, separator='|')
+
+
+def test_read_lines_by_blocks_and_releases_scanned_pages(tmp_path, monkeypatch):
+    import namefully._io
+
+    monkeypatch.setattr(namefully._io, '_WINDOW', 4096)
+    monkeypatch.setattr(namefully._io, '_BLOCK', 100)
+    path = tmp_path / 'many.txt'
+    lines = [f'John{chr(97 + i % 26)} Smith' for i in range(5_000)] + ['John ' + 'Smith' * 50]
+    path.write_text('\n'.join(lines) + '\n')
+    assert list(read_lines(path)) == lines
@@ -0,0 +1,66 @@
+import pytest
+
+from namefully import FirstName, LastName, NameError, Namefully, NameMatcher, jaro_winkler, levenshtein
+
+REFERENCE = ['John Smith', 'Jane Doe', 'Jon Smyth', 'Mary Johnson', 'Johnny Smithers']
+
+
+@pytest.mark.parametrize(
+    'a, b, distance',
+    [('kitten', 'sitting', 3), ('flaw', 'lawn', 2), ('', 'abc', 3), ('abc', 'abc', 0), ('smith', 'smyth', 1)],
+)
+def test_levenshtein(a, b, distance):
+    assert levenshtein(a, b) == distance
+    assert levenshtein(b, a) == distance
+
+
+def test_levenshtein_stops_beyond_max_distance():
+    assert levenshtein('kitten', 'sitting', max_distance=3) == 3
+    assert levenshtein('kitten', 'sitting', max_distance=2) == 3
+    assert levenshtein('abc', 'abcdefgh', max_distance=1) == 2
+    assert levenshtein('johnson', 'jonsen', max_distance=0) == 1
+
+
+def test_jaro_winkler():
+    assert jaro_winkler('martha', 'marhta') == pytest.approx(0.961, abs=1e-3)
+    assert jaro_winkler('dwayne', 'duane') == pytest.approx(0.84, abs=1e-3)
+    assert jaro_winkler('dixon', 'dicksonx') == pytest.approx(0.813, abs=1e-3)
+    assert jaro_winkler('abc', 'abc') == 1.0
+    assert jaro_winkler('abc', 'xyz') == 0.0
+    assert jaro_winkler('', 'abc') == 0.0
+
+
+def test_matcher_scores_blocked_candidates():
+    matcher = NameMatcher(Namefully.parse_many(REFERENCE))
+    assert len(matcher) == 5
+    assert matcher.match(Namefully('Jon Smyth')) == [(2, 1.0), (0, 0.909)]
+    assert matcher.match(Namefully('JOHN SMÎTH'), limit=1) == [(0, 1.0)]
+    assert matcher.match(Namefully('Peter Smith')) == []  # another first initial.
+    assert matcher.match(Namefully('Jane Doe')) == [(1, 1.0)]
+
+
+def test_matcher_compares_both_surnames():
+    matcher = NameMatcher([Namefully([FirstName('Maria'), LastName('Garcia', 'Lopez')])])
+    assert matcher.match(Namefully('Marie Lopes')) == [(0, 0.92)]
+    assert matcher.add(Namefully('Maria Lopez')) == 1
+    assert matcher.match(Namefully('Maria Lopez')) == [(0, 1.0), (1, 1.0)]
+
+
+def test_matcher_with_levenshtein_metric():
+    matcher = NameMatcher(Namefully.parse_many(REFERENCE), metric='levenshtein', threshold=0.75)
+    assert matcher.match(Namefully('Jon Smyth')) == [(2, 1.0), (0, 0.78)]
+    matcher = NameMatcher(Namefully.parse_many(REFERENCE), blocking='metaphone')
+    assert matcher.match(Namefully('Jon Smith'))[0] == (0, 0.973)
+
+    with pytest.raises(NameError):
+        NameMatcher([], metric='hamming')
+    with pytest.raises(NameError):
+        NameMatcher([], blocking='nysiis')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_match_many_preserves_order(workers):
+    matcher = NameMatcher(Namefully.parse_many(REFERENCE))
+    queries = list(Namefully.parse_many(['Jon Smyth', 'Jane Doe', 'Peter Pan'] * 10))
+    matches = list(matcher.match_many(queries, workers=workers, chunksize=4))
+    assert matches == [matcher.match(query) for query in queries]
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from namefully import FirstName, LastName, Name, NameError
@@ -221,3 +223,27 @@ def test_copy_with_make_a_copy_of_last_names_with_specific_parts(last_name):
     assert copy.length == 11
     assert copy.to_str(format='mother') == 'Kruger'
     assert copy.type == 'last_name'
+
+
+def test_names_are_pickled_with_their_parts():
+    for name in (Name.middle('Ben', caps_range='all'), FirstName('John', 'Ben'), LastName('Smith', 'Doe', 'all')):
+        copy = pickle.loads(pickle.dumps(name))
+        assert type(copy) is type(name)
+        assert copy == name
+        assert copy.initials() == name.initials()
+        assert copy._caps_range == name._caps_range
+    assert pickle.loads(pickle.dumps(FirstName('John', 'Ben'))).more == ['Ben']
+    assert pickle.loads(pickle.dumps(LastName('Smith', 'Doe', 'all'))).to_str() == 'Smith Doe'
+
+
+def test_names_are_hashable_by_role_and_value():
+    assert hash(Name.first('John')) == hash(FirstName('John'))
+    assert len({Name.first('John'), FirstName('John'), Name.middle('John'), Name.last('John')}) == 3
+
+    names = {Name.first('john'), LastName('Smith', 'Doe')}
+    for name in list(names):
+        name.caps('all')
+        assert name in names
+        name.decaps('all')
+        assert name in names
+    assert Name.first('john') in names
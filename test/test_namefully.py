@@ -1,6 +1,9 @@
+import operator
+import pickle
+
 import pytest
 
-from namefully import FirstName, LastName, Name, NameError, Namefully, NameIndex
+from namefully import FirstName, LastName, Name, NameError, Namefully, NameIndex, Parser
 
 from ._helpers import HashParser, find_name_case
 
@@ -308,6 +311,75 @@ def test_try_parse():
     assert parsed.middle is None
 
 
+def test_try_parse_with_prefix_and_suffix():
+    parsed = Namefully.parse('Dr. John Smith Jr.')
+    assert parsed is not None
+    assert parsed.prefix == 'Dr.'
+    assert parsed.first == 'John'
+    assert parsed.last == 'Smith'
+    assert parsed.suffix == 'Jr.'
+    assert parsed.middle is None
+
+    parsed = Namefully.parse('mr John Ben Carl Smith')
+    assert parsed is not None
+    assert parsed.prefix == 'mr'
+    assert parsed.middle_name() == ['Ben', 'Carl']
+    assert parsed.last == 'Smith'
+
+    parsed = Namefully.parse('Prof. Dr. Jane Doe III, PhD')
+    assert parsed is not None
+    assert parsed.prefix == 'Prof. Dr.'
+    assert parsed.short == 'Jane Doe'
+    assert parsed.suffix == 'III PhD'
+
+    parsed = Namefully.parse('John Smith, Jr.')
+    assert parsed is not None
+    assert parsed.last == 'Smith'
+    assert parsed.suffix == 'Jr.'
+
+    # 2 name parts are left at least, whatever they look like.
+    parsed = Namefully.parse('Dr Smith')
+    assert parsed is not None
+    assert parsed.first == 'Dr'
+    assert parsed.last == 'Smith'
+    assert parsed.prefix is None
+
+
+def test_parse_many_built_parsers():
+    names = ['Dr. Smith John Jr.', 'Mrs Doe Jane Ann', 'Garcia Maria Lopez, PhD']
+    parsed = list(Namefully.parse_many(map(Parser.build, names), ordered_by='last_name', title='us'))
+    assert [name.prefix for name in parsed] == ['Dr.', 'Mrs.', None]
+    assert [name.first for name in parsed] == ['John', 'Jane', 'Maria']
+    assert [name.last for name in parsed] == ['Smith', 'Doe', 'Garcia']
+    assert [name.middle for name in parsed] == [None, 'Ann', 'Lopez']
+    assert [name.suffix for name in parsed] == ['Jr.', None, 'PhD']
+
+
+def test_raw_strings_stay_positional():
+    # Only `Parser.build()` looks for titles and suffixes: raw strings are parsed by position.
+    name = Namefully('Mr John Smith')
+    assert (name.prefix, name.first, name.middle, name.last) == (None, 'Mr', 'John', 'Smith')
+    parsed = list(Namefully.parse_many(['John Smith Jr', 'Mary Ann Md']))
+    assert [(name.last, name.suffix) for name in parsed] == [('Jr', None), ('Md', None)]
+    assert Namefully(Parser.build('John Smith Jr')).suffix == 'Jr'
+
+
+def test_built_parsers_keep_names_looking_like_affixes():
+    options = {'ordered_by': 'last_name'}
+    name = Namefully(Parser.build('Sen Amartya Kumar'), **options)
+    assert (name.prefix, name.last, name.first, name.middle) == (None, 'Sen', 'Amartya', 'Kumar')
+
+    name = Namefully(Parser.build('Nguyen Van Vi'), **options)
+    assert (name.last, name.first, name.middle, name.suffix) == ('Nguyen', 'Van', 'Vi', None)
+
+    # A title is peeled off a surname-first name only if 3 name parts are left.
+    name = Namefully(Parser.build('Dr Smith John'), **options)
+    assert (name.prefix, name.last, name.first, name.middle) == (None, 'Dr', 'Smith', 'John')
+    name = Namefully(Parser.build('Dr Smith John Ben'), **options)
+    assert (name.prefix, name.last, name.first, name.middle) == ('Dr', 'Smith', 'John', 'Ben')
+    assert Namefully(Parser.build('Dr Smith John')).prefix == 'Dr'
+
+
 def test_can_be_built_with_name():
     name = find_name_case('byLastName')
     assert name.to_str() == 'Obama Barack'
@@ -349,3 +421,186 @@ def test_can_be_built_with_name():
         Namefully('Mr John Joe Sm1th', bypass=False)
     with pytest.raises(NameError):
         Namefully('Mr John Joe Smith Ph+', bypass=False)
+
+
+def test_parse_many_shares_options_across_names():
+    raw = ['John Smith', ['Jane', 'Ben', 'Doe'], {'first_name': 'Ali', 'last_name': 'Khan'}, 'Smith John']
+    names = Namefully.parse_many(raw[:3], context='bulk', ordered_by='first_name')
+    assert [n.full for n in names] == ['John Smith', 'Jane Ben Doe', 'Ali Khan']
+
+    names = list(Namefully.parse_many([raw[3], [FirstName('Ben'), LastName('Carl')]], ordered_by='last_name'))
+    assert names[0].first == 'John'
+    assert names[0].last == 'Smith'
+    assert names[1].full == 'Carl Ben'
+    assert all(n.config.ordered_by == 'last_name' for n in names)
+
+
+def test_parse_many_is_lazy_and_raises_on_invalid_names():
+    names = Namefully.parse_many(iter(['John Smith', 'John', 'Jane Doe']))
+    assert next(names).full == 'John Smith'
+    with pytest.raises(NameError):
+        next(names)
+
+
+def test_compile_format_matches_format(generic_name):
+    for pattern in ['short', 'long', 'public', 'official', 'b', 'L, f m', 'f $l.', '$F.$M.$L', '$p', 'o', 'p s']:
+        formatter = Namefully.compile_format(pattern)
+        assert formatter(generic_name) == generic_name.format(pattern)
+    assert Namefully.compile_format('L, f') is Namefully.compile_format('L, f')
+
+    with pytest.raises(NameError):
+        Namefully.compile_format('f #l')
+
+
+def test_derived_names_are_memoized_until_flipped():
+    name = Namefully('Mr John Ben Smith Ph.D')
+    assert name.full is name.full
+    assert name.birth is name.birth
+    assert name.initials() == ['J', 'B', 'S']
+    name.initials().append('X')  # callers get their own copy.
+    assert name.initials() == ['J', 'B', 'S']
+
+    name.flip()
+    assert name.full == 'Mr Smith John Ben Ph.D'
+    assert name.short == 'Smith John'
+    assert name.initials() == ['S', 'J', 'B']
+    assert name.length == len('Smith John Ben')
+
+
+def test_derived_names_follow_edited_parts():
+    name = Namefully('John Ben Smith')
+    assert name.full == 'John Ben Smith'
+    assert name.short == 'John Smith'
+    name.get('first_name').caps('all')
+    assert name.full == 'JOHN Ben Smith'
+    assert name.short == 'JOHN Smith'
+    assert name.sort_key()[3] == 'JOHN'
+    name.get('last_name').decaps('all')
+    assert name.public == 'JOHN s'
+    assert name.full == 'JOHN Ben smith'
+
+
+def test_edits_only_drop_the_memo_of_their_own_name():
+    name, other = Namefully('John Ben Smith'), Namefully('Jane Doe')
+    assert name.full == 'John Ben Smith' and other.full == 'Jane Doe'
+    memo = other._memo
+    name.get('middle_name')[0].caps('all')
+    assert Name('john', type='first_name', caps_range='all')._version == 0  # capitalizing a new name is not an edit.
+    assert name.full == 'John BEN Smith'
+    assert other.full == 'Jane Doe' and other._memo is memo
+
+
+def test_object_model_is_slotted():
+    name = Namefully('Mr John Ben Smith Ph.D')
+    full_name = name._full_name
+    objects = [name, full_name, full_name.config, full_name.first_name, full_name.last_name, full_name.prefix]
+    objects.append(NameIndex.base())
+    for obj in objects:
+        assert not hasattr(obj, '__dict__'), type(obj).__name__
+
+
+def test_lazy_names_are_parsed_on_first_access():
+    name = Namefully('Smith John', ordered_by='last_name', lazy=True)
+    assert name.is_resolved is False
+    assert name.first == 'John'
+    assert name.is_resolved is True
+    assert name.full == 'Smith John'
+
+    invalid = Namefully('John', lazy=True)
+    assert invalid.is_resolved is False
+    with pytest.raises(NameError):
+        invalid.resolve()
+    with pytest.raises(NameError):
+        _ = invalid.first
+
+
+def test_parse_many_can_defer_parsing():
+    names = list(Namefully.parse_many(['John Smith', 'John', 'Jane Doe'], lazy=True, title='us'))
+    assert not any(n.is_resolved for n in names)
+    assert names[2].resolve().full == 'Jane Doe'
+    assert names[2].config.title == 'us'
+    with pytest.raises(NameError):
+        names[1].resolve()
+    assert names[0].is_resolved is False
+
+
+def test_names_are_pickled_compactly():
+    name = Namefully('Mr John Ben Smith Ph.D', context='pickled')
+    copy = pickle.loads(pickle.dumps(name))
+    assert copy == name
+    assert copy.config is name.config
+    assert copy.format('L, f m') == 'SMITH, John Ben'
+
+    lazy = Namefully('Jane Doe', context='pickled_lazy', lazy=True)
+    copy = pickle.loads(pickle.dumps(lazy))
+    assert not copy.is_resolved
+    assert copy.full == 'Jane Doe'
+    assert copy.config is lazy.config
+
+
+def test_names_are_hashable_by_their_parts():
+    name = Namefully('Mr John Ben Smith Ph.D')
+    same = Namefully(['Mr', 'John', 'Ben', 'Smith', 'Ph.D'], ending=True)
+    assert name == same and hash(name) == hash(same)
+    assert Namefully('Smith John', ordered_by='last_name') != Namefully('John Smith')  # other name orders.
+    assert Namefully('John Ben Smith') != Namefully('John Smith Ben')  # same strings, other roles.
+    assert Namefully('John Smith') != 'John Smith'
+
+    names = list(Namefully.parse_many(['John Smith', 'Jane Doe', 'John Smith'], lazy=True))
+    assert len(set(names)) == 2
+    assert {name: 1}[same] == 1
+
+    edited = Namefully('John Smith')
+    names = {edited}
+    edited.get('first_name').caps('all')
+    assert edited in names
+    assert edited != Namefully('John Smith')
+    edited.get('last_name').value = 'Doe'
+    assert hash(edited) == hash(Namefully('JOHN Doe'))
+
+
+def test_names_sort_without_case_nor_accents():
+    raw = ['Zoe Adams', 'élodie Martin', 'Elodie Martin', 'Émile Zola', 'Юрий Гагарин', 'юлия Петрова']
+    raw.append('Elodie Ann Martin')
+    names = [Namefully(name) for name in raw]
+    assert [name.full for name in sorted(names)] == [
+        'Elodie Martin',
+        'élodie Martin',
+        'Elodie Ann Martin',
+        'Émile Zola',
+        'Zoe Adams',
+        'юлия Петрова',
+        'Юрий Гагарин',
+    ]
+    assert names[0].sort_key() == ('zoe', 'adams', '', 'Zoe', 'Adams', '', '', '', 'first_name')
+    assert names[2] < names[1] <= names[1] < names[3]
+    assert names[0] > names[3] >= names[3]
+    with pytest.raises(TypeError):
+        operator.lt(names[0], 'Zoe Adams')
+
+
+def test_sort_key_follows_the_name_order():
+    name = Namefully('Smith John Ben', ordered_by='last_name', context='sort_key')
+    assert name.sort_key() == ('smith', 'john', 'ben', 'Smith', 'John', 'Ben', '', '', 'last_name')
+    name.flip()
+    assert name.sort_key() == ('john', 'smith', 'ben', 'John', 'Smith', 'Ben', '', '', 'first_name')
+
+    raw = ['Smith John', 'Adams Zoe', 'Smith Jane Ann', 'Doe John']
+    names = list(Namefully.parse_many(raw, ordered_by='last_name'))
+    assert sorted(names) == sorted(names, key=lambda name: name.format('L f m'))
+
+
+def test_names_order_the_same_way_they_compare_equal():
+    name, same = Namefully('John Smith'), Namefully(['John', 'Smith'])
+    assert name == same and not name < same and not same < name and name <= same <= name
+    # Same strings in other roles: the name order breaks the tie.
+    flipped = Namefully('John Smith', ordered_by='last_name')
+    assert name != flipped and name < flipped and not flipped <= name
+    flipped.flip()
+    assert name < flipped and flipped == Namefully('Smith John') and hash(flipped) == hash(Namefully('Smith John'))
+
+    mister, plain, doctor = Namefully('Mr John Ben Smith'), Namefully('John Ben Smith'), Namefully('Dr John Ben Smith')
+    assert mister != plain and plain < doctor < mister and not plain >= mister
+    junior = Namefully('Mr John Ben Smith Jr')
+    assert junior != mister and mister < junior
+    assert sorted([junior, mister, plain, doctor]) == [plain, doctor, mister, junior]
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import pytest
+
+import namefully
+
+
+def run(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def test_public_names_are_loaded_on_demand():
+    loaded = "import sys; print(sorted(m for m in sys.modules if m.startswith('namefully')))"
+    assert run(f'import namefully; {loaded}') == "['namefully', 'namefully._version']"
+    assert 'namefully._validators' not in run(f'from namefully import NameIndex; {loaded}')
+    assert run("import sys, namefully; namefully.Namefully('John Smith'); print('asyncio' in sys.modules)") == 'False'
+
+
+def test_public_names_match_their_modules():
+    scope = {}
+    exec('from namefully import *', scope)
+    assert set(namefully.__all__) <= set(scope)
+    assert set(namefully.__all__) <= set(dir(namefully))
+    for name, module in namefully._EXPORTS.items():
+        assert name in sys.modules[f'namefully.{module}'].__all__
+    for module in set(namefully._EXPORTS.values()):
+        assert set(sys.modules[f'namefully.{module}'].__all__) <= set(namefully._EXPORTS)
+
+    with pytest.raises(AttributeError):
+        _ = namefully.unknown
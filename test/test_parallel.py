@@ -0,0 +1,29 @@
+import pytest
+
+from namefully import NameError, format_parallel, parse_parallel
+
+NAMES = ['John Smith', 'Jane Ben Doe', 'Mr Ali Reza Khan', 'Mr Carl Lee Smith Ph.D'] * 50
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parse_parallel_preserves_order(workers):
+    parsed = list(parse_parallel(NAMES, workers=workers, chunksize=7))
+    assert len(parsed) == len(NAMES)
+    assert parsed[:4] == [
+        (None, 'John', (), 'Smith', None),
+        (None, 'Jane', ('Ben',), 'Doe', None),
+        ('Mr', 'Ali', ('Reza',), 'Khan', None),
+        ('Mr', 'Carl', ('Lee',), 'Smith', 'Ph.D'),
+    ]
+    assert parsed == list(parse_parallel(NAMES, workers=1))
+
+
+def test_format_parallel_applies_options_and_pattern():
+    formatted = list(format_parallel(iter(NAMES), 'L, f', workers=2, title='us'))
+    assert formatted[:4] == ['SMITH, John', 'DOE, Jane', 'KHAN, Ali', 'SMITH, Carl']
+    assert list(format_parallel(['Smith John'], 'f', workers=2, ordered_by='last_name')) == ['John']
+
+
+def test_parallel_errors_are_raised_in_parent():
+    with pytest.raises(NameError):
+        list(parse_parallel(['John Smith', 'John'], workers=2))
@@ -0,0 +1,88 @@
+import pytest
+
+from namefully import FirstName, LastName, NameError, Namefully, PhoneticIndex, metaphone, soundex
+
+
+@pytest.mark.parametrize(
+    'name, code',
+    [
+        ('Robert', 'R163'),
+        ('Rupert', 'R163'),
+        ('Rubin', 'R150'),
+        ('Ashcraft', 'A261'),
+        ('Tymczak', 'T522'),
+        ('Pfister', 'P236'),
+        ('Lee', 'L000'),
+        ("O'Brien", 'O165'),
+        ('Müller', 'M460'),
+        ('', ''),
+    ],
+)
+def test_soundex(name, code):
+    assert soundex(name) == code
+
+
+@pytest.mark.parametrize(
+    'name, code',
+    [
+        ('Knight', 'NT'),
+        ('Night', 'NT'),
+        ('Smith', 'SM0'),
+        ('Smyth', 'SM0'),
+        ('Catherine', 'K0RN'),
+        ('Kathryn', 'K0RN'),
+        ('Philip', 'FLP'),
+        ('Phillip', 'FLP'),
+        ('Xavier', 'SFR'),
+        ('Wright', 'RT'),
+        ('Thumb', '0M'),
+        ('Dodge', 'TJ'),
+        ('Shawn', 'XN'),
+        ('Science', 'SNS'),
+        ('Gnome', 'NM'),
+    ],
+)
+def test_metaphone(name, code):
+    assert metaphone(name) == code
+
+
+def test_encoders_accept_name_parts():
+    assert soundex(FirstName('Robert', 'Ben')) == 'R163'
+    assert metaphone(LastName('Smith', 'Doe')) == 'SM0'
+
+
+def test_phonetic_index_finds_candidates_by_first_name_and_surnames():
+    index = PhoneticIndex()
+    assert index.extend(Namefully.parse_many(['John Smith', 'Jane Doe', 'Jon Smyth', 'Mary Smith'])) == range(4)
+    assert len(index) == 4
+    assert index.candidates(Namefully('Johnny Smit')) == [0, 2]
+    assert index.candidates(Namefully('Peter Pan')) == []
+
+    record = index.add(Namefully([FirstName('Maria'), LastName('Garcia', 'Lopez')]))
+    assert record == 4
+    assert index.keys(Namefully([FirstName('Maria'), LastName('Garcia', 'Lopez')])) == ['M600 G620', 'M600 L120']
+    assert index.candidates(Namefully('Marie Lopes')) == [4]
+    assert index.candidates(Namefully([FirstName('Mario'), LastName('Garsia', 'Lopez')])) == [4]
+
+
+def test_phonetic_index_options():
+    index = PhoneticIndex(encoder='metaphone', with_first=False)
+    index.extend(Namefully.parse_many(['John Smith', 'Jane Doe', 'Mary Smyth']))
+    assert index.key_count == 2
+    assert index.candidates(Namefully('Peter Smith')) == [0, 2]
+
+    index = PhoneticIndex(encoder=str.lower, with_first=False)
+    index.extend(Namefully.parse_many(['John Smith', 'Jane SMITH']))
+    assert index.candidates(Namefully('Mary Smith')) == [0, 1]
+
+    with pytest.raises(NameError):
+        PhoneticIndex(encoder='nysiis')
+
+
+def test_phonetic_index_keys_non_latin_names_by_their_value():
+    index = PhoneticIndex()
+    index.extend(Namefully.parse_many(['Анна Каренина', 'Иван Петров', 'Ελένη Παπαδοπούλου', 'Anna Karenina']))
+    assert index.keys(Namefully('Анна Каренина')) == ['анна каренина']
+    assert index.candidates(Namefully('АННА КАРЕНИНА')) == [0]
+    assert index.candidates(Namefully('Ελένη Παπαδοπούλου')) == [2]
+    assert index.candidates(Namefully('Ольга Смирнова')) == []
@@ -0,0 +1,64 @@
+import pytest
+
+from namefully import Name, NameError, Namefully, NamePool
+
+
+def test_pool_shares_repeated_name_parts():
+    pool = NamePool()
+    raw = ['John Ben Smith', 'Jane Ben Smith', ['John', 'Doe'], {'first_name': 'Jane', 'last_name': 'Doe'}]
+    a, b, c, d = Namefully.parse_many(raw, pool=pool)
+
+    assert [n.full for n in (a, b, c, d)] == ['John Ben Smith', 'Jane Ben Smith', 'John Doe', 'Jane Doe']
+    assert a.get('last_name') is b.get('last_name')
+    assert a.get('middle_name')[0] is b.get('middle_name')[0]
+    assert a.get('first_name') is c.get('first_name')
+    assert b.get('first_name') is d.get('first_name')
+    assert c.get('last_name') is d.get('last_name')
+
+    stats = pool.stats()
+    assert stats['size'] == len(pool) == 5
+    assert stats['hits'] == 5
+    assert stats['misses'] == 5
+    assert stats['hit_rate'] == 0.5
+    assert stats['saved_bytes'] > 0
+
+
+def test_pool_shares_the_parts_of_sequences_of_names():
+    pool = NamePool()
+    raw = [[Name.first('John'), Name.last('Smith')], [Name.first('Jane'), Name.last('Smith')]]
+    a, b = Namefully.parse_many(raw, pool=pool)
+    assert a.get('last_name') is b.get('last_name')
+    assert a.full == 'John Smith'
+    assert len(pool) == 3
+
+    c, d = Namefully.parse_many(raw, pool=pool, surname='all')  # parts of another format are not shared.
+    assert c.get('last_name') is not d.get('last_name')
+    assert c.get('first_name') is a.get('first_name')
+
+
+def test_pool_evicts_least_recently_used_parts():
+    pool = NamePool(maxsize=2)
+    first = pool.first('John')
+    pool.last('Smith')
+    assert pool.first('John') is first  # refreshes John
+    pool.last('Doe')  # evicts Smith
+
+    assert len(pool) == 2
+    assert pool.stats()['evictions'] == 1
+    assert pool.first('John') is first
+
+    pool.clear()
+    assert len(pool) == 0
+    assert pool.first('John') is not first
+
+
+def test_pooled_parts_are_read_only():
+    pool = NamePool()
+    name = pool.first('John')
+    assert name == Namefully('John Smith').get('first_name')
+    with pytest.raises(NameError):
+        name.caps('all')
+    with pytest.raises(NameError):
+        name.value = 'Jack'
+    with pytest.raises(ValueError):
+        NamePool(maxsize=0)
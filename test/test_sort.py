@@ -0,0 +1,64 @@
+import os
+import random
+
+import pytest
+
+from namefully import NameError, Namefully, _sort, sort_names
+
+RAW = [
+    'John Smith',
+    'élodie Martin',
+    'Zoe Adams',
+    'Jane Ann Doe',
+    'Émile Zola',
+    'Elodie Martin',
+    'Юрий Гагарин',
+    'adam smith',
+    'Jane Doe',
+    'Carl Lee Smith',
+    'Bob Martin',
+]
+
+
+def expected(by='last_name', **options):
+    return [name.full for name in sorted(Namefully.parse_many(RAW, **options), key=lambda n: n._sort_key(by))]
+
+
+def test_sort_names_in_memory(tmp_path):
+    names = [name.full for name in sort_names(RAW, directory=tmp_path)]
+    assert names == expected()
+    assert names[:4] == ['Zoe Adams', 'Jane Doe', 'Jane Ann Doe', 'Bob Martin']
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize('by', ['last_name', 'first_name', None])
+def test_sort_names_spills_and_merges_runs(tmp_path, monkeypatch, by):
+    monkeypatch.setattr(_sort, '_FAN_IN', 2)  # several merge passes.
+    budget = _sort._NAME_SIZE * 2
+    names = [name.full for name in sort_names(RAW, by=by, budget=budget, directory=tmp_path, ordered_by='last_name')]
+    assert names == expected(by, ordered_by='last_name')
+    assert os.listdir(tmp_path) == []
+
+
+def test_sort_names_keeps_ties_in_order_across_merge_passes(tmp_path, monkeypatch):
+    monkeypatch.setattr(_sort, '_FAN_IN', 2)
+    raw = [f'{prefix} John Ben Smith {suffix}' for prefix in ('Mr', 'Dr') for suffix in ('Jr', 'Sr')] * 100
+    raw += ['John Ben Smith'] * 100
+    random.Random(7).shuffle(raw)
+    names = sort_names(raw, budget=_sort._NAME_SIZE * 50, directory=tmp_path)
+    expected = sorted(Namefully.parse_many(raw), key=lambda name: name._sort_key('last_name'))
+    assert [name.format('p f m l s') for name in names] == [name.format('p f m l s') for name in expected]
+    assert os.listdir(tmp_path) == []
+
+
+def test_sort_names_cleans_up_when_stopped_early(tmp_path):
+    names = sort_names(RAW, budget=_sort._NAME_SIZE * 3, directory=tmp_path)
+    assert next(names).full == 'Zoe Adams'
+    assert len(os.listdir(tmp_path)) == 1
+    names.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_sort_names_rejects_unknown_orders():
+    with pytest.raises(NameError):
+        sort_names(RAW, by='middle_name')
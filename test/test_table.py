@@ -0,0 +1,64 @@
+import pytest
+
+from namefully import FirstName, LastName, Name, NameError, Namefully, NamePool, NameTable
+
+RAW = [
+    'Mr John Ben Smith Ph.D',
+    'Jane Smith',
+    [FirstName('Daniel', 'Michael'), Name.middle('Blake'), Name.middle('Rose'), LastName('Day', 'Lewis')],
+    {'prefix': 'Dr', 'first_name': 'Albert', 'last_name': 'Einstein'},
+]
+
+
+@pytest.fixture
+def table():
+    return NameTable.from_names(RAW, title='us')
+
+
+def test_table_rows_are_equivalent_namefully_views(table):
+    assert len(table) == 4
+    for row, name in zip(table, Namefully.parse_many(RAW, title='us')):
+        assert row.full == name.full
+        assert row.to_dict() == name.to_dict()
+        assert row.initials() == name.initials()
+        assert row.last_name(format='all') == name.last_name(format='all')
+        assert row.config is table.config
+
+    assert table[-1].full == 'Dr. Albert Einstein'
+    assert table[2].first_name() == 'Daniel Michael'
+    assert table[2].middle_name() == ['Blake', 'Rose']
+    with pytest.raises(IndexError):
+        table[4]
+
+
+def test_table_shares_strings_and_scans_columns(table):
+    assert list(table.column('last_name')) == ['Smith', 'Smith', 'Day', 'Einstein']
+    assert list(table.column('prefix')) == ['Mr.', None, None, 'Dr.']
+    assert list(table.column('middle_name')) == ['Ben', None, 'Blake Rose', None]
+    assert list(table.column('mother')) == [None, None, 'Lewis', None]
+    assert table[0].last is table[1].last
+    assert table.nbytes > 0
+
+    with pytest.raises(NameError):
+        table.column('nickname')
+
+
+def test_table_accepts_parsed_and_raw_names():
+    table = NameTable(ordered_by='last_name')
+    table.append(Namefully('Smith John', ordered_by='last_name'))
+    table.extend(['Doe Jane', ['Khan', 'Ali']])
+    assert [row.full for row in table] == ['Smith John', 'Doe Jane', 'Khan Ali']
+    assert list(table.column('first_name')) == ['John', 'Jane', 'Ali']
+
+    with pytest.raises(NameError):
+        table.append(Namefully('John Smith'))  # would be read back in another order.
+    table.append(Namefully('Lee Ann', ordered_by='last_name', context='elsewhere'))
+    assert table[-1].full == 'Lee Ann'
+
+
+def test_table_from_names_with_parsing_options():
+    pool = NamePool()
+    table = NameTable.from_names(['John Smith', 'Jane Smith'], pool=pool, lazy=True, ordered_by='first_name')
+    assert [row.full for row in table] == ['John Smith', 'Jane Smith']
+    assert len(pool) == 3
+    assert table[0].get('last_name') is not table[1].get('last_name')  # rows own their parts.
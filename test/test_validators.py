@@ -0,0 +1,82 @@
+import random
+import re
+import time
+
+import pytest
+
+from namefully import FirstName, LastName, Name, NameIndex
+from namefully._errors import InputError, ValidationError
+from namefully._validators import (
+    SequentialNameValidator,
+    ValidationCode,
+    ValidationResult,
+    ValidationRule,
+    Validators,
+)
+
+# The original (backtracking) rule, kept here to check that the same language is accepted.
+BASE = ValidationRule.base.pattern
+LEGACY_NAMON = re.compile(r'^' + BASE + r'+(([ -]' + BASE + r')?' + BASE + r'*)*$')
+
+
+def test_namon_rule_accepts_the_same_language_as_before():
+    rng = random.Random(7)
+    alphabet = ['a', 'Z', 'é', 'ß', 'Ж', 'ω', ' ', '-', "'", '1', '.', '\n']
+    samples = ['John', 'Day-Lewis', 'De La Cruz', 'Jean-Luc Picard', 'Ж-ω', 'a--b', 'a  b', '-ab', 'ab-', 'ab\n']
+    samples += [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 10))) for _ in range(5000)]
+    for sample in samples:
+        assert bool(ValidationRule.namon.match(sample)) == bool(LEGACY_NAMON.match(sample)), repr(sample)
+        assert bool(ValidationRule.middle_name.match(sample)) == bool(LEGACY_NAMON.match(sample)), repr(sample)
+
+
+def test_namon_rule_rejects_adversarial_inputs_quickly():
+    for attack in ['a' * 50_000 + '1', 'a-' * 25_000 + '-', 'a ' * 25_000]:
+        start = time.perf_counter()
+        assert ValidationRule.namon.match(attack) is None
+        assert time.perf_counter() - start < 0.5
+
+
+def test_check_returns_results_instead_of_raising():
+    assert Validators.first_name.check('Jane')
+    assert Validators.first_name.check(FirstName('Jane', 'Mary')).ok
+
+    result = Validators.first_name.check(FirstName('Jane', 'M4ry'))
+    assert not result
+    assert result.code == ValidationCode.INVALID_CONTENT
+    assert result.field == 'first_name'
+    assert result.source == 'M4ry'
+
+    result = Validators.middle_name.check(['Mary', 'kate;'])
+    assert (result.code, result.field) == (ValidationCode.INVALID_CONTENT, 'middle_name')
+    assert Validators.last_name.check(LastName('Doe', 'Sm1th')).source == 'Sm1th'
+    assert Validators.prefix.check(Name.first('Mr'), 'prefix').code == ValidationCode.WRONG_TYPE
+
+
+def test_check_reports_input_errors():
+    assert Validators.nama.check({}).code == ValidationCode.EMPTY
+    assert Validators.nama.check({'first_name': 'John'}).code == ValidationCode.OUT_OF_RANGE
+    assert Validators.nama.check({'first_name': 'John', 'suffix': 'Jr'}).code == ValidationCode.MISSING_KEYS
+    assert Validators.nama.check({'first_name': 'J4ne', 'last_name': 'Doe'}).field == 'first_name'
+    assert Validators.nama.is_valid({'first_name': 'Jane', 'last_name': 'Doe'})
+
+    validator = SequentialNameValidator()
+    assert validator.check_index(['Jane']).code == ValidationCode.OUT_OF_RANGE
+    assert validator.check_as_name([Name.first('Jane'), Name.middle('Mary')]).code == ValidationCode.MISSING_NAMES
+    result = validator.check_as_str(['Doe', 'J4ne'], NameIndex.when('last_name', 2))
+    assert (result.code, result.field, result.source) == (ValidationCode.INVALID_CONTENT, 'first_name', 'J4ne')
+
+
+def test_results_convert_to_the_errors_raised_by_validate():
+    assert ValidationResult().to_error() is None
+
+    error = Validators.nama.check({'prefix': 'Mr', 'first_name': 'John'}).to_error()
+    assert isinstance(error, InputError)
+    assert error.source == 'Mr John'
+
+    error = Validators.middle_name.check('M4ry').to_error()
+    assert isinstance(error, ValidationError)
+    assert str(error) == "ValidationError (middle_name='M4ry'): invalid content"
+
+    with pytest.raises(ValidationError) as raised:
+        Validators.middle_name.validate('M4ry')
+    assert str(raised.value) == str(error)